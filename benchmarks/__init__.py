@@ -0,0 +1,8 @@
+"""
+Benchmarks de rendimiento de la API.
+
+Cada módulo se ejecuta con `python -m benchmarks.<módulo>` desde la raíz del
+proyecto. Usan la configuración de DJANGO_SETTINGS_MODULE (por defecto
+`config.settings`) pero crean una base de datos de prueba desechable, igual que
+pytest, así que nunca tocan datos reales.
+"""
@@ -0,0 +1,116 @@
+"""
+Costo de la cadena de middleware web en la API y del admin en el arranque.
+
+1. Microsegundos por petición de GET /api/tasks/{id}/ con la cadena completa
+   (sesiones, mensajes, WhiteNoise) y con el perfil de API
+   (API_PROFILE, config.middleware).
+2. Tiempo de arranque de un proceso nuevo (django.setup, URLconf y
+   config.wsgi) y módulos importados, con ADMIN_ENABLED=True y False.
+
+    python -m benchmarks.api_profile --requests 2000 --startups 5
+"""
+
+import argparse
+import logging
+import os
+import subprocess
+import sys
+
+from benchmarks.common import best_of, create_user_with_tasks, setup_django, test_database
+
+STARTUP_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import django
+django.setup()
+from django.urls import get_resolver
+get_resolver().url_patterns
+import config.wsgi
+print(time.perf_counter() - start, len(sys.modules))
+"""
+
+
+def full_middleware(settings):
+    """
+    MIDDLEWARE con los middleware originales en lugar de los de config.middleware.
+    """
+    originals = {lean: original for original, lean in settings.WEB_ONLY_MIDDLEWARE.items()}
+    return [originals.get(path, path) for path in settings.MIDDLEWARE]
+
+
+def lean_middleware(settings):
+    return [settings.WEB_ONLY_MIDDLEWARE.get(path, path) for path in full_middleware(settings)]
+
+
+def startup(admin_enabled, repeat):
+    """
+    Menor tiempo de arranque en `repeat` procesos y módulos cargados.
+    """
+    env = {**os.environ, "ADMIN_ENABLED": str(admin_enabled)}
+    env.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    results = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", STARTUP_SCRIPT], env=env, check=True, capture_output=True, text=True
+        ).stdout.split()
+        results.append((float(output[-2]), int(output[-1])))
+    return min(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000, help="Peticiones por ejecución (por defecto 2000).")
+    parser.add_argument("--repeat", type=int, default=3, help="Repeticiones; se informa la mejor.")
+    parser.add_argument("--startups", type=int, default=5, help="Procesos por variante de arranque (por defecto 5).")
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.conf import settings
+    from django.test import override_settings
+
+    from rest_framework.test import APIClient
+
+    from tasks.models import Task
+    from users.tokens import ClaimsTokenObtainPairSerializer
+
+    cases = {"Cadena completa (antes)": full_middleware(settings), "API_PROFILE (después)": lean_middleware(settings)}
+
+    # El log por petición de config.timing se mediría junto con el middleware.
+    logging.getLogger("config.timing").setLevel(logging.WARNING)
+
+    with test_database(), override_settings(ALLOWED_HOSTS=["*"]):
+        user = create_user_with_tasks("bench", 1)
+        url = f"/api/tasks/{Task.objects.get(user=user).pk}/"
+        token = ClaimsTokenObtainPairSerializer.get_token(user).access_token
+
+        print(f"GET /api/tasks/{{id}}/: {args.requests} peticiones, mejor de {args.repeat} ejecuciones")
+        baseline = None
+        for name, middleware in cases.items():
+            with override_settings(MIDDLEWARE=middleware):
+                # El cliente arma la cadena de middleware al crearse.
+                client = APIClient()
+                client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+                def run():
+                    for _ in range(args.requests):
+                        assert client.get(url).status_code == 200
+
+                seconds = best_of(run, args.repeat)
+            microseconds = seconds / args.requests * 1e6
+            baseline = baseline or microseconds
+            print(f"  {name:<28} {microseconds:>8.1f} µs/petición  ({microseconds - baseline:+.1f} µs)")
+
+    print(f"Arranque (django.setup + URLconf + config.wsgi), mejor de {args.startups} procesos")
+    baseline = None
+    for name, admin_enabled in (("ADMIN_ENABLED=True (antes)", True), ("ADMIN_ENABLED=False (después)", False)):
+        seconds, modules = startup(admin_enabled, args.startups)
+        baseline = baseline or (seconds, modules)
+        print(
+            f"  {name:<30} {seconds * 1000:>8.1f} ms  ({(seconds - baseline[0]) * 1000:+.1f} ms)  "
+            f"{modules} módulos ({modules - baseline[1]:+d})"
+        )
+
+
+if __name__ == "__main__":
+    main()
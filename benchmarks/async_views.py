@@ -0,0 +1,111 @@
+"""
+Peticiones por segundo de /api/tasks/ con clientes concurrentes: TaskViewSet
+por WSGI (un pool de hilos como los workers gthread de gunicorn) frente a
+AsyncTaskViewSet por ASGI (una corrutina por cliente en el mismo bucle).
+
+Ambos lados atraviesan el handler de Django completo (middleware, URLs,
+autenticación y serialización). Conviene ejecutarlo contra PostgreSQL: con
+SQLite la latencia de la base de datos es casi nula y no hay espera que ahorrar.
+
+    python -m benchmarks.async_views --clients 100 250 500 1000 --requests 5
+"""
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
+
+from benchmarks.common import create_user_with_tasks, setup_django, test_database
+
+
+def urlconf(viewset):
+    """
+    URLconf mínima con `viewset` en /api/tasks/, para comparar ambas vistas en el mismo proceso.
+    """
+    from django.urls import include, path
+
+    from rest_framework.routers import DefaultRouter
+
+    router = DefaultRouter()
+    router.register(r"", viewset, basename="task")
+    module = ModuleType(f"benchmarks.urls.{viewset.__name__}")
+    module.urlpatterns = [path("api/tasks/", include(router.urls))]
+    return module
+
+
+def run_wsgi(url, headers, clients, requests, threads):
+    from django.db import connections
+    from django.test import Client
+
+    def client_session():
+        client = Client()
+        try:
+            for _ in range(requests):
+                assert client.get(url, headers=headers).status_code == 200
+        finally:
+            connections.close_all()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=min(threads, clients)) as pool:
+        for future in [pool.submit(client_session) for _ in range(clients)]:
+            future.result()
+    return time.perf_counter() - start
+
+
+def run_asgi(url, headers, clients, requests):
+    from django.test import AsyncClient
+
+    async def client_session():
+        client = AsyncClient()
+        for _ in range(requests):
+            response = await client.get(url, headers=headers)
+            assert response.status_code == 200
+
+    async def main():
+        start = time.perf_counter()
+        await asyncio.gather(*(client_session() for _ in range(clients)))
+        return time.perf_counter() - start
+
+    return asyncio.run(main())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, nargs="+", default=[100, 250, 500, 1000], help="Clientes concurrentes.")
+    parser.add_argument("--requests", type=int, default=5, help="Peticiones por cliente (por defecto 5).")
+    parser.add_argument("--threads", type=int, default=32, help="Hilos del lado WSGI (por defecto 32).")
+    parser.add_argument("--tasks", type=int, default=100, help="Tareas del usuario (por defecto 100).")
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.conf import settings
+    from django.test import override_settings
+
+    from rest_framework_simplejwt.tokens import RefreshToken
+
+    from tasks.async_views import AsyncTaskViewSet
+    from tasks.views import TaskViewSet
+
+    # Sin caché de respuestas, para que cada petición llegue a la base de datos.
+    no_cache = {**settings.TASKS_RESPONSE_CACHE, "ENABLED": False}
+
+    with test_database(), override_settings(ALLOWED_HOSTS=["*"], TASKS_RESPONSE_CACHE=no_cache):
+        user = create_user_with_tasks("bench", args.tasks)
+        headers = {"Authorization": f"Bearer {RefreshToken.for_user(user).access_token}"}
+        url = "/api/tasks/"
+
+        print(f"{args.requests} peticiones por cliente a GET {url}, {args.threads} hilos WSGI")
+        print(f"  {'clientes':>8} {'WSGI req/s':>12} {'ASGI req/s':>12}")
+        for clients in args.clients:
+            total = clients * args.requests
+            with override_settings(ROOT_URLCONF=urlconf(TaskViewSet)):
+                wsgi = total / run_wsgi(url, headers, clients, args.requests, args.threads)
+            with override_settings(ROOT_URLCONF=urlconf(AsyncTaskViewSet)):
+                asgi = total / run_asgi(url, headers, clients, args.requests)
+            print(f"  {clients:>8} {wsgi:>12,.0f} {asgi:>12,.0f}  (x{asgi / wsgi:.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Peticiones por segundo de GET /api/tasks/{id}/ según cómo se resuelve el
+usuario del token: JWTAuthentication (consulta auth_user), CachedJWTAuthentication
+(caché de usuarios) y StatelessJWTAuthentication (solo claims, JWT_STATELESS).
+
+    python -m benchmarks.auth --requests 2000
+"""
+
+import argparse
+
+from benchmarks.common import best_of, create_user_with_tasks, setup_django, test_database
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000, help="Peticiones por ejecución (por defecto 2000).")
+    parser.add_argument("--repeat", type=int, default=3, help="Repeticiones; se informa la mejor.")
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.test import override_settings
+
+    from rest_framework.test import APIClient
+    from rest_framework_simplejwt.authentication import JWTAuthentication
+
+    from tasks.models import Task
+    from tasks.views import TaskViewSet
+    from users.authentication import CachedJWTAuthentication, user_cache
+    from users.tokens import ClaimsTokenObtainPairSerializer
+
+    with test_database(), override_settings(ALLOWED_HOSTS=["*"]):
+        user = create_user_with_tasks("bench", 1)
+        url = f"/api/tasks/{Task.objects.get(user=user).pk}/"
+        token = ClaimsTokenObtainPairSerializer.get_token(user).access_token
+
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        def run():
+            for _ in range(args.requests):
+                assert client.get(url).status_code == 200
+
+        # (clase de autenticación de la vista, JWT_STATELESS)
+        cases = {
+            "JWTAuthentication (antes)": (JWTAuthentication, False),
+            "CachedJWTAuthentication": (CachedJWTAuthentication, False),
+            "StatelessJWTAuthentication (después)": (CachedJWTAuthentication, True),
+        }
+
+        authentication_classes = TaskViewSet.authentication_classes
+        print(f"{args.requests} peticiones, mejor de {args.repeat} ejecuciones")
+        baseline = None
+        try:
+            for name, (authentication_class, stateless) in cases.items():
+                TaskViewSet.authentication_classes = [authentication_class]
+                user_cache.clear()
+                with override_settings(JWT_STATELESS=stateless):
+                    requests_per_second = args.requests / best_of(run, args.repeat)
+                baseline = baseline or requests_per_second
+                print(f"  {name:<38} {requests_per_second:>12,.0f} req/s  (x{requests_per_second / baseline:.1f})")
+        finally:
+            TaskViewSet.authentication_classes = authentication_classes
+
+
+if __name__ == "__main__":
+    main()
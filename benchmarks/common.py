@@ -0,0 +1,79 @@
+"""
+Utilidades compartidas por los benchmarks.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+
+
+def setup_django():
+    """
+    Configura Django para ejecutar un benchmark como script.
+    """
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+    import django
+
+    django.setup()
+
+
+@contextmanager
+def test_database():
+    """
+    Crea las bases de datos de prueba al entrar y las elimina al salir.
+    """
+    from django.test.utils import setup_databases, setup_test_environment, teardown_databases, teardown_test_environment
+
+    setup_test_environment()
+    old_config = setup_databases(verbosity=0, interactive=False)
+    try:
+        yield
+    finally:
+        teardown_databases(old_config, verbosity=0)
+        teardown_test_environment()
+
+
+def create_user_with_tasks(username, tasks, batch_size=2000):
+    """
+    Crea un usuario con `tasks` tareas repartidas entre estados y prioridades.
+    """
+    from django.contrib.auth.models import User
+    from django.utils import timezone
+
+    from tasks.models import Task, TaskCounters
+
+    user = User.objects.create_user(username=username, email=f"{username}@example.com", password="benchpass123")
+    statuses = [choice for choice, _ in Task.STATUS_CHOICES]
+    priorities = [choice for choice, _ in Task.PRIORITY_CHOICES]
+    now = timezone.now()
+
+    Task.objects.bulk_create(
+        (
+            Task(
+                title=f"Tarea {i}",
+                description=f"Descripción de la tarea {i}",
+                status=statuses[i % len(statuses)],
+                priority=priorities[i % len(priorities)],
+                due_date=now + timedelta(days=i % 30) if i % 3 else None,
+                user=user,
+            )
+            for i in range(tasks)
+        ),
+        batch_size=batch_size,
+    )
+    TaskCounters.objects.rebuild(user_ids=[user.pk])
+    return user
+
+
+def best_of(function, repeat):
+    """
+    Ejecuta `function` `repeat` veces y retorna el menor tiempo en segundos.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
@@ -0,0 +1,277 @@
+"""
+Latencia (p50/p99), consultas por petición y memoria pico de cada acción de
+TaskViewSet y de los endpoints de usuarios, sobre datos generados con
+`seed_tasks`. Las peticiones atraviesan el handler de Django completo con la
+configuración real (incluidas las cachés de respuestas y de usuarios).
+
+Los resultados se escriben en JSON para comparar entre commits:
+
+    python -m benchmarks.endpoints --users 10 --tasks 1000 --output antes.json
+    git checkout otra-rama
+    python -m benchmarks.endpoints --users 10 --tasks 1000 --output despues.json --compare antes.json
+
+La latencia se mide sin instrumentación; las consultas y la memoria (tracemalloc)
+se miden aparte, en `--samples` peticiones más.
+"""
+
+import argparse
+import json
+import math
+import platform
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from functools import partial
+from itertools import count
+
+from benchmarks.common import setup_django, test_database
+
+PASSWORDS = ("BenchClave123!", "OtraClave456!")
+
+
+def percentile(values, p):
+    """
+    Percentil `p` por el método del rango más cercano.
+    """
+    ordered = sorted(values)
+    return ordered[max(math.ceil(p / 100 * len(ordered)) - 1, 0)]
+
+
+def consume(response):
+    """
+    Lee el cuerpo completo (export e import responden en streaming) y verifica el estado.
+    """
+    if response.streaming:
+        b"".join(response.streaming_content)
+    if response.status_code >= 400:
+        raise AssertionError(f"{response.status_code}: {getattr(response, 'data', response.content)!r}")
+    return response
+
+
+def build_cases(client, user, password_client, password_user):
+    """
+    Retorna {nombre: prepare}. `prepare(i)` deja listo lo que necesita la petición
+    i (fuera del tiempo medido) y retorna la llamada que la ejecuta.
+    """
+    from rest_framework_simplejwt.tokens import RefreshToken
+
+    from tasks.models import Task
+    from tasks.seeding import DEFAULT_PASSWORD
+
+    ids = list(Task.objects.filter(user=user).order_by("pk").values_list("pk", flat=True))
+
+    def task_id(i):
+        return ids[i % len(ids)]
+
+    def new_tasks(n, i):
+        return [task.pk for task in Task.objects.bulk_create(Task(title=f"Bench {i}.{j}", user=user) for j in range(n))]
+
+    def get(path, params=None):
+        return lambda i: partial(client.get, path, params)
+
+    def task_items(i, n=10):
+        return [{"title": f"Lote {i}.{j}", "priority": "high"} for j in range(n)]
+
+    def ndjson(i, n=10):
+        return "".join(json.dumps({"title": f"Importada {i}.{j}"}) + "\n" for j in range(n))
+
+    # La contraseña vigente solo cambia cuando el cambio se aplicó, así que no
+    # depende de cuántas peticiones se preparen o ejecuten.
+    current_password = PASSWORDS[0]
+
+    def change_password(i):
+        new = PASSWORDS[1] if current_password == PASSWORDS[0] else PASSWORDS[0]
+        data = {"old_password": current_password, "new_password": new, "new_password2": new}
+
+        def call():
+            nonlocal current_password
+            response = password_client.put("/api/users/change-password/", data, format="json")
+            if response.status_code == 200:
+                current_password = new
+            return response
+
+        return call
+
+    def register(i):
+        data = {
+            "username": f"bench-new-{i}",
+            "email": f"bench-new-{i}@example.com",
+            "password": PASSWORDS[0],
+            "password2": PASSWORDS[0],
+            "first_name": "Bench",
+            "last_name": "Nuevo",
+        }
+        return partial(client.post, "/api/users/register/", data, format="json")
+
+    login = {"username": user.username, "password": DEFAULT_PASSWORD}
+
+    return {
+        "tasks.list": get("/api/tasks/"),
+        "tasks.list_filtered": get("/api/tasks/", {"status": "pending", "priority": "high", "ordering": "due_date"}),
+        "tasks.list_search": get("/api/tasks/", {"search": "informe"}),
+        "tasks.list_cursor": get("/api/tasks/", {"pagination": "cursor"}),
+        "tasks.retrieve": lambda i: partial(client.get, f"/api/tasks/{task_id(i)}/"),
+        "tasks.create": lambda i: partial(client.post, "/api/tasks/", {"title": f"Nueva {i}"}, format="json"),
+        "tasks.update": lambda i: partial(
+            client.put, f"/api/tasks/{task_id(i)}/", {"title": f"Editada {i}", "priority": "low"}, format="json"
+        ),
+        "tasks.partial_update": lambda i: partial(
+            client.patch, f"/api/tasks/{task_id(i)}/", {"title": f"P{i}"}, format="json"
+        ),
+        "tasks.destroy": lambda i: partial(client.delete, f"/api/tasks/{new_tasks(1, i)[0]}/"),
+        "tasks.pending": get("/api/tasks/pending/"),
+        "tasks.completed": get("/api/tasks/completed/"),
+        "tasks.complete": lambda i: partial(client.post, f"/api/tasks/{new_tasks(1, i)[0]}/complete/"),
+        "tasks.stats": get("/api/tasks/stats/"),
+        "tasks.changes": get("/api/tasks/changes/"),
+        "tasks.export": get("/api/tasks/export/", {"format": "ndjson"}),
+        "tasks.import": lambda i: partial(client.post, "/api/tasks/import/", ndjson(i), content_type="application/x-ndjson"),
+        "tasks.bulk_create": lambda i: partial(client.post, "/api/tasks/bulk/", task_items(i), format="json"),
+        "tasks.bulk_update": lambda i: partial(
+            client.patch, "/api/tasks/bulk/", [{"id": pk, "priority": "low"} for pk in new_tasks(10, i)], format="json"
+        ),
+        "tasks.bulk_destroy": lambda i: partial(client.delete, "/api/tasks/bulk/", {"ids": new_tasks(10, i)}, format="json"),
+        "users.me": get("/api/users/me/"),
+        "users.profile": get("/api/users/profile/"),
+        "users.profile_update": lambda i: partial(client.patch, "/api/users/profile/", {"first_name": f"B{i}"}, format="json"),
+        "users.register": register,
+        "users.token": lambda i: partial(client.post, "/api/token/", login, format="json"),
+        "users.token_refresh": lambda i: partial(
+            client.post, "/api/token/refresh/", {"refresh": str(RefreshToken.for_user(password_user))}, format="json"
+        ),
+        "users.change_password": change_password,
+    }
+
+
+def measure(prepare, requests, samples, numbers):
+    """
+    Mide una acción: latencias sin instrumentar y, aparte, consultas y memoria pico.
+    """
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    timings = []
+    for _ in range(requests):
+        call = prepare(next(numbers))
+        start = time.perf_counter()
+        consume(call())
+        timings.append(time.perf_counter() - start)
+
+    queries, peak = [], 0
+    tracemalloc.start()
+    try:
+        for _ in range(samples):
+            call = prepare(next(numbers))
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            with CaptureQueriesContext(connection) as context:
+                consume(call())
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - baseline)
+            queries.append(len(context.captured_queries))
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "requests": requests,
+        "p50_ms": round(percentile(timings, 50) * 1000, 3),
+        "p99_ms": round(percentile(timings, 99) * 1000, 3),
+        "mean_ms": round(sum(timings) / len(timings) * 1000, 3),
+        "queries": round(sum(queries) / len(queries), 2) if queries else None,
+        "peak_memory_kib": round(peak / 1024, 1),
+    }
+
+
+def metadata(args):
+    import django
+    from django.db import connection
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        "database": connection.vendor,
+        "users": args.users,
+        "tasks_per_user": args.tasks,
+        "requests": args.requests,
+        "samples": args.samples,
+    }
+
+
+def print_results(results, baseline=None):
+    baseline = (baseline or {}).get("results", {})
+    print(f"  {'endpoint':<24} {'p50 ms':>9} {'p99 ms':>9} {'consultas':>10} {'memoria KiB':>12}")
+    for name, result in results.items():
+        line = f"  {name:<24} {result['p50_ms']:>9.2f} {result['p99_ms']:>9.2f} {result['queries']:>10} {result['peak_memory_kib']:>12.1f}"
+        before = baseline.get(name)
+        if before:
+            line += (
+                f"  p50 {(result['p50_ms'] / before['p50_ms'] - 1) * 100:+.0f}%"
+                f"  p99 {(result['p99_ms'] / before['p99_ms'] - 1) * 100:+.0f}%"
+                f"  consultas {result['queries'] - before['queries']:+g}"
+            )
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=10, help="Usuarios generados (por defecto 10).")
+    parser.add_argument("--tasks", type=int, default=1000, help="Tareas por usuario (por defecto 1000).")
+    parser.add_argument("--requests", type=int, default=50, help="Peticiones medidas por endpoint (por defecto 50).")
+    parser.add_argument("--samples", type=int, default=5, help="Peticiones con consultas y memoria instrumentadas.")
+    parser.add_argument("--only", nargs="+", help="Solo los endpoints cuyo nombre contiene alguno de estos textos.")
+    parser.add_argument("--output", help="Archivo JSON con los resultados.")
+    parser.add_argument("--compare", help="JSON de una ejecución anterior con el que comparar.")
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.contrib.auth.models import User
+    from django.test import override_settings
+
+    from rest_framework.test import APIClient
+    from rest_framework_simplejwt.tokens import RefreshToken
+
+    from tasks.seeding import TaskSeeder
+
+    with test_database(), override_settings(ALLOWED_HOSTS=["*"]):
+        user = TaskSeeder(args.users, args.tasks, prefix="bench", seed=0).run()[0]
+        password_user = User.objects.create_user("bench-password", password=PASSWORDS[0])
+
+        client, password_client = APIClient(), APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(user).access_token}")
+        password_client.force_authenticate(password_user)
+
+        cases = build_cases(client, user, password_client, password_user)
+        if args.only:
+            cases = {name: case for name, case in cases.items() if any(text in name for text in args.only)}
+
+        print(f"{args.users} usuarios x {args.tasks} tareas, {args.requests} peticiones por endpoint")
+        numbers = count()
+        results = {}
+        for name, prepare in cases.items():
+            # Una petición de calentamiento (imports, cachés de URL y de serializers).
+            consume(prepare(next(numbers))())
+            results[name] = measure(prepare, args.requests, args.samples, numbers)
+
+        report = {"meta": metadata(args), "results": results}
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+    print_results(results, baseline)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+        print(f"Resultados en {args.output}")
+
+
+if __name__ == "__main__":
+    main()
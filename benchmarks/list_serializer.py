@@ -0,0 +1,49 @@
+"""
+Filas por segundo del listado de tareas: TaskListSerializer frente al camino
+rápido (values() + JOIN + tablas de choices).
+
+    python -m benchmarks.list_serializer --tasks 10000
+"""
+
+import argparse
+
+from benchmarks.common import best_of, create_user_with_tasks, setup_django, test_database
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=10000, help="Tareas del usuario (por defecto 10000).")
+    parser.add_argument("--repeat", type=int, default=3, help="Repeticiones; se informa la mejor.")
+    args = parser.parse_args()
+
+    setup_django()
+
+    from rest_framework.renderers import JSONRenderer
+
+    from tasks.models import Task
+    from tasks.serializers import TaskListSerializer
+
+    with test_database():
+        user = create_user_with_tasks("bench", args.tasks)
+        queryset = Task.objects.filter(user=user)
+
+        cases = {
+            "TaskListSerializer (antes)": lambda: TaskListSerializer(queryset.all(), many=True).data,
+            "TaskListSerializer + select_related": lambda: TaskListSerializer(queryset.select_related("user"), many=True).data,
+            "Camino rápido (después)": lambda: TaskListSerializer.fast_serialize(TaskListSerializer.fast_values(queryset)),
+        }
+
+        renderer = JSONRenderer()
+        outputs = {renderer.render(case()) for case in cases.values()}
+        assert len(outputs) == 1, "Las salidas no son idénticas"
+
+        print(f"{args.tasks} tareas, mejor de {args.repeat} ejecuciones")
+        baseline = None
+        for name, case in cases.items():
+            rows_per_second = args.tasks / best_of(case, args.repeat)
+            baseline = baseline or rows_per_second
+            print(f"  {name:<38} {rows_per_second:>12,.0f} filas/s  (x{rows_per_second / baseline:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Arranque de un worker: tiempo hasta tener la aplicación WSGI cargada y
+latencia de las primeras peticiones, sin calentar y con config.warmup (lo que
+hace gunicorn.conf.py antes de aceptar tráfico).
+
+Cada muestra es un proceso nuevo que llama a la aplicación WSGI directamente,
+sin cliente de pruebas (que importaría módulos que el servidor no usa). La base
+de datos es un archivo SQLite temporal preparado una sola vez: lo que se mide
+es el costo de Python, no el de la base de datos.
+
+    python -m benchmarks.startup --processes 5
+"""
+
+import argparse
+import io
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+PATHS = ("/api/tasks/", "/api/tasks/{task_id}/", "/api/users/me/")
+
+
+def prepare():
+    """
+    Migra la base temporal y crea el usuario de prueba; imprime el token y el id de una tarea.
+    """
+    from benchmarks.common import create_user_with_tasks, setup_django
+
+    setup_django()
+
+    from django.core.management import call_command
+
+    from tasks.models import Task
+    from users.tokens import ClaimsTokenObtainPairSerializer
+
+    call_command("migrate", verbosity=0)
+    user = create_user_with_tasks("bench", 50)
+    token = str(ClaimsTokenObtainPairSerializer.get_token(user).access_token)
+    print(json.dumps({"token": token, "task_id": Task.objects.filter(user=user).values_list("pk", flat=True)[0]}))
+
+
+def request(application, path, token):
+    environ = {
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": path,
+        "QUERY_STRING": "",
+        "SERVER_NAME": "localhost",
+        "SERVER_PORT": "80",
+        "HTTP_HOST": "localhost",
+        "HTTP_AUTHORIZATION": f"Bearer {token}",
+        "wsgi.input": io.BytesIO(),
+        "wsgi.url_scheme": "http",
+        "wsgi.errors": sys.stderr,
+    }
+    statuses = []
+    start = time.perf_counter()
+    body = application(environ, lambda status, headers, exc_info=None: statuses.append(status))
+    try:
+        b"".join(body)
+    finally:
+        body.close()
+    elapsed = time.perf_counter() - start
+    if not statuses[0].startswith("200"):
+        raise AssertionError(f"{path}: {statuses[0]}")
+    return elapsed
+
+
+def child(warm, token, task_id):
+    """
+    Un proceso nuevo: carga, calentamiento opcional y dos rondas de peticiones.
+    """
+    start = time.perf_counter()
+    from config.wsgi import application
+
+    result = {"load": time.perf_counter() - start, "warm_up": 0.0}
+    if warm:
+        from config.warmup import warm_up
+
+        result["warm_up"] = sum(warm_up().values())
+    paths = [path.format(task_id=task_id) for path in PATHS]
+    result["first"] = {path: request(application, path, token) for path in paths}
+    result["second"] = {path: request(application, path, token) for path in paths}
+    print(json.dumps(result))
+
+
+def run(args, env):
+    return subprocess.run(
+        [sys.executable, "-m", "benchmarks.startup", *args], env=env, check=True, capture_output=True, text=True
+    ).stdout
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--processes", type=int, default=5, help="Procesos por variante; se informa la mediana.")
+    parser.add_argument("--child", choices=("cold", "warm"), help=argparse.SUPPRESS)
+    parser.add_argument("--prepare", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--token", help=argparse.SUPPRESS)
+    parser.add_argument("--task-id", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.prepare:
+        return prepare()
+    if args.child:
+        return child(args.child == "warm", args.token, args.task_id)
+
+    with tempfile.TemporaryDirectory() as directory:
+        env = {
+            **os.environ,
+            "DJANGO_SETTINGS_MODULE": "config.settings",
+            "DB_ENGINE": "sqlite",
+            "DB_NAME": os.path.join(directory, "startup.sqlite3"),
+            "ALLOWED_HOSTS": "localhost",
+            "REQUEST_TIMING_LOG_LEVEL": "WARNING",
+        }
+        data = json.loads(run(["--prepare"], env))
+        identity = ["--token", data["token"], "--task-id", str(data["task_id"])]
+
+        print(f"Mediana de {args.processes} procesos por variante (ms)")
+        for variant in ("cold", "warm"):
+            samples = [json.loads(run(["--child", variant, *identity], env)) for _ in range(args.processes)]
+            load = statistics.median(sample["load"] for sample in samples) * 1000
+            warm_up = statistics.median(sample["warm_up"] for sample in samples) * 1000
+            print(f"  {'Sin calentar (antes)' if variant == 'cold' else 'config.warmup (después)'}")
+            print(f"    {'carga de config.wsgi':<28} {load:>8.1f}")
+            print(f"    {'calentamiento':<28} {warm_up:>8.1f}")
+            for path in samples[0]["first"]:
+                first = statistics.median(sample["first"][path] for sample in samples) * 1000
+                second = statistics.median(sample["second"][path] for sample in samples) * 1000
+                print(f"    1.ª petición {path:<15} {first:>8.1f}  (2.ª: {second:.1f})")
+
+
+if __name__ == "__main__":
+    main()
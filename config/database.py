@@ -0,0 +1,22 @@
+"""
+Métricas de las conexiones a la base de datos.
+"""
+
+from django.db import connections
+
+
+def pool_stats():
+    """
+    Retorna las métricas de cada alias de DATABASES. Con pool (psycopg_pool) se
+    incluyen el tamaño, las conexiones disponibles, las peticiones en espera y
+    el tiempo de espera acumulado (`requests_wait_ms`), entre otras.
+    """
+    stats = {}
+    for alias in connections:
+        connection = connections[alias]
+        pool = getattr(connection, "pool", None)
+        if pool is None:
+            stats[alias] = {"pooled": False, "conn_max_age": connection.settings_dict["CONN_MAX_AGE"]}
+        else:
+            stats[alias] = {"pooled": True, **pool.get_stats()}
+    return stats
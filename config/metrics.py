@@ -0,0 +1,138 @@
+"""
+Métricas en formato Prometheus (GET /metrics).
+
+RequestTimingMiddleware registra cada petición con `observe_request`: latencia,
+consultas y tiempo de base de datos y tamaño de la respuesta, por ruta (la
+vista y la acción que la atendió, p. ej. "TaskViewSet.list"). También mantiene
+el número de peticiones en curso. La caché de usuarios autenticados cuenta sus
+aciertos, fallos, entradas obsoletas e invalidaciones en
+`auth_user_cache_events_total`.
+
+Con varios workers de gunicorn cada proceso escribe sus valores en archivos
+mapeados en memoria dentro de PROMETHEUS_MULTIPROC_DIR (modo multiproceso de
+prometheus_client), y /metrics los suma al responder. La variable debe apuntar
+a un directorio vacío antes de arrancar los workers; gunicorn.conf.py la define
+solo para gunicorn, vacía el directorio y marca los procesos que terminan. Si
+el directorio no existe se crea al importar este módulo. Sin la variable, las
+métricas son las del proceso.
+
+Sin METRICS["TOKEN"], /metrics solo responde a las IP de METRICS["INTERNAL_IPS"].
+
+Las series con etiquetas se guardan en `_children` la primera vez, así que
+registrar una petición son cinco operaciones sobre valores ya resueltos.
+"""
+
+import os
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from django.utils.crypto import constant_time_compare
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55)
+DB_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+    # prometheus_client escribe ahí al crear cada serie; sin el directorio, cada petición fallaría.
+    os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+
+REQUEST_LABELS = ("route", "method", "status")
+
+request_latency = Histogram(
+    "http_request_duration_seconds", "Latencia de las peticiones.", REQUEST_LABELS, buckets=LATENCY_BUCKETS
+)
+request_queries = Histogram("http_request_db_queries", "Consultas por petición.", REQUEST_LABELS, buckets=QUERY_BUCKETS)
+request_db_time = Histogram(
+    "http_request_db_duration_seconds", "Tiempo en la base de datos por petición.", REQUEST_LABELS, buckets=DB_BUCKETS
+)
+response_size = Histogram(
+    "http_response_size_bytes", "Tamaño del cuerpo de las respuestas (sin streaming).", REQUEST_LABELS, buckets=SIZE_BUCKETS
+)
+requests_in_progress = Gauge("http_requests_in_progress", "Peticiones en curso.", ["method"], multiprocess_mode="livesum")
+auth_cache_events = Counter(
+    "auth_user_cache_events", "Eventos de la caché de usuarios autenticados (hits, misses, stale, invalidations).", ["event"]
+)
+
+_children = {}
+
+
+def enabled():
+    return settings.METRICS["ENABLED"]
+
+
+def in_progress(method):
+    """
+    Gauge de peticiones en curso para `method` (usar con `with`).
+    """
+    key = ("in_progress", method)
+    child = _children.get(key)
+    if child is None:
+        child = _children[key] = requests_in_progress.labels(method).track_inprogress()
+    return child
+
+
+def observe_request(route, method, status, duration, queries, db_time, size):
+    """
+    Registra una petición terminada. `size` es None en las respuestas en streaming.
+    """
+    key = (route, method, status)
+    children = _children.get(key)
+    if children is None:
+        labels = (route, method, str(status))
+        children = _children[key] = (
+            request_latency.labels(*labels),
+            request_queries.labels(*labels),
+            request_db_time.labels(*labels),
+            response_size.labels(*labels),
+        )
+    latency, query_count, db, body = children
+    latency.observe(duration)
+    query_count.observe(queries)
+    db.observe(db_time)
+    if size is not None:
+        body.observe(size)
+
+
+def count_auth_cache(event):
+    child = _children.get(("auth", event))
+    if child is None:
+        child = _children[("auth", event)] = auth_cache_events.labels(event)
+    child.inc()
+
+
+def registry():
+    """
+    Registro a exportar: en modo multiproceso, la suma de los archivos de todos los workers.
+    """
+    if not os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        return REGISTRY
+    collector_registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(collector_registry)
+    return collector_registry
+
+
+def metrics_view(request):
+    """
+    GET /metrics
+    Métricas en el formato de texto de Prometheus. Con METRICS["TOKEN"] se exige
+    `Authorization: Bearer <token>`; sin token, la IP debe estar en METRICS["INTERNAL_IPS"].
+    """
+    token = settings.METRICS["TOKEN"]
+    if token:
+        if not constant_time_compare(request.headers.get("Authorization", ""), f"Bearer {token}"):
+            return HttpResponseForbidden()
+    elif request.META.get("REMOTE_ADDR") not in settings.METRICS["INTERNAL_IPS"]:
+        return HttpResponseForbidden()
+    return HttpResponse(generate_latest(registry()), content_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,126 @@
+"""
+Middleware del perfil de API (API_PROFILE).
+
+Cada clase de este módulo es una subclase del middleware de Django (o de
+WhiteNoise) del mismo nombre que no hace nada en las rutas de la API: pasa la
+petición a la siguiente capa y sus `process_view`, `process_exception` y
+`process_template_response` retornan None. En el resto de rutas se comporta
+igual que la original; al ser subclases, los checks del admin las reconocen.
+
+CsrfViewMiddleware y XFrameOptionsMiddleware no se reemplazan: los checks de
+`check --deploy` (security.W003 y security.W002) buscan sus rutas literales en
+MIDDLEWARE. En la API cuestan poco: las vistas de DRF son csrf_exempt, y
+clickjacking solo agrega un encabezado.
+
+Una ruta es de la API si empieza por algún prefijo de API_PROFILE_PATHS y por
+ninguno de API_PROFILE_EXCLUDE. El resultado se guarda en la petición, así que
+se calcula una sola vez aunque haya varios de estos middleware.
+
+Con ASGI funcionan en modo async: en las rutas de la API pasan la petición sin
+cambiar de hilo, también en los hooks. WhiteNoise 6 es solo síncrono, así que
+su subclase implementa además el modo async.
+"""
+
+from types import MethodType
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+
+HOOKS = ("process_view", "process_exception", "process_template_response")
+# Django llama a process_exception siempre en modo síncrono.
+ASYNC_HOOKS = ("process_view", "process_template_response")
+
+
+def is_api_request(request):
+    try:
+        return request._is_api_request
+    except AttributeError:
+        path = request.path_info
+        request._is_api_request = path.startswith(tuple(settings.API_PROFILE_PATHS)) and not path.startswith(
+            tuple(settings.API_PROFILE_EXCLUDE)
+        )
+        return request._is_api_request
+
+
+def _skip_for_api(method):
+    def hook(self, request, *args):
+        if is_api_request(request):
+            return None
+        return method(self, request, *args)
+
+    return hook
+
+
+def _askip_for_api(method):
+    async def hook(self, request, *args):
+        if is_api_request(request):
+            return None
+        return await sync_to_async(method, thread_sensitive=True)(self, request, *args)
+
+    return hook
+
+
+def web_only(middleware_path):
+    """
+    Subclase de `middleware_path` que se omite en las rutas de la API.
+    """
+    base = import_string(middleware_path)
+
+    def __init__(self, get_response, *args, **kwargs):
+        base.__init__(self, get_response, *args, **kwargs)
+        if iscoroutinefunction(get_response):
+            if not iscoroutinefunction(self):
+                markcoroutinefunction(self)
+            # Hooks async: Django no pasa a un hilo para llamarlos en las rutas de la API.
+            for name in ASYNC_HOOKS:
+                if hasattr(base, name):
+                    setattr(self, name, MethodType(_askip_for_api(getattr(base, name)), self))
+
+    def __call__(self, request):
+        # En modo async get_response y el __call__ de la base retornan corrutinas.
+        if is_api_request(request):
+            return self.get_response(request)
+        return base.__call__(self, request)
+
+    attrs = {
+        "__init__": __init__,
+        "__call__": __call__,
+        "__module__": __name__,
+        "__doc__": f"{base.__name__} salvo en las rutas de la API.",
+    }
+    for name in HOOKS:
+        if hasattr(base, name):
+            attrs[name] = _skip_for_api(getattr(base, name))
+    return type(base.__name__, (base,), attrs)
+
+
+SessionMiddleware = web_only("django.contrib.sessions.middleware.SessionMiddleware")
+AuthenticationMiddleware = web_only("django.contrib.auth.middleware.AuthenticationMiddleware")
+MessageMiddleware = web_only("django.contrib.messages.middleware.MessageMiddleware")
+
+
+class WhiteNoiseMiddleware(web_only("whitenoise.middleware.WhiteNoiseMiddleware")):
+    """
+    WhiteNoiseMiddleware salvo en las rutas de la API, también en modo async.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if not is_api_request(request):
+            if self.autorefresh:
+                static_file = await sync_to_async(self.find_file)(request.path_info)
+            else:
+                static_file = self.files.get(request.path_info)
+            if static_file is not None:
+                # Abre el archivo: fuera del bucle de eventos.
+                return await sync_to_async(self.serve)(static_file, request)
+        return await self.get_response(request)
@@ -0,0 +1,266 @@
+"""
+Perfiles de peticiones en producción, bajo demanda.
+
+RequestProfilingMiddleware perfila una petición cuando trae el encabezado
+PROFILING["HEADER"] con un token firmado vigente (`manage.py request_profiles
+token`) o cuando la elige el muestreo (PROFILING["SAMPLE_RATE"]). Sin ninguna
+de las dos cosas, el costo es leer un encabezado.
+
+El perfil es estadístico y de reloj de pared: un hilo toma la pila del hilo de
+la petición cada PROFILING["INTERVAL"] segundos (también mientras espera a la
+base de datos) y cuenta las pilas en formato "collapsed" (`a;b;c`), el que usan
+flamegraph.pl y speedscope. Además se guardan las consultas SQL con su
+duración. Con ASGI se muestrean el hilo del bucle de eventos y los hilos en
+que se ejecutan las consultas de la petición (los de sync_to_async); lo que
+corre en esos hilos antes de su primera consulta no aparece en el perfil.
+
+Cada perfil es un archivo JSON en PROFILING["DIR"]; al superar
+PROFILING["MAX_PROFILES"] se borran los más antiguos. La respuesta lleva el id
+en el encabezado X-Profile-Id; si el perfil no se puede escribir (disco lleno,
+sin permisos) se registra el error y la respuesta sale sin el encabezado.
+"""
+
+import json
+import logging
+import os
+import random
+import secrets
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+
+from django.conf import settings
+from django.core import signing
+from django.utils.deprecation import MiddlewareMixin
+
+from asgiref.sync import sync_to_async
+
+from .timing import install_query_wrappers, observe_queries
+
+logger = logging.getLogger(__name__)
+
+SIGNING_SALT = "config.profiling"
+MAX_QUERIES = 1000
+MAX_SQL_LENGTH = 2000
+
+
+def make_token():
+    """
+    Token para el encabezado de perfilado; vale PROFILING["TOKEN_MAX_AGE"] segundos.
+    """
+    return signing.dumps("profile", salt=SIGNING_SALT)
+
+
+def valid_token(token):
+    try:
+        return signing.loads(token, salt=SIGNING_SALT, max_age=settings.PROFILING["TOKEN_MAX_AGE"]) == "profile"
+    except signing.BadSignature:
+        return False
+
+
+class StackSampler(threading.Thread):
+    """
+    Cuenta las pilas del hilo `thread_id` (y de los que se agreguen a `threads`)
+    cada `interval` segundos hasta `stop()`.
+    """
+
+    def __init__(self, thread_id, interval):
+        super().__init__(name="request-profiler", daemon=True)
+        self.threads = {thread_id}
+        self.interval = interval
+        self.stacks = Counter()
+        self.samples = 0
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            frames = sys._current_frames()
+            for thread_id in tuple(self.threads):
+                frame = frames.get(thread_id)
+                if frame is not None:
+                    self.stacks[self.collapse(frame)] += 1
+                    self.samples += 1
+
+    def stop(self):
+        self._stopped.set()
+        self.join()
+
+    @staticmethod
+    def collapse(frame):
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            names.append(f"{frame.f_globals.get('__name__', '?')}.{code.co_qualname}:{frame.f_lineno}")
+            frame = frame.f_back
+        return ";".join(reversed(names))
+
+
+class QueryRecorder:
+    """
+    Wrapper de ejecución (`observe_queries`) que guarda cada consulta con su duración.
+    Si recibe `threads`, agrega a ese conjunto el hilo de cada consulta.
+    """
+
+    def __init__(self, threads=None):
+        self.queries = []
+        self.threads = threads
+
+    def __call__(self, execute, sql, params, many, context):
+        if self.threads is not None:
+            self.threads.add(threading.get_ident())
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            if len(self.queries) < MAX_QUERIES:
+                duration = round((time.perf_counter() - start) * 1000, 3)
+                self.queries.append({"alias": context["connection"].alias, "sql": sql[:MAX_SQL_LENGTH], "ms": duration})
+
+
+class ProfileStore:
+    """
+    Buffer circular de perfiles en disco: un archivo JSON por perfil.
+    """
+
+    def __init__(self, directory=None, max_profiles=None):
+        self.directory = Path(directory or settings.PROFILING["DIR"])
+        self.max_profiles = max_profiles or settings.PROFILING["MAX_PROFILES"]
+
+    def save(self, profile):
+        """
+        Guarda `profile`, descarta los más antiguos y retorna el id asignado.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        profile_id = f"{datetime.now(timezone.utc):%Y%m%dT%H%M%S%f}-{secrets.token_hex(3)}"
+        path = self.directory / f"{profile_id}.json"
+        # Escribe y renombra: otro worker nunca lee un archivo a medias.
+        temporary = path.with_suffix(".tmp")
+        temporary.write_text(json.dumps({"id": profile_id, **profile}))
+        os.replace(temporary, path)
+
+        for old in self.paths()[self.max_profiles :]:
+            old.unlink(missing_ok=True)
+        return profile_id
+
+    def paths(self):
+        """
+        Archivos de perfiles, del más reciente al más antiguo.
+        """
+        if not self.directory.is_dir():
+            return []
+        return sorted(self.directory.glob("*.json"), reverse=True)
+
+    def list(self):
+        profiles = []
+        for path in self.paths():
+            try:
+                profiles.append(json.loads(path.read_text()))
+            except (OSError, ValueError):
+                # Borrado por otro worker entre el listado y la lectura.
+                continue
+        return profiles
+
+    def load(self, profile_id):
+        path = self.directory / f"{Path(profile_id).name}.json"
+        try:
+            return json.loads(path.read_text())
+        except FileNotFoundError:
+            return None
+
+
+class RequestRecording:
+    """
+    Pilas y consultas de una petición mientras dura el bloque `with`.
+    """
+
+    def __init__(self, follow_query_threads=False):
+        self.sampler = StackSampler(threading.get_ident(), settings.PROFILING["INTERVAL"])
+        self.recorder = QueryRecorder(self.sampler.threads if follow_query_threads else None)
+        self._queries = observe_queries(self.recorder)
+
+    def __enter__(self):
+        self.started_at = datetime.now(timezone.utc)
+        self._start = time.perf_counter()
+        self.sampler.start()
+        self._queries.__enter__()
+        return self
+
+    def __exit__(self, *exc_info):
+        try:
+            self._queries.__exit__(*exc_info)
+        finally:
+            self.sampler.stop()
+            self.duration = time.perf_counter() - self._start
+
+
+class RequestProfilingMiddleware(MiddlewareMixin):
+    """
+    Perfila las peticiones con el encabezado firmado o elegidas por muestreo.
+    """
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        trigger = self.trigger(request)
+        if trigger is None:
+            return self.get_response(request)
+
+        install_query_wrappers()
+        with RequestRecording() as recording:
+            response = self.get_response(request)
+        return self.save(request, response, trigger, recording)
+
+    async def __acall__(self, request):
+        trigger = self.trigger(request)
+        if trigger is None:
+            return await self.get_response(request)
+
+        with RequestRecording(follow_query_threads=True) as recording:
+            response = await self.get_response(request)
+        # Escribe en disco y puede evaluar request.user: fuera del bucle de eventos.
+        return await sync_to_async(self.save)(request, response, trigger, recording)
+
+    @staticmethod
+    def save(request, response, trigger, recording):
+        user = getattr(request, "user", None)
+        store = ProfileStore()
+        profile = {
+            "trigger": trigger,
+            "method": request.method,
+            "path": request.path,
+            "query_string": request.META.get("QUERY_STRING", ""),
+            "user_id": user.pk if user is not None and user.is_authenticated else None,
+            "status": response.status_code,
+            "started_at": recording.started_at.isoformat(),
+            "duration_ms": round(recording.duration * 1000, 2),
+            "interval_ms": settings.PROFILING["INTERVAL"] * 1000,
+            "samples": recording.sampler.samples,
+            "stacks": dict(recording.sampler.stacks.most_common()),
+            "queries": recording.recorder.queries,
+        }
+        try:
+            profile_id = store.save(profile)
+        except OSError:
+            # Perfilar nunca hace fallar la petición.
+            logger.warning(
+                "No se pudo guardar el perfil de %s %s en %s.", request.method, request.path, store.directory, exc_info=True
+            )
+            return response
+        response["X-Profile-Id"] = profile_id
+        return response
+
+    @staticmethod
+    def trigger(request):
+        """
+        Retorna "header", "sample" o None si la petición no se perfila.
+        """
+        options = settings.PROFILING
+        token = request.META.get("HTTP_" + options["HEADER"].upper().replace("-", "_"))
+        if token is not None and valid_token(token):
+            return "header"
+        if options["SAMPLE_RATE"] and random.random() < options["SAMPLE_RATE"]:
+            return "sample"
+        return None
@@ -0,0 +1,173 @@
+"""
+Enrutamiento de lecturas a réplicas (DATABASE_REPLICAS) con lectura de las
+propias escrituras.
+
+ReplicaRoutingMiddleware marca cada petición: con un método seguro (GET, HEAD,
+OPTIONS) las lecturas van a una réplica, elegida al azar una vez por petición
+para que todas sus consultas (p. ej. la agregación de la ETag y las filas)
+vean la misma copia; con cualquier otro, todo va al primario. Las escrituras
+siempre van al primario, y desde la primera escritura de la petición también
+las lecturas.
+
+Una réplica puede ir algunos segundos por detrás. Por eso, tras una petición
+que escribió, el usuario queda fijado al primario durante
+DB_PRIMARY_PIN_SECONDS (una clave en la caché "default"), y así no ve sus
+tareas desactualizadas justo después de crear o completar una. Con varios
+workers esa caché debe ser compartida (Redis o Memcached); el check tasks.W002
+avisa si hay réplicas y la caché es LocMemCache.
+
+Fuera de una petición (comandos, tests sin middleware) todo va al primario,
+igual que las consultas de un StreamingHttpResponse, que se ejecutan después de
+que el middleware retornó; la vista debe llamar a `use_primary()` para fijar al
+usuario y, si escribe durante el stream, `pin_user()` al terminar para que la
+fijación cuente desde la última escritura.
+
+Con ASGI el estado vive en una ContextVar, que sync_to_async copia a los hilos
+donde corren las vistas síncronas y el ORM.
+"""
+
+import random
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.deprecation import MiddlewareMixin
+
+from asgiref.sync import sync_to_async
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+_routing_state = ContextVar("db_routing_state", default=None)
+
+
+def pin_key(user_id):
+    return f"db:primary-pin:{user_id}"
+
+
+def pin_user(user_id):
+    """
+    Fija al usuario al primario durante DB_PRIMARY_PIN_SECONDS desde ahora.
+    """
+    if settings.DB_PRIMARY_PIN_SECONDS:
+        cache.set(pin_key(user_id), True, timeout=settings.DB_PRIMARY_PIN_SECONDS)
+
+
+def use_primary():
+    """
+    Trata la petición en curso como una escritura: sus lecturas van al primario y
+    al terminar el usuario queda fijado. Para las vistas que escriben después de
+    retornar (StreamingHttpResponse), cuando este middleware ya terminó.
+    """
+    state = _routing_state.get()
+    if state is not None:
+        state.wrote = True
+
+
+class RoutingState:
+    """
+    Decisión de enrutamiento de una petición.
+    """
+
+    def __init__(self, request):
+        self.request = request
+        self.primary = request.method not in SAFE_METHODS
+        self.wrote = False
+        self.pinned = None
+        self.replica = None
+        self._resolving = False
+
+    def uses_primary(self):
+        return self.primary or self.wrote or self.is_pinned()
+
+    def read_alias(self):
+        """
+        Alias de lectura de la petición: el primario o la réplica elegida en la
+        primera lectura.
+        """
+        if not settings.DATABASE_REPLICAS or self.uses_primary():
+            return DEFAULT_DB_ALIAS
+        if self.replica is None:
+            self.replica = random.choice(settings.DATABASE_REPLICAS)
+        return self.replica
+
+    def is_pinned(self):
+        """
+        Consulta la fijación del usuario una vez autenticado. Antes (p. ej. al
+        buscar el usuario del token) la lectura puede ir a una réplica.
+        """
+        if self.pinned is None and not self._resolving:
+            # Evaluar request.user puede leer la sesión, que vuelve a pasar por el router.
+            self._resolving = True
+            try:
+                user = getattr(self.request, "user", None)
+                if user is not None and user.is_authenticated:
+                    self.pinned = bool(cache.get(pin_key(user.pk)))
+            finally:
+                self._resolving = False
+        return bool(self.pinned)
+
+    def user_id(self):
+        user = getattr(self.request, "user", None)
+        return user.pk if user is not None and user.is_authenticated else None
+
+
+class ReplicaRouter:
+    """
+    Router de lecturas a réplicas y escrituras al primario.
+    """
+
+    def db_for_read(self, model, **hints):
+        state = _routing_state.get()
+        if state is None:
+            return DEFAULT_DB_ALIAS
+        return state.read_alias()
+
+    def db_for_write(self, model, **hints):
+        state = _routing_state.get()
+        if state is not None:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Las réplicas son copias del primario.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
+
+
+class ReplicaRoutingMiddleware(MiddlewareMixin):
+    """
+    Activa ReplicaRouter durante la petición y fija al usuario al primario si escribió.
+    """
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        state = RoutingState(request)
+        token = _routing_state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            _routing_state.reset(token)
+
+        user_id = state.user_id() if state.wrote else None
+        if user_id is not None:
+            pin_user(user_id)
+        return response
+
+    async def __acall__(self, request):
+        state = RoutingState(request)
+        token = _routing_state.set(state)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _routing_state.reset(token)
+
+        if state.wrote and settings.DB_PRIMARY_PIN_SECONDS:
+            # request.user puede ser el usuario diferido de la sesión, que consulta la base de datos.
+            user_id = await sync_to_async(state.user_id)()
+            if user_id is not None:
+                await cache.aset(pin_key(user_id), True, timeout=settings.DB_PRIMARY_PIN_SECONDS)
+        return response
@@ -0,0 +1,249 @@
+"""
+Esquema OpenAPI precalculado.
+
+SpectacularAPIView recorre todas las vistas y serializers en cada petición, y
+Swagger UI y Redoc lo piden cada vez que se abren. CachedSpectacularAPIView
+genera cada variante (formato, idioma y versión de la API) una sola vez y la
+sirve desde memoria, con ETag, gzip y Cache-Control.
+
+Las variantes también se guardan en SCHEMA_CACHE["DIR"], en un subdirectorio
+por versión del código (`code_version`): un hash de los archivos .py del
+proyecto, de las versiones de las dependencias que intervienen y de los
+settings que cambian las URLs o el esquema. Otro código nunca lee un esquema
+generado por una versión anterior. `manage.py build_schema` las genera al
+construir la imagen; si no existen, se generan con la primera petición.
+
+Swagger UI y Redoc piden el esquema con `?v=<versión>`; esa URL no cambia
+mientras no cambie el código y se cachea un año (immutable). Sin `v`, el
+navegador revalida con la ETag tras SCHEMA_CACHE["MAX_AGE"] segundos.
+"""
+
+import gzip
+import hashlib
+import os
+import shutil
+import threading
+from dataclasses import dataclass
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils import translation
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import quote_etag
+from django.utils.regex_helper import _lazy_re_compile
+
+from drf_spectacular.plumbing import set_query_parameters
+from drf_spectacular.settings import patched_settings
+from drf_spectacular.utils import extend_schema
+from drf_spectacular.views import SCHEMA_KWARGS, SpectacularAPIView, SpectacularRedocView, SpectacularSwaggerView
+from rest_framework.settings import api_settings
+
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+PACKAGES = ("django", "djangorestframework", "drf-spectacular", "djangorestframework-simplejwt", "django-filter")
+# Settings que cambian las URLs, las vistas registradas o el esquema generado.
+SCHEMA_SETTINGS = (
+    "ROOT_URLCONF",
+    "INSTALLED_APPS",
+    "REST_FRAMEWORK",
+    "SPECTACULAR_SETTINGS",
+    "LANGUAGE_CODE",
+    "ADMIN_ENABLED",
+    "TASKS_ASYNC_VIEWS",
+)
+
+accepts_gzip = _lazy_re_compile(r"\bgzip\b")
+
+_version = None
+
+
+def source_files():
+    """
+    Archivos .py del proyecto (apps instaladas bajo BASE_DIR y config), sin los tests.
+    """
+    base_dir = Path(settings.BASE_DIR).resolve()
+    roots = {Path(__file__).resolve().parent}
+    roots.update(Path(app_config.path).resolve() for app_config in apps.get_app_configs())
+    files = set()
+    for root in roots:
+        if root.is_relative_to(base_dir):
+            files.update(path for path in root.rglob("*.py") if "tests" not in path.relative_to(base_dir).parts)
+    return sorted(files)
+
+
+def code_version():
+    """
+    Hash del código, las dependencias y los settings que determinan el esquema.
+    """
+    global _version
+    if _version is None:
+        digest = hashlib.sha256()
+        base_dir = Path(settings.BASE_DIR).resolve()
+        for path in source_files():
+            digest.update(str(path.relative_to(base_dir)).encode())
+            digest.update(path.read_bytes())
+        for package in PACKAGES:
+            try:
+                digest.update(f"{package}=={version(package)}".encode())
+            except PackageNotFoundError:
+                digest.update(package.encode())
+        for name in SCHEMA_SETTINGS:
+            digest.update(f"{name}={getattr(settings, name, None)!r}".encode())
+        _version = digest.hexdigest()[:20]
+    return _version
+
+
+@dataclass(frozen=True)
+class SchemaVariant:
+    content: bytes
+    compressed: bytes
+    content_type: str
+    etag: str
+
+
+class SchemaCache:
+    """
+    Variantes del esquema en memoria, respaldadas por archivos en SCHEMA_CACHE["DIR"].
+    """
+
+    def __init__(self):
+        self._variants = {}
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self):
+        return Path(settings.SCHEMA_CACHE["DIR"]) / code_version()
+
+    def get(self, renderer_class, lang=None, api_version=None):
+        key = (renderer_class, lang, api_version)
+        variant = self._variants.get(key)
+        if variant is None:
+            with self._lock:
+                variant = self._variants.get(key)
+                if variant is None:
+                    variant = self._variants[key] = self._load(renderer_class, lang, api_version)
+        return variant
+
+    def clear(self):
+        with self._lock:
+            self._variants.clear()
+
+    def _load(self, renderer_class, lang, api_version):
+        path = self.directory / f"{renderer_class.__name__}-{lang or '_'}-{api_version or '_'}.{renderer_class.format}"
+        try:
+            content = path.read_bytes()
+        except OSError:
+            content = render_schema(renderer_class, lang, api_version)
+            self._save(path, content)
+        renderer = renderer_class()
+        content_type = f"{renderer.media_type}; charset={renderer.charset}" if renderer.charset else renderer.media_type
+        etag = hashlib.sha256(content).hexdigest()[:32]
+        return SchemaVariant(content, gzip.compress(content, mtime=0), content_type, etag)
+
+    def _save(self, path, content):
+        # Escribe y renombra: otro worker nunca lee un archivo a medias. Sin
+        # permisos de escritura el esquema queda solo en memoria.
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            temporary.write_bytes(content)
+            os.replace(temporary, path)
+        except OSError:
+            pass
+
+    def prune(self):
+        """
+        Borra los esquemas de otras versiones del código; retorna cuántas.
+        """
+        root = Path(settings.SCHEMA_CACHE["DIR"])
+        stale = [path for path in root.iterdir() if path.is_dir() and path.name != code_version()] if root.is_dir() else []
+        for path in stale:
+            shutil.rmtree(path, ignore_errors=True)
+        return len(stale)
+
+
+schema_cache = SchemaCache()
+
+
+def render_schema(renderer_class, lang=None, api_version=None, view_class=SpectacularAPIView):
+    """
+    Genera el esquema como `manage.py spectacular` (sin petición, público) y lo renderiza.
+    """
+    with patched_settings(view_class.custom_settings), translation.override(lang or settings.LANGUAGE_CODE):
+        generator = view_class.generator_class(
+            urlconf=view_class.urlconf, api_version=api_version, patterns=view_class.patterns
+        )
+        data = generator.get_schema(request=None, public=True)
+    renderer = renderer_class()
+    return renderer.render(data, renderer.media_type, {})
+
+
+def build(languages=(None,)):
+    """
+    Genera (o carga) las variantes de cada formato servido por /api/schema/; retorna cuántas.
+    """
+    for renderer_class in CachedSpectacularAPIView.renderer_classes:
+        for lang in languages:
+            schema_cache.get(renderer_class, lang)
+    return len(CachedSpectacularAPIView.renderer_classes) * len(languages)
+
+
+class CachedSpectacularAPIView(SpectacularAPIView):
+    """
+    SpectacularAPIView servida desde `schema_cache`.
+    """
+
+    @extend_schema(**SCHEMA_KWARGS)
+    def get(self, request, *args, **kwargs):
+        lang = (request.GET.get("lang") or None) if settings.USE_I18N else None
+        api_version = self.api_version or request.version or self._get_version_parameter(request)
+        cacheable = (
+            settings.SCHEMA_CACHE["ENABLED"]
+            and not isinstance(self.urlconf, (list, tuple))
+            and (lang is None or lang in dict(settings.LANGUAGES))
+            # Sin ALLOWED_VERSIONS cualquier valor es válido: no se guarda una variante por valor.
+            and (api_version is None or api_version in (api_settings.ALLOWED_VERSIONS or ()))
+        )
+        if not cacheable:
+            return super().get(request, *args, **kwargs)
+
+        renderer_class = type(request.accepted_renderer)
+        variant = schema_cache.get(renderer_class, lang, api_version)
+        compressed = bool(accepts_gzip.search(request.META.get("HTTP_ACCEPT_ENCODING", "")))
+        etag = quote_etag(f"{variant.etag}-gzip" if compressed else variant.etag)
+
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = HttpResponse(variant.compressed if compressed else variant.content, content_type=variant.content_type)
+            if compressed:
+                response["Content-Encoding"] = "gzip"
+            response["Content-Disposition"] = f'inline; filename="{self._get_filename(request, api_version)}"'
+        response["ETag"] = etag
+        patch_vary_headers(response, ("Accept", "Accept-Encoding"))
+        if request.GET.get("v") == code_version():
+            patch_cache_control(response, public=True, max_age=IMMUTABLE_MAX_AGE, immutable=True)
+        else:
+            patch_cache_control(response, public=True, max_age=settings.SCHEMA_CACHE["MAX_AGE"])
+        return response
+
+
+class VersionedSchemaURLMixin:
+    """
+    Pide el esquema con `?v=<versión del código>` para que el navegador lo guarde sin revalidar.
+    """
+
+    def _get_schema_url(self, request):
+        url = super()._get_schema_url(request)
+        if not settings.SCHEMA_CACHE["ENABLED"]:
+            return url
+        return set_query_parameters(url, v=code_version())
+
+
+class CachedSpectacularSwaggerView(VersionedSchemaURLMixin, SpectacularSwaggerView):
+    pass
+
+
+class CachedSpectacularRedocView(VersionedSchemaURLMixin, SpectacularRedocView):
+    pass
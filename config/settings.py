@@ -10,6 +10,8 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/6.0/ref/settings/
 """
 
+import tempfile
+from copy import deepcopy
 from datetime import timedelta
 from pathlib import Path
 
@@ -52,6 +54,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "config.timing.RequestTimingMiddleware",
+    "config.profiling.RequestProfilingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
@@ -59,10 +63,32 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "config.routers.ReplicaRoutingMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+# Perfil de API: la API se autentica solo con JWT, así que en API_PROFILE_PATHS
+# (salvo API_PROFILE_EXCLUDE, la documentación) se omiten sesiones, mensajes y
+# WhiteNoise. /admin/ y la documentación siguen con la cadena completa
+# (config.middleware). CSRF y clickjacking quedan con las clases de Django para
+# que los checks de `check --deploy` los encuentren.
+API_PROFILE = config("API_PROFILE", default=True, cast=bool)
+API_PROFILE_PATHS = ["/api/", "/metrics"]
+API_PROFILE_EXCLUDE = ["/api/schema/"]
+WEB_ONLY_MIDDLEWARE = {
+    "django.contrib.sessions.middleware.SessionMiddleware": "config.middleware.SessionMiddleware",
+    "whitenoise.middleware.WhiteNoiseMiddleware": "config.middleware.WhiteNoiseMiddleware",
+    "django.contrib.auth.middleware.AuthenticationMiddleware": "config.middleware.AuthenticationMiddleware",
+    "django.contrib.messages.middleware.MessageMiddleware": "config.middleware.MessageMiddleware",
+}
+if API_PROFILE:
+    MIDDLEWARE = [WEB_ONLY_MIDDLEWARE.get(path, path) for path in MIDDLEWARE]
+
+# Sin el admin (ADMIN_ENABLED=False) no se cargan admin ni messages: para los
+# procesos que solo sirven la API cuando el admin se despliega aparte.
+ADMIN_ENABLED = config("ADMIN_ENABLED", default=True, cast=bool)
+
 ROOT_URLCONF = "config.urls"
 
 TEMPLATES = [
@@ -81,22 +107,70 @@ TEMPLATES = [
     },
 ]
 
+if not ADMIN_ENABLED:
+    INSTALLED_APPS = [app for app in INSTALLED_APPS if app not in ("django.contrib.admin", "django.contrib.messages")]
+    MIDDLEWARE = [path for path in MIDDLEWARE if not path.endswith(".MessageMiddleware")]
+    TEMPLATES[0]["OPTIONS"]["context_processors"].remove("django.contrib.messages.context_processors.messages")
+
 WSGI_APPLICATION = "config.wsgi.application"
 
 
 # Database
 # https://docs.djangoproject.com/en/6.0/ref/settings/#databases
 
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.postgresql",
-        "NAME": config("DB_NAME", default="taskmanager"),
-        "USER": config("DB_USER", default="postgres"),
-        "PASSWORD": config("DB_PASSWORD", default="postgres"),
-        "HOST": config("DB_HOST", default="localhost"),
-        "PORT": config("DB_PORT", default="5432"),
+# DB_ENGINE=sqlite usa un archivo SQLite local en lugar de PostgreSQL (tests y
+# desarrollo sin servidor; las funciones propias de PostgreSQL se omiten).
+DB_ENGINE = config("DB_ENGINE", default="postgresql")
+
+# Pool de conexiones de psycopg 3 (solo PostgreSQL). Sin pool, DB_CONN_MAX_AGE
+# mantiene abierta la conexión de cada hilo entre peticiones.
+DB_POOL = config("DB_POOL", default=True, cast=bool)
+
+if DB_ENGINE == "sqlite":
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": BASE_DIR / config("DB_NAME", default="db.sqlite3"),
+        }
     }
-}
+else:
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": config("DB_NAME", default="taskmanager"),
+            "USER": config("DB_USER", default="postgres"),
+            "PASSWORD": config("DB_PASSWORD", default="postgres"),
+            "HOST": config("DB_HOST", default="localhost"),
+            "PORT": config("DB_PORT", default="5432"),
+            # El pool no admite conexiones persistentes: cada petición devuelve la suya al pool.
+            "CONN_MAX_AGE": 0 if DB_POOL else config("DB_CONN_MAX_AGE", default=60, cast=int),
+            "CONN_HEALTH_CHECKS": config("DB_CONN_HEALTH_CHECKS", default=True, cast=bool),
+            "OPTIONS": {},
+        }
+    }
+    if DB_POOL:
+        from psycopg_pool import ConnectionPool
+
+        DATABASES["default"]["OPTIONS"]["pool"] = {
+            "min_size": config("DB_POOL_MIN_SIZE", default=2, cast=int),
+            "max_size": config("DB_POOL_MAX_SIZE", default=10, cast=int),
+            # Segundos de espera por una conexión libre antes de fallar.
+            "timeout": config("DB_POOL_TIMEOUT", default=10, cast=float),
+            "max_idle": config("DB_POOL_MAX_IDLE", default=600, cast=float),
+            # Verifica cada conexión al entregarla (un SELECT 1) y descarta las caídas.
+            "check": ConnectionPool.check_connection if config("DB_POOL_CHECK", default=True, cast=bool) else None,
+        }
+
+# Réplicas de lectura: un alias "replica_N" por cada host de DB_REPLICA_HOSTS, con
+# las mismas credenciales que el primario. En tests apuntan a la base del primario
+# (TEST MIRROR); con SQLite usan el mismo archivo, sin replicación real.
+for number, host in enumerate(config("DB_REPLICA_HOSTS", default="", cast=Csv()), start=1):
+    DATABASES[f"replica_{number}"] = {**deepcopy(DATABASES["default"]), "HOST": host, "TEST": {"MIRROR": "default"}}
+
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias != "default"]
+DATABASE_ROUTERS = ["config.routers.ReplicaRouter"]
+# Segundos que un usuario lee del primario después de escribir (lectura de sus propias escrituras).
+DB_PRIMARY_PIN_SECONDS = config("DB_PRIMARY_PIN_SECONDS", default=10, cast=int)
 
 
 # Password validation
@@ -117,6 +191,57 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Verificación de contraseñas en el pool acotado de users.hashing.
+AUTHENTICATION_BACKENDS = ["users.backends.HashingPoolModelBackend"]
+
+# Pool de hash de contraseñas (login, registro y cambio de contraseña). Con
+# MAX_WORKERS + QUEUE_SIZE operaciones en curso se responde 503 con Retry-After.
+PASSWORD_HASHING = {
+    "ENABLED": config("PASSWORD_HASHING_POOL_ENABLED", default=True, cast=bool),
+    "MAX_WORKERS": config("PASSWORD_HASHING_MAX_WORKERS", default=2, cast=int),
+    "QUEUE_SIZE": config("PASSWORD_HASHING_QUEUE_SIZE", default=8, cast=int),
+    "RETRY_AFTER": config("PASSWORD_HASHING_RETRY_AFTER", default=1, cast=int),
+}
+
+# Tiempos por petición: una línea JSON por petición en el logger "config.timing",
+# presupuestos de consultas (query_budget) de las vistas y, con HEADER (por defecto
+# solo en DEBUG), el encabezado Server-Timing para los clientes.
+# Con ENFORCE_BUDGETS, superar un presupuesto lanza una excepción (tests).
+REQUEST_TIMING = {
+    "ENABLED": config("REQUEST_TIMING_ENABLED", default=True, cast=bool),
+    "HEADER": config("REQUEST_TIMING_HEADER", default=DEBUG, cast=bool),
+    "ENFORCE_BUDGETS": config("REQUEST_TIMING_ENFORCE_BUDGETS", default=False, cast=bool),
+}
+
+# Métricas de Prometheus en /metrics (config.metrics). Con METRICS_TOKEN, el
+# scraper debe enviar "Authorization: Bearer <token>"; sin token, solo responde a
+# las IP de METRICS_INTERNAL_IPS.
+METRICS = {
+    "ENABLED": config("METRICS_ENABLED", default=True, cast=bool),
+    "TOKEN": config("METRICS_TOKEN", default=""),
+    "INTERNAL_IPS": config("METRICS_INTERNAL_IPS", default="127.0.0.1,::1", cast=Csv()),
+}
+
+# Perfiles de peticiones bajo demanda (config.profiling): con el encabezado
+# X-Profile y un token de `manage.py request_profiles token`, o por muestreo.
+PROFILING = {
+    "HEADER": "X-Profile",
+    "SAMPLE_RATE": config("PROFILING_SAMPLE_RATE", default=0.0, cast=float),
+    "INTERVAL": config("PROFILING_INTERVAL", default=0.005, cast=float),
+    "DIR": config("PROFILING_DIR", default=str(Path(tempfile.gettempdir()) / "taskmanager-profiles")),
+    "MAX_PROFILES": config("PROFILING_MAX_PROFILES", default=200, cast=int),
+    "TOKEN_MAX_AGE": config("PROFILING_TOKEN_MAX_AGE", default=3600, cast=int),
+}
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {"console": {"class": "logging.StreamHandler"}},
+    "loggers": {
+        "config.timing": {"handlers": ["console"], "level": config("REQUEST_TIMING_LOG_LEVEL", default="INFO")},
+    },
+}
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/6.0/topics/i18n/
@@ -149,7 +274,7 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 # REST Framework configuration
 REST_FRAMEWORK = {
-    "DEFAULT_AUTHENTICATION_CLASSES": ("rest_framework_simplejwt.authentication.JWTAuthentication",),
+    "DEFAULT_AUTHENTICATION_CLASSES": ("users.authentication.CachedJWTAuthentication",),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
@@ -157,6 +282,58 @@ REST_FRAMEWORK = {
 }
 
 
+# Tasks API
+# Máximo de elementos por petición en /api/tasks/bulk/
+TASKS_BULK_MAX_ITEMS = config("TASKS_BULK_MAX_ITEMS", default=1000, cast=int)
+# Filas por lectura del cursor (y por bloque escrito) en /api/tasks/export/
+TASKS_EXPORT_CHUNK_SIZE = config("TASKS_EXPORT_CHUNK_SIZE", default=2000, cast=int)
+# Filas validadas y escritas por transacción en /api/tasks/import/ e import_tasks
+TASKS_IMPORT_CHUNK_SIZE = config("TASKS_IMPORT_CHUNK_SIZE", default=1000, cast=int)
+# Sincronización incremental (/api/tasks/changes/)
+TASKS_SYNC_PAGE_SIZE = config("TASKS_SYNC_PAGE_SIZE", default=500, cast=int)
+TASKS_SYNC_OVERLAP_SECONDS = config("TASKS_SYNC_OVERLAP_SECONDS", default=10, cast=int)
+TASKS_TOMBSTONE_RETENTION_DAYS = config("TASKS_TOMBSTONE_RETENTION_DAYS", default=30, cast=int)
+# ?search= también por subcadena (como SearchFilter); recorre todas las tareas del usuario.
+TASKS_SEARCH_SUBSTRING = config("TASKS_SEARCH_SUBSTRING", default=False, cast=bool)
+# Vistas async de /api/tasks/ (tasks.async_views); activar solo con un servidor ASGI.
+TASKS_ASYNC_VIEWS = config("TASKS_ASYNC_VIEWS", default=False, cast=bool)
+
+# Backend de la caché "default". Con LocMemCache cada worker tiene su propia copia,
+# así que las cachés que se invalidan entre procesos quedan desactivadas por defecto.
+CACHE_BACKEND = config("CACHE_BACKEND", default="django.core.cache.backends.locmem.LocMemCache")
+CACHE_SHARED = CACHE_BACKEND != "django.core.cache.backends.locmem.LocMemCache"
+
+# Caché de respuestas de lectura (list, pending, completed). La generación de cada
+# usuario se guarda en SHARED_CACHE, que debe ser compartida entre procesos
+# (Redis o Memcached) cuando hay más de un worker.
+TASKS_RESPONSE_CACHE = {
+    "ENABLED": config("TASKS_RESPONSE_CACHE_ENABLED", default=CACHE_SHARED, cast=bool),
+    "MAX_ENTRIES": config("TASKS_RESPONSE_CACHE_MAX_ENTRIES", default=2048, cast=int),
+    "TIMEOUT": config("TASKS_RESPONSE_CACHE_TIMEOUT", default=300, cast=int),
+    "SHARED_CACHE": config("TASKS_RESPONSE_CACHE_ALIAS", default="default"),
+}
+
+
+# Caché de usuarios autenticados (users.authentication.CachedJWTAuthentication).
+# Las versiones de cada usuario viven en SHARED_CACHE para invalidar en todos los workers;
+# como la de respuestas, solo se activa por defecto con una caché compartida.
+USER_CACHE = {
+    "ENABLED": config("USER_CACHE_ENABLED", default=CACHE_SHARED, cast=bool),
+    "MAX_ENTRIES": config("USER_CACHE_MAX_ENTRIES", default=10000, cast=int),
+    "TIMEOUT": config("USER_CACHE_TIMEOUT", default=300, cast=int),
+    "SHARED_CACHE": config("USER_CACHE_ALIAS", default="default"),
+}
+
+
+# Cache
+CACHES = {
+    "default": {
+        "BACKEND": CACHE_BACKEND,
+        "LOCATION": config("CACHE_LOCATION", default=""),
+    }
+}
+
+
 # JWT Configuration
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=config("JWT_ACCESS_TOKEN_LIFETIME", default=60, cast=int)),
@@ -171,8 +348,13 @@ SIMPLE_JWT = {
     "AUTH_HEADER_NAME": "HTTP_AUTHORIZATION",
     "USER_ID_FIELD": "id",
     "USER_ID_CLAIM": "user_id",
+    "TOKEN_OBTAIN_SERIALIZER": "users.tokens.ClaimsTokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "users.tokens.ClaimsTokenRefreshSerializer",
 }
 
+# Autoriza las peticiones a /api/tasks/ solo con los claims del token, sin consultar auth_user.
+JWT_STATELESS = config("JWT_STATELESS", default=False, cast=bool)
+
 # CORS Configuration
 CORS_ALLOWED_ORIGINS = config(
     "CORS_ALLOWED_ORIGINS",
@@ -190,3 +372,12 @@ SPECTACULAR_SETTINGS = {
     "SERVE_INCLUDE_SCHEMA": False,
     "COMPONENT_SPLIT_REQUEST": True,
 }
+
+# Esquema OpenAPI precalculado (config.schema): un subdirectorio de DIR por
+# versión del código; `manage.py build_schema` lo genera al construir la imagen.
+# MAX_AGE es el Cache-Control de /api/schema/ sin el parámetro de versión.
+SCHEMA_CACHE = {
+    "ENABLED": config("SCHEMA_CACHE_ENABLED", default=True, cast=bool),
+    "DIR": str(BASE_DIR / config("SCHEMA_CACHE_DIR", default=".schema-cache")),
+    "MAX_AGE": config("SCHEMA_CACHE_MAX_AGE", default=300, cast=int),
+}
@@ -0,0 +1,286 @@
+"""
+Tiempos por petición (encabezado Server-Timing y una línea de log JSON) y
+presupuesto de consultas por vista.
+
+RequestTimingMiddleware mide el tiempo total, el número de consultas y el
+tiempo en la base de datos (todas las conexiones) y el tiempo de los
+serializers (los `span("serializer")` de la petición). Los spans anidados del
+mismo nombre solo cuentan una vez, así que medir `to_representation` de un
+serializer con otros anidados no duplica el tiempo. La línea de log JSON por
+petición se escribe en nivel INFO; el encabezado Server-Timing expone tiempos de
+base de datos a los clientes, así que es opcional (REQUEST_TIMING["HEADER"]).
+
+Las vistas declaran su presupuesto con el atributo `query_budget`: un entero, o
+un dict por acción del ViewSet (o por método HTTP en las vistas de clase). Las
+vistas de función usan el decorador `@query_budget(n)` sobre `@api_view`. Si
+una petición supera el presupuesto se registra una advertencia; con
+REQUEST_TIMING["ENFORCE_BUDGETS"] (activo en los tests) se lanza
+QueryBudgetExceeded.
+
+Las mismas mediciones alimentan las métricas de Prometheus (config.metrics).
+
+El middleware funciona en modo síncrono y asíncrono (ASGI). Con ASGI el código
+síncrono de la petición (vistas síncronas, el ORM) corre en hilos de
+sync_to_async, cuyas conexiones no son las del bucle de eventos; por eso las
+consultas se observan con `observe_queries`, ligado al contexto de la petición
+y no a las conexiones de un hilo.
+"""
+
+import json
+import logging
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from functools import partial, wraps
+
+from django.conf import settings
+from django.core.signals import request_started
+from django.db import connections
+from django.utils.deprecation import MiddlewareMixin
+
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+_timings = ContextVar("request_timings", default=None)
+_query_wrappers = ContextVar("query_wrappers", default=())
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+class RequestTimings:
+    """
+    Métricas acumuladas de una petición.
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.db = 0.0
+        self.spans = {}
+        self._open = set()
+
+    def __call__(self, execute, sql, params, many, context):
+        """
+        Wrapper de ejecución (`observe_queries`) que cuenta y cronometra cada consulta.
+        """
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db += time.perf_counter() - start
+            self.queries += 1
+
+
+def _execute_with_wrappers(execute, sql, params, many, context):
+    for wrapper in reversed(_query_wrappers.get()):
+        execute = partial(wrapper, execute)
+    return execute(sql, params, many, context)
+
+
+def install_query_wrappers(**kwargs):
+    """
+    Agrega `_execute_with_wrappers` a las conexiones del hilo actual (una sola vez).
+    Es receptor de request_started, que con ASGI se ejecuta en el hilo de
+    sync_to_async de la petición.
+    """
+    for alias in connections:
+        wrappers = connections[alias].execute_wrappers
+        if _execute_with_wrappers not in wrappers:
+            wrappers.append(_execute_with_wrappers)
+
+
+request_started.connect(install_query_wrappers, dispatch_uid="config.timing.install_query_wrappers")
+
+
+@contextmanager
+def observe_queries(wrapper):
+    """
+    Como `connection.execute_wrapper(wrapper)` en todas las conexiones, pero
+    ligado al contexto: también ve las consultas que la petición hace desde
+    otros hilos con sync_to_async.
+    """
+    token = _query_wrappers.set((*_query_wrappers.get(), wrapper))
+    try:
+        yield
+    finally:
+        _query_wrappers.reset(token)
+
+
+@contextmanager
+def span(name):
+    """
+    Suma el tiempo del bloque a la métrica `name` de la petición en curso.
+    """
+    timings = _timings.get()
+    if timings is None or name in timings._open:
+        yield
+        return
+    timings._open.add(name)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings._open.discard(name)
+        timings.spans[name] = timings.spans.get(name, 0.0) + time.perf_counter() - start
+
+
+def timed(name):
+    """
+    Decorador equivalente a `span(name)` alrededor de la función.
+    """
+
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class TimedSerializerMixin:
+    """
+    Mide `to_representation` como tiempo de serializer.
+    """
+
+    def to_representation(self, instance):
+        with span("serializer"):
+            return super().to_representation(instance)
+
+
+def query_budget(limit):
+    """
+    Presupuesto de consultas de una vista de función decorada con `@api_view`.
+    """
+
+    def decorator(view):
+        view.cls.query_budget = limit
+        return view
+
+    return decorator
+
+
+def view_action(view_func, request):
+    """
+    Retorna (clase de la vista, acción del ViewSet o método HTTP en minúsculas).
+    """
+    method = request.method.lower()
+    actions = getattr(view_func, "actions", None) or {}
+    return getattr(view_func, "cls", None), actions.get(method, method)
+
+
+def view_budget(view_func, request):
+    """
+    Presupuesto de consultas declarado por la vista que atiende `request`, o None.
+    """
+    cls, action = view_action(view_func, request)
+    budget = getattr(cls, "query_budget", None)
+    if isinstance(budget, dict):
+        budget = budget.get(action)
+    return budget
+
+
+class RequestTimingMiddleware(MiddlewareMixin):
+    """
+    Mide cada petición y agrega el encabezado Server-Timing.
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        if self.async_mode:
+            self.process_view = self.aprocess_view
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        record_metrics = metrics.enabled()
+        if not (settings.REQUEST_TIMING["ENABLED"] or record_metrics):
+            return self.get_response(request)
+
+        install_query_wrappers()
+        timings = RequestTimings()
+        start = time.perf_counter()
+        with self.measure(request, timings, record_metrics):
+            response = self.get_response(request)
+        return self.finish(request, response, timings, time.perf_counter() - start, record_metrics)
+
+    async def __acall__(self, request):
+        record_metrics = metrics.enabled()
+        if not (settings.REQUEST_TIMING["ENABLED"] or record_metrics):
+            return await self.get_response(request)
+
+        timings = RequestTimings()
+        start = time.perf_counter()
+        with self.measure(request, timings, record_metrics):
+            response = await self.get_response(request)
+        return self.finish(request, response, timings, time.perf_counter() - start, record_metrics)
+
+    @contextmanager
+    def measure(self, request, timings, record_metrics):
+        token = _timings.set(timings)
+        try:
+            with ExitStack() as stack:
+                if record_metrics:
+                    stack.enter_context(metrics.in_progress(request.method))
+                stack.enter_context(observe_queries(timings))
+                yield
+        finally:
+            _timings.reset(token)
+
+    def finish(self, request, response, timings, total, record_metrics):
+        options = settings.REQUEST_TIMING
+        if record_metrics:
+            size = None if response.streaming else len(response.content)
+            route = getattr(request, "timing_view", "unmatched")
+            metrics.observe_request(route, request.method, response.status_code, total, timings.queries, timings.db, size)
+        if not options["ENABLED"]:
+            return response
+
+        values = {
+            "total_ms": round(total * 1000, 2),
+            "db_ms": round(timings.db * 1000, 2),
+            "queries": timings.queries,
+            **{f"{name}_ms": round(value * 1000, 2) for name, value in timings.spans.items()},
+        }
+        if options["HEADER"]:
+            response["Server-Timing"] = self.server_timing(values)
+        self.log(request, response, values)
+
+        budget = getattr(request, "query_budget", None)
+        if budget is not None and timings.queries > budget:
+            message = f"{request.method} {request.path}: {timings.queries} consultas, presupuesto {budget}."
+            if options["ENFORCE_BUDGETS"]:
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        cls, action = view_action(view_func, request)
+        request.timing_view = f"{cls.__name__}.{action}" if cls is not None else view_func.__name__
+        request.query_budget = view_budget(view_func, request)
+
+    async def aprocess_view(self, request, view_func, view_args, view_kwargs):
+        # En modo async, para que Django no pase a un hilo solo para anotar la petición.
+        RequestTimingMiddleware.process_view(self, request, view_func, view_args, view_kwargs)
+
+    @staticmethod
+    def server_timing(values):
+        entries = [f'db;dur={values["db_ms"]};desc="{values["queries"]} consultas"']
+        entries += [f"{name[:-3]};dur={value}" for name, value in values.items() if name.endswith("_ms") and name != "db_ms"]
+        return ", ".join(entries)
+
+    @staticmethod
+    def log(request, response, values):
+        # Se desactiva con REQUEST_TIMING_LOG_LEVEL=WARNING.
+        if logger.isEnabledFor(logging.INFO):
+            line = {"method": request.method, "path": request.path, "status": response.status_code, **values}
+            if hasattr(request, "timing_view"):
+                line["view"] = request.timing_view
+            budget = getattr(request, "query_budget", None)
+            if budget is not None:
+                line["query_budget"] = budget
+            logger.info(json.dumps(line))
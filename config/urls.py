@@ -15,31 +15,40 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 
-from django.contrib import admin
+from django.conf import settings
 from django.urls import include, path
 
-from drf_spectacular.views import SpectacularAPIView, SpectacularRedocView, SpectacularSwaggerView
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
+from .metrics import metrics_view
+from .schema import CachedSpectacularAPIView, CachedSpectacularRedocView, CachedSpectacularSwaggerView
+from .views import database_pool_stats
+
 urlpatterns = [
-    # Admin
-    path("admin/", admin.site.urls),
     # JWT Authentication
     path("api/token/", TokenObtainPairView.as_view(), name="token_obtain_pair"),
     path("api/token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
     # API Documentation
-    path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
+    path("api/schema/", CachedSpectacularAPIView.as_view(), name="schema"),
     path(
         "api/schema/swagger-ui/",
-        SpectacularSwaggerView.as_view(url_name="schema"),
+        CachedSpectacularSwaggerView.as_view(url_name="schema"),
         name="swagger-ui",
     ),
     path(
         "api/schema/redoc/",
-        SpectacularRedocView.as_view(url_name="schema"),
+        CachedSpectacularRedocView.as_view(url_name="schema"),
         name="redoc",
     ),
     # API endpoints
     path("api/tasks/", include("tasks.urls")),
     path("api/users/", include("users.urls")),
+    # Métricas
+    path("api/db-pool/", database_pool_stats, name="db-pool-stats"),
+    path("metrics", metrics_view, name="metrics"),
 ]
+
+if settings.ADMIN_ENABLED:
+    from django.contrib import admin
+
+    urlpatterns.append(path("admin/", admin.site.urls))
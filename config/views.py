@@ -0,0 +1,20 @@
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+
+from .database import pool_stats
+from .timing import query_budget
+
+
+@query_budget(1)
+@extend_schema(responses=OpenApiTypes.OBJECT)
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def database_pool_stats(request):
+    """
+    GET /api/db-pool/
+    Métricas del pool de conexiones del proceso que atiende la petición.
+    """
+    return Response(pool_stats())
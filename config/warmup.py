@@ -0,0 +1,130 @@
+"""
+Calentamiento del proceso antes de recibir tráfico (gunicorn.conf.py).
+
+Sin calentar, la primera petición de cada worker paga la importación de las
+vistas y serializers que Django carga de forma diferida, la compilación de las
+URLs, la introspección de los modelos en los ModelSerializer, el esquema
+OpenAPI y la apertura del pool de conexiones.
+
+Los pasos de APP_STEPS no abren conexiones, así que con preload se ejecutan en
+el master y los workers heredan el resultado al hacer fork. Los de
+CONNECTION_STEPS abren sockets (base de datos y caché) y deben ejecutarse en
+cada worker, después del fork.
+"""
+
+import time
+from importlib import import_module
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections
+from django.urls import URLPattern, URLResolver, get_resolver
+from django.utils.module_loading import module_has_submodule
+
+APP_MODULES = ("models", "serializers", "views", "urls")
+
+
+def import_app_modules():
+    """
+    Importa los módulos habituales de cada app instalada.
+    """
+    for app_config in apps.get_app_configs():
+        for name in APP_MODULES:
+            if module_has_submodule(app_config.module, name):
+                import_module(f"{app_config.name}.{name}")
+
+
+def iter_views(patterns=None):
+    """
+    Vistas (callbacks) de todas las URLs del proyecto.
+    """
+    if patterns is None:
+        patterns = get_resolver().url_patterns
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from iter_views(pattern.url_patterns)
+        elif isinstance(pattern, URLPattern):
+            yield pattern.callback
+
+
+def resolve_urls():
+    """
+    Compila las URLs y llena los índices de reverse().
+    """
+    resolver = get_resolver()
+    resolver.reverse_dict
+    for view in iter_views():
+        # Las vistas de DRF resuelven sus clases (renderers, parsers, permisos) de api_settings.
+        cls = getattr(view, "cls", None)
+        for name in ("renderer_classes", "parser_classes", "authentication_classes", "permission_classes"):
+            getattr(cls, name, None)
+
+
+def build_serializers():
+    """
+    Construye los campos de los serializers de las vistas y de los módulos
+    `serializers` de cada app; en los ModelSerializer eso recorre los metadatos
+    de los modelos, que Django guarda en caché.
+    """
+    serializer_classes = {getattr(getattr(view, "cls", None), "serializer_class", None) for view in iter_views()}
+    for app_config in apps.get_app_configs():
+        if module_has_submodule(app_config.module, "serializers"):
+            module = import_module(f"{app_config.name}.serializers")
+            serializer_classes.update(
+                value for value in vars(module).values() if getattr(value, "__module__", None) == module.__name__
+            )
+    for serializer_class in serializer_classes:
+        if isinstance(serializer_class, type) and hasattr(serializer_class, "get_fields"):
+            try:
+                serializer_class().fields
+            except Exception:
+                # Serializers que exigen argumentos: se construirán con la primera petición.
+                continue
+
+
+def load_schema():
+    """
+    Carga (o genera) el esquema OpenAPI de /api/schema/ (config.schema).
+    """
+    if settings.SCHEMA_CACHE["ENABLED"]:
+        from config.schema import build
+
+        build()
+
+
+def open_connections():
+    """
+    Abre una conexión a cada base de datos (con pool, el pool del worker) y a
+    cada caché configurada.
+    """
+    for alias in connections:
+        connection = connections[alias]
+        connection.ensure_connection()
+        connection.close()
+    for alias in settings.CACHES:
+        caches[alias].get("warmup")
+
+
+APP_STEPS = {
+    "modules": import_app_modules,
+    "urls": resolve_urls,
+    "serializers": build_serializers,
+    "schema": load_schema,
+}
+CONNECTION_STEPS = {"connections": open_connections}
+
+
+def warm_up(steps=None):
+    """
+    Ejecuta `steps` ({nombre: función}; por defecto todos) y retorna
+    {nombre: segundos}.
+    """
+    if steps is None:
+        steps = {**APP_STEPS, **CONNECTION_STEPS}
+    timings = {}
+    for name, step in steps.items():
+        start = time.perf_counter()
+        step()
+        timings[name] = time.perf_counter() - start
+    return timings
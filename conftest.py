@@ -1,10 +1,52 @@
 from django.contrib.auth.models import User
+from django.core.cache import cache
 
 import pytest
 from rest_framework.test import APIClient
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from config.schema import schema_cache
+from tasks.cache import response_cache
 from tasks.models import Task
+from users.authentication import user_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Vacía las cachés en memoria: SQLite reutiliza ids entre tests."""
+    cache.clear()
+    response_cache.clear()
+    user_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def shared_caches_enabled(settings):
+    """Activa las cachés de respuestas y de usuarios: los tests corren en un solo proceso."""
+    settings.TASKS_RESPONSE_CACHE = {**settings.TASKS_RESPONSE_CACHE, "ENABLED": True}
+    settings.USER_CACHE = {**settings.USER_CACHE, "ENABLED": True}
+
+
+@pytest.fixture(autouse=True)
+def primary_only(settings):
+    """
+    Lee siempre del primario: la réplica espejo usa otra conexión, que no ve
+    la transacción del test. tasks/tests/test_routers.py activa las réplicas.
+    """
+    settings.DATABASE_REPLICAS = []
+
+
+@pytest.fixture(autouse=True)
+def schema_cache_dir(settings, tmp_path):
+    """Guarda el esquema OpenAPI en un directorio del test y no en el del proyecto."""
+    settings.SCHEMA_CACHE = {**settings.SCHEMA_CACHE, "DIR": str(tmp_path / "schema")}
+    schema_cache.clear()
+    return tmp_path / "schema"
+
+
+@pytest.fixture(autouse=True)
+def enforce_query_budgets(settings):
+    """Falla la petición que supere el query_budget de su vista."""
+    settings.REQUEST_TIMING = {**settings.REQUEST_TIMING, "ENFORCE_BUDGETS": True}
 
 
 @pytest.fixture
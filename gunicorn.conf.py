@@ -0,0 +1,111 @@
+"""
+Configuración de gunicorn (se carga sola desde el directorio de trabajo).
+
+Los workers se dimensionan con los CPU disponibles para el proceso:
+- gthread (por defecto): un worker por CPU con GUNICORN_THREADS hilos cada uno.
+- sync: 2 * CPU + 1 workers de un hilo.
+- asgi: un worker de uvicorn por CPU sirviendo config.asgi (vistas async,
+  TASKS_ASYNC_VIEWS).
+GUNICORN_WORKERS y GUNICORN_THREADS reemplazan el cálculo. Cada worker tiene su
+propio pool de conexiones: DB_POOL_MAX_SIZE debe cubrir los hilos de un worker.
+
+Con preload (GUNICORN_PRELOAD, por defecto activo) el master importa la
+aplicación y la calienta (config.warmup.APP_STEPS) antes de crear los workers,
+que la heredan al hacer fork. Cada worker abre sus conexiones
+(CONNECTION_STEPS) antes de aceptar peticiones. GUNICORN_MAX_REQUESTS recicla
+los workers para acotar el crecimiento de memoria.
+
+PROMETHEUS_MULTIPROC_DIR (por defecto un directorio en /tmp, definido aquí y no
+en la imagen para que runserver y los comandos no lo usen) hace que cada worker
+escriba sus métricas en ese directorio (config.metrics): se vacía al arrancar el
+master y se marca cada worker que termina para descontar sus gauges de
+peticiones en curso.
+"""
+
+import os
+import shutil
+import tempfile
+
+WORKER_CLASSES = {"sync": "sync", "gthread": "gthread", "asgi": "uvicorn_worker.UvicornWorker"}
+
+
+def available_cpus():
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def env_int(name, default):
+    # Vacía (p. ej. "GUNICORN_WORKERS=" en .env) equivale a no definida.
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+def env_bool(name, default):
+    value = os.environ.get(name)
+    return value.lower() in ("true", "1", "yes") if value else default
+
+
+# Antes de cargar la aplicación: prometheus_client lee la variable al importarse.
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", os.path.join(tempfile.gettempdir(), "prometheus"))
+
+worker_type = os.environ.get("GUNICORN_WORKER_CLASS") or "gthread"
+worker_class = WORKER_CLASSES.get(worker_type, worker_type)
+asgi = worker_class == WORKER_CLASSES["asgi"]
+cpus = available_cpus()
+
+wsgi_app = "config.asgi:application" if asgi else "config.wsgi:application"
+bind = os.environ.get("GUNICORN_BIND") or "0.0.0.0:8000"
+workers = env_int("GUNICORN_WORKERS", 2 * cpus + 1 if worker_class == "sync" else cpus)
+threads = env_int("GUNICORN_THREADS", 4 if worker_class == "gthread" else 1)
+preload_app = env_bool("GUNICORN_PRELOAD", True)
+max_requests = env_int("GUNICORN_MAX_REQUESTS", 2000)
+max_requests_jitter = env_int("GUNICORN_MAX_REQUESTS_JITTER", max_requests // 10)
+timeout = env_int("GUNICORN_TIMEOUT", 30)
+graceful_timeout = env_int("GUNICORN_GRACEFUL_TIMEOUT", 30)
+keepalive = env_int("GUNICORN_KEEPALIVE", 5)
+warmup = env_bool("GUNICORN_WARMUP", True)
+# El heartbeat de los workers en memoria: en contenedores /tmp suele ser un disco.
+if os.path.isdir("/dev/shm"):
+    worker_tmp_dir = "/dev/shm"
+
+
+def log_warm_up(log, who, timings):
+    steps = ", ".join(f"{name} {seconds * 1000:.1f} ms" for name, seconds in timings.items())
+    log.info("Calentamiento (%s): %s", who, steps)
+
+
+def on_starting(server):
+    directory = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if directory:
+        shutil.rmtree(directory, ignore_errors=True)
+        os.makedirs(directory, exist_ok=True)
+
+
+def when_ready(server):
+    # Master, antes del primer fork: con preload la aplicación ya está cargada.
+    if warmup and server.cfg.preload_app:
+        from config.warmup import APP_STEPS, warm_up
+
+        log_warm_up(server.log, "master", warm_up(APP_STEPS))
+
+
+def post_worker_init(worker):
+    # Worker con la aplicación cargada, antes de aceptar conexiones.
+    if warmup:
+        from config.warmup import APP_STEPS, CONNECTION_STEPS, warm_up
+
+        steps = CONNECTION_STEPS if worker.cfg.preload_app else {**APP_STEPS, **CONNECTION_STEPS}
+        try:
+            log_warm_up(worker.log, f"worker {worker.pid}", warm_up(steps))
+        except Exception:
+            # Sin base de datos el worker arranca igual; la primera petición reintentará.
+            worker.log.exception("Calentamiento del worker %s incompleto", worker.pid)
+
+
+def child_exit(server, worker):
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
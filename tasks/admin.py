@@ -1,6 +1,7 @@
 from django.contrib import admin
+from django.db import transaction
 
-from .models import Task
+from .models import Task, TaskCounters, TaskTombstone
 
 
 @admin.register(Task)
@@ -10,3 +11,14 @@ class TaskAdmin(admin.ModelAdmin):
     search_fields = ["title", "description"]
     date_hierarchy = "created_at"
     ordering = ["-created_at"]
+
+    def delete_queryset(self, request, queryset):
+        """
+        La acción "eliminar seleccionados" borra con un DELETE masivo, así que los
+        contadores y las lápidas se actualizan aquí en la misma transacción.
+        """
+        with transaction.atomic():
+            deltas = TaskCounters.objects.deltas_for(queryset, sign=-1)
+            TaskTombstone.objects.record_deletions(queryset)
+            super().delete_queryset(request, queryset)
+            TaskCounters.objects.apply_many(deltas)
@@ -1,5 +1,20 @@
 from django.apps import AppConfig
+from django.contrib.auth import get_user_model
+from django.core import checks
+from django.db.models.signals import post_migrate, post_save
 
 
 class TasksConfig(AppConfig):
     name = "tasks"
+
+    def ready(self):
+        from .cache import invalidate_on_tasks_changed, invalidate_on_user_saved
+        from .checks import check_replica_pin_cache, check_response_cache
+        from .search import install_search_on_migrate
+        from .signals import tasks_changed
+
+        post_migrate.connect(install_search_on_migrate, sender=self)
+        tasks_changed.connect(invalidate_on_tasks_changed, dispatch_uid="tasks_response_cache")
+        post_save.connect(invalidate_on_user_saved, sender=get_user_model(), dispatch_uid="tasks_response_cache_user")
+        checks.register(check_response_cache, checks.Tags.caches)
+        checks.register(check_replica_pin_cache, checks.Tags.caches, checks.Tags.database)
@@ -0,0 +1,226 @@
+"""
+Variante asíncrona de TaskViewSet para despliegues ASGI (TASKS_ASYNC_VIEWS).
+
+Con el servidor ASGI, una vista síncrona ocupa un hilo mientras espera a la
+base de datos. AsyncTaskViewSet expone las mismas rutas y respuestas que
+TaskViewSet, pero list, retrieve, create, pending, completed, complete y stats
+son corrutinas que usan el ORM async (`aget`, `acount`, `aaggregate`, iteración
+con `async for`). La autenticación y los permisos también se esperan.
+
+Las demás acciones (update, destroy, bulk, export, import, changes) y los
+modos que dependen de código síncrono (`?pagination=cursor`, `?search=` con el
+índice en memoria) se ejecutan con la implementación de TaskViewSet mediante
+`sync_to_async`, así que el comportamiento de la API no cambia.
+"""
+
+from functools import update_wrapper
+
+from django.core.exceptions import ValidationError
+from django.http import Http404
+from django.utils.decorators import classonlymethod
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from rest_framework import exceptions, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from . import conditional
+from .cache import cached_response, response_cache
+from .models import TaskCounters
+from .pagination import apaginate_queryset, wants_cursor_pagination
+from .serializers import TaskListSerializer
+from .views import TaskViewSet
+
+
+class AsyncViewSetMixin:
+    """
+    `dispatch` asíncrono para un ViewSet de DRF.
+
+    Sigue los mismos pasos que APIView.dispatch. Los handlers async se esperan y
+    los síncronos se ejecutan con `sync_to_async`. Los autenticadores con
+    `aauthenticate` y los permisos cuyo `has_permission` es async se esperan
+    directamente.
+    """
+
+    @classonlymethod
+    def as_view(cls, actions=None, **initkwargs):
+        view = super().as_view(actions, **initkwargs)
+
+        async def async_view(request, *args, **kwargs):
+            return await view(request, *args, **kwargs)
+
+        # Conserva cls, initkwargs, actions y csrf_exempt que usan el router y el esquema.
+        return update_wrapper(async_view, view)
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await self.ainitial(request, *args, **kwargs)
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            if iscoroutinefunction(handler):
+                response = await handler(request, *args, **kwargs)
+            else:
+                response = await sync_to_async(handler)(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    async def ainitial(self, request, *args, **kwargs):
+        """
+        Equivalente de APIView.initial.
+        """
+        self.format_kwarg = self.get_format_suffix(**kwargs)
+        request.accepted_renderer, request.accepted_media_type = self.perform_content_negotiation(request)
+        request.version, request.versioning_scheme = self.determine_version(request, *args, **kwargs)
+
+        await self.aperform_authentication(request)
+        await self.acheck_permissions(request)
+        if self.get_throttles():
+            await sync_to_async(self.check_throttles)(request)
+
+    async def aperform_authentication(self, request):
+        """
+        Equivalente de Request._authenticate.
+        """
+        for authenticator in request.authenticators:
+            try:
+                if hasattr(authenticator, "aauthenticate"):
+                    user_auth_tuple = await authenticator.aauthenticate(request)
+                else:
+                    user_auth_tuple = await sync_to_async(authenticator.authenticate)(request)
+            except exceptions.APIException:
+                request._not_authenticated()
+                raise
+
+            if user_auth_tuple is not None:
+                request._authenticator = authenticator
+                request.user, request.auth = user_auth_tuple
+                return
+
+        request._not_authenticated()
+
+    async def acheck_permissions(self, request):
+        for permission in self.get_permissions():
+            allowed = permission.has_permission(request, self)
+            if iscoroutinefunction(permission.has_permission):
+                allowed = await allowed
+            if not allowed:
+                self.permission_denied(
+                    request, message=getattr(permission, "message", None), code=getattr(permission, "code", None)
+                )
+
+    async def acheck_object_permissions(self, request, obj):
+        for permission in self.get_permissions():
+            allowed = permission.has_object_permission(request, self, obj)
+            if iscoroutinefunction(permission.has_object_permission):
+                allowed = await allowed
+            if not allowed:
+                self.permission_denied(
+                    request, message=getattr(permission, "message", None), code=getattr(permission, "code", None)
+                )
+
+    async def aget_object(self):
+        """
+        Equivalente de GenericAPIView.get_object con `aget`.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            obj = await queryset.aget(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        except (queryset.model.DoesNotExist, TypeError, ValueError, ValidationError):
+            raise Http404
+        await self.acheck_object_permissions(self.request, obj)
+        return obj
+
+
+class AsyncTaskViewSet(AsyncViewSetMixin, TaskViewSet):
+    """
+    TaskViewSet con las lecturas más frecuentes, la creación y `complete` en async.
+    """
+
+    async def list(self, request, *args, **kwargs):
+        """
+        Lista las tareas con el camino rápido de TaskListSerializer y paginación por página.
+        """
+        if wants_cursor_pagination(request) or request.query_params.get(api_settings.SEARCH_PARAM):
+            # TaskViewSet.list ya pasa por response_cache.
+            return await sync_to_async(super().list)(request, *args, **kwargs)
+        return await response_cache.aserve(request, "list", self.alist)
+
+    async def alist(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        validators = await conditional.aqueryset_validators(self.request, queryset)
+        return await self.aconditional_response(validators, lambda: self.afast_list(queryset))
+
+    async def afast_list(self, queryset):
+        rows = TaskListSerializer.fast_values(queryset)
+
+        if self.paginator is not None:
+            page = await apaginate_queryset(self.paginator, rows, self.request)
+            if page is not None:
+                return self.get_paginated_response(TaskListSerializer.fast_serialize(page))
+        return Response(TaskListSerializer.fast_serialize([row async for row in rows]))
+
+    async def retrieve(self, request, *args, **kwargs):
+        instance = await self.aget_object()
+        validators = conditional.instance_validators(request, instance)
+        return self.conditional_response(validators, lambda: Response(self.get_serializer(instance).data))
+
+    async def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        # Task.save actualiza los contadores en una transacción, que requiere el hilo síncrono.
+        await sync_to_async(self.perform_create)(serializer)
+        return Response(serializer.data, status=status.HTTP_201_CREATED, headers=self.get_success_headers(serializer.data))
+
+    async def aconditional_response(self, validators, render):
+        """
+        Igual que `conditional_response`, con `render` async.
+        """
+        response = conditional.evaluate(self.request, *validators)
+        if response is None:
+            response = conditional.set_validators(await render(), *validators)
+        return response
+
+    async def afiltered(self, request, status_value):
+        tasks = self.get_queryset().filter(status=status_value)
+        validators = await conditional.aqueryset_validators(request, tasks)
+
+        async def render():
+            return Response(self.get_serializer([task async for task in tasks], many=True).data)
+
+        return await self.aconditional_response(validators, render)
+
+    @action(detail=False, methods=["get"])
+    @cached_response("pending")
+    async def pending(self, request):
+        return await self.afiltered(request, "pending")
+
+    @action(detail=False, methods=["get"])
+    @cached_response("completed")
+    async def completed(self, request):
+        return await self.afiltered(request, "completed")
+
+    @action(detail=True, methods=["post"])
+    async def complete(self, request, pk=None):
+        task = await self.aget_object()
+        task.status = "completed"
+        await task.asave()
+        return Response(self.get_serializer(task).data)
+
+    @action(detail=False, methods=["get"])
+    async def stats(self, request):
+        counters = await TaskCounters.objects.afor_user(request.user)
+        return Response(counters.as_dict())
@@ -0,0 +1,242 @@
+"""
+Caché de respuestas de lectura de TaskViewSet (list, pending, completed).
+
+Las entradas se guardan bajo (usuario, generación, endpoint, parámetros). La
+generación de cada usuario vive en la capa compartida (un alias de CACHES) y se
+incrementa cada vez que se escriben sus tareas, así que invalidar no requiere
+buscar ni borrar claves: las entradas viejas simplemente dejan de consultarse y
+expiran solas.
+
+Los datos del usuario anidados en cada tarea también forman parte de la
+respuesta: guardar el usuario incrementa su generación igual que escribir sus
+tareas.
+
+Hay dos capas: una LRU acotada dentro del proceso y la caché compartida. La LRU
+evita la ida a la capa compartida en las lecturas repetidas; la generación se
+consulta siempre en la compartida para ver las escrituras de otros procesos.
+
+Junto con los datos se guardan la ETag y el Last-Modified de la respuesta, así
+que un GET condicional que acierta en la caché responde 304 sin consultar la
+base de datos.
+"""
+
+import hashlib
+import threading
+from functools import partial, wraps
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.utils.http import parse_http_date_safe
+
+from asgiref.sync import iscoroutinefunction
+from rest_framework import status
+from rest_framework.response import Response
+
+from config.cache import LRUCache, aget_generation, bump_generation, get_generation
+
+from . import conditional
+
+
+class TaskResponseCache:
+    """
+    Caché de respuestas por usuario con invalidación por generación.
+    """
+
+    def __init__(self):
+        self._local = None
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.shared_hits = 0
+
+    @property
+    def config(self):
+        return settings.TASKS_RESPONSE_CACHE
+
+    @property
+    def enabled(self):
+        return self.config["ENABLED"]
+
+    @property
+    def shared(self):
+        return caches[self.config["SHARED_CACHE"]]
+
+    @property
+    def local(self):
+        if self._local is None:
+            self._local = LRUCache(self.config["MAX_ENTRIES"], ttl=self.config["TIMEOUT"])
+        return self._local
+
+    def generation_key(self, user_id):
+        return f"tasks:generation:{user_id}"
+
+    def get_generation(self, user_id):
+        return get_generation(self.shared, self.generation_key(user_id))
+
+    def bump_generation(self, user_id):
+        bump_generation(self.shared, self.generation_key(user_id))
+
+    def invalidate_user(self, user_id, using=None):
+        """
+        Invalida las respuestas del usuario ahora y de nuevo al confirmar la
+        transacción, para que una lectura concurrente no deje en caché datos
+        previos al commit bajo la generación nueva.
+        """
+        if not self.enabled:
+            return
+        self.bump_generation(user_id)
+        transaction.on_commit(partial(self.bump_generation, user_id), using=using, robust=True)
+
+    def make_key(self, request, endpoint, generation):
+        params = sorted((name, value) for name, values in request.query_params.lists() for value in values if value != "")
+        # Los enlaces de paginación son absolutos, así que el host forma parte de la respuesta;
+        # el tipo de medio forma parte de la ETag guardada.
+        url = f"{request.scheme}://{request.get_host()}?{urlencode(params)}"
+        digest = hashlib.sha1(f"{url}|{request.accepted_media_type}".encode()).hexdigest()
+        return f"tasks:response:{request.user.pk}:{generation}:{endpoint}:{digest}"
+
+    def serve(self, request, endpoint, compute):
+        """
+        Retorna la respuesta en caché para `endpoint` o la calcula con `compute()`.
+        """
+        if not self.enabled or not request.user.is_authenticated:
+            return compute()
+
+        key = self.make_key(request, endpoint, self.get_generation(request.user.pk))
+        entry = self.local.get(key)
+        if entry is None:
+            entry = self._promote(key, self.shared.get(key))
+        if entry is not None:
+            return self._hit(request, entry)
+
+        response = compute()
+        entry = self._miss(key, response)
+        if entry is not None:
+            self.shared.set(key, entry, timeout=self.config["TIMEOUT"])
+        return response
+
+    async def aserve(self, request, endpoint, compute):
+        """
+        Versión asíncrona de `serve`; `compute` es una función async.
+        """
+        if not self.enabled or not request.user.is_authenticated:
+            return await compute()
+
+        key = self.make_key(request, endpoint, await aget_generation(self.shared, self.generation_key(request.user.pk)))
+        entry = self.local.get(key)
+        if entry is None:
+            entry = self._promote(key, await self.shared.aget(key))
+        if entry is not None:
+            return self._hit(request, entry)
+
+        response = await compute()
+        entry = self._miss(key, response)
+        if entry is not None:
+            await self.shared.aset(key, entry, timeout=self.config["TIMEOUT"])
+        return response
+
+    def _promote(self, key, entry):
+        # Una entrada encontrada en la capa compartida se copia a la local.
+        if entry is not None:
+            self.local.set(key, entry)
+            self.shared_hits += 1
+        return entry
+
+    def _hit(self, request, entry):
+        self._count(hit=True)
+        # Los validadores guardados siguen vigentes mientras la generación no cambie.
+        response = conditional.evaluate(request, entry["etag"], entry["last_modified"])
+        if response is None:
+            response = conditional.set_validators(Response(entry["data"]), entry["etag"], entry["last_modified"])
+        response["X-Cache"] = "HIT"
+        return response
+
+    def _miss(self, key, response):
+        """
+        Marca la respuesta calculada y retorna la entrada a guardar en la capa compartida (o None).
+        """
+        self._count(hit=False)
+        response["X-Cache"] = "MISS"
+        if response.status_code != status.HTTP_200_OK:
+            return None
+        entry = {
+            "data": response.data,
+            "etag": response.get("ETag"),
+            "last_modified": parse_http_date_safe(response.get("Last-Modified")),
+        }
+        self.local.set(key, entry)
+        return entry
+
+    def _count(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def stats(self):
+        """
+        Contadores de aciertos y fallos (por proceso).
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "shared_hits": self.shared_hits,
+            "local": self.local.stats(),
+        }
+
+    def clear(self):
+        """
+        Vacía la capa local y reinicia los contadores (útil en tests).
+        """
+        self._local = None
+        self.hits = self.misses = self.shared_hits = 0
+
+
+response_cache = TaskResponseCache()
+
+
+def cached_response(endpoint):
+    """
+    Decorador para acciones de lectura de TaskViewSet que usa `response_cache`.
+    Acepta también métodos async (AsyncTaskViewSet).
+    """
+
+    def decorator(method):
+        if iscoroutinefunction(method):
+
+            @wraps(method)
+            async def async_wrapper(self, request, *args, **kwargs):
+                return await response_cache.aserve(request, endpoint, lambda: method(self, request, *args, **kwargs))
+
+            return async_wrapper
+
+        @wraps(method)
+        def wrapper(self, request, *args, **kwargs):
+            return response_cache.serve(request, endpoint, lambda: method(self, request, *args, **kwargs))
+
+        return wrapper
+
+    return decorator
+
+
+def invalidate_on_tasks_changed(sender, user_id, using=None, **kwargs):
+    """
+    Receptor de la señal tasks_changed.
+    """
+    response_cache.invalidate_user(user_id, using=using)
+
+
+# Datos del usuario que se anidan en cada tarea (user_username) o forman parte de la ETag.
+USER_FIELDS = frozenset({"username", "email", "first_name", "last_name"})
+
+
+def invalidate_on_user_saved(sender, instance, created, update_fields=None, using=None, **kwargs):
+    """
+    Receptor de post_save de User: las respuestas guardadas incluyen sus datos,
+    así que cambiarlos (p. ej. el username) las invalida. Un save con
+    update_fields que no toca esos campos (contraseña, last_login) no invalida.
+    """
+    if created or (update_fields is not None and not USER_FIELDS.intersection(update_fields)):
+        return
+    response_cache.invalidate_user(instance.pk, using=using)
@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.checks import Warning
+
+
+def check_replica_pin_cache(app_configs, **kwargs):
+    """
+    Avisa si la fijación al primario tras escribir (config.routers) se guarda en
+    la memoria del proceso mientras hay réplicas de lectura.
+    """
+    if settings.DEBUG or not settings.DATABASE_REPLICAS or not isinstance(caches["default"], LocMemCache):
+        return []
+    return [
+        Warning(
+            "Las réplicas de lectura fijan al usuario al primario en LocMemCache: los demás workers no ven "
+            "la fijación y pueden leer datos desactualizados justo después de una escritura.",
+            hint="Con varios workers configure CACHE_BACKEND con Redis o Memcached, o no defina DB_REPLICA_HOSTS.",
+            id="tasks.W002",
+        )
+    ]
+
+
+def check_response_cache(app_configs, **kwargs):
+    """
+    Avisa si la caché de respuestas guarda las generaciones en memoria del proceso.
+    """
+    config = settings.TASKS_RESPONSE_CACHE
+    if settings.DEBUG or not config["ENABLED"] or not isinstance(caches[config["SHARED_CACHE"]], LocMemCache):
+        return []
+    return [
+        Warning(
+            "La caché de respuestas de tareas usa LocMemCache como capa compartida.",
+            hint="Con varios workers configure CACHE_BACKEND con Redis o Memcached, o desactive TASKS_RESPONSE_CACHE_ENABLED.",
+            id="tasks.W001",
+        )
+    ]
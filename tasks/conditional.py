@@ -0,0 +1,84 @@
+"""
+Validadores HTTP (ETag y Last-Modified) para las respuestas de tareas.
+
+El marcador de versión de una tarea es `updated_at`; para un listado se usa el
+máximo `updated_at` y el número de filas del queryset filtrado, obtenidos con
+una sola agregación antes de leer y serializar las filas. Crear o editar mueve
+el máximo y eliminar cambia el conteo. Los listados solo llevan ETag: eliminar
+una tarea (o que salga del filtro) no mueve el máximo `updated_at`, así que un
+Last-Modified con ese valor respondería 304 con la tarea todavía en la lista.
+
+Las ETag son fuertes: además de la versión de los datos incluyen todo lo que
+cambia el cuerpo de la respuesta (URL con sus parámetros, tipo de medio y los
+datos del usuario que se anidan en cada tarea).
+"""
+
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+def _etag(*parts):
+    return quote_etag(hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest())
+
+
+def _user_marker(user):
+    return f"{user.pk}:{user.username}:{user.email}:{user.first_name}:{user.last_name}"
+
+
+def _timestamp(value):
+    return int(value.timestamp()) if value is not None else None
+
+
+def queryset_validators(request, queryset):
+    """
+    Retorna (etag, None) de un listado a partir de Max(updated_at) y Count(id).
+    """
+    version = queryset.order_by().aggregate(last_modified=Max("updated_at"), count=Count("id"))
+    return _queryset_validators(request, version)
+
+
+async def aqueryset_validators(request, queryset):
+    version = await queryset.order_by().aaggregate(last_modified=Max("updated_at"), count=Count("id"))
+    return _queryset_validators(request, version)
+
+
+def _queryset_validators(request, version):
+    last_modified = version["last_modified"]
+    etag = _etag(
+        last_modified.isoformat() if last_modified else "",
+        version["count"],
+        request.build_absolute_uri(),
+        request.accepted_media_type,
+        _user_marker(request.user),
+    )
+    return etag, None
+
+
+def instance_validators(request, task):
+    """
+    Retorna (etag, last_modified) de una tarea.
+    """
+    etag = _etag(task.pk, task.updated_at.isoformat(), request.accepted_media_type, _user_marker(task.user))
+    return etag, _timestamp(task.updated_at)
+
+
+def evaluate(request, etag, last_modified):
+    """
+    Evalúa If-None-Match, If-Modified-Since, If-Match e If-Unmodified-Since.
+    Retorna la respuesta 304/412 que corresponda o None si hay que continuar.
+    """
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is not None:
+        set_validators(response, etag, last_modified)
+    return response
+
+
+def set_validators(response, etag, last_modified):
+    if etag:
+        response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified)
+    return response
@@ -0,0 +1,115 @@
+"""
+Exportación de tareas en streaming (NDJSON o CSV) para /api/tasks/export/.
+
+Las filas se leen con `values().iterator(chunk_size=...)`, que en PostgreSQL
+usa un cursor del lado del servidor, y se escriben en un StreamingHttpResponse
+por bloques, así que la memoria no depende del número de tareas.
+"""
+
+import csv
+import json
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+
+from rest_framework.renderers import BaseRenderer
+
+from .serializers import _datetime_representation
+
+EXPORT_FIELDS = ("id", "title", "description", "status", "priority", "due_date", "created_at", "updated_at")
+DATETIME_FIELDS = ("due_date", "created_at", "updated_at")
+
+
+class NDJSONRenderer(BaseRenderer):
+    """
+    Un objeto JSON por línea. Las filas exportadas no pasan por aquí (se
+    escriben en streaming); se usa para la negociación y los errores.
+    """
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return (json.dumps(data, ensure_ascii=False) + "\n").encode(self.charset)
+
+
+class _Echo:
+    """
+    Objeto tipo archivo para csv.writer que retorna lo escrito en vez de guardarlo.
+    """
+
+    def write(self, value):
+        return value
+
+
+class CSVRenderer(BaseRenderer):
+    """
+    CSV con encabezado. Igual que NDJSONRenderer, solo renderiza errores.
+    """
+
+    media_type = "text/csv"
+    format = "csv"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if not isinstance(data, dict):
+            data = {"detail": data}
+        writer = csv.writer(_Echo())
+        return (writer.writerow(data.keys()) + writer.writerow(data.values())).encode(self.charset)
+
+
+def export_rows(queryset, chunk_size, to_datetime):
+    """
+    Itera las tareas de `queryset` como diccionarios con las fechas en ISO 8601.
+    """
+    for row in queryset.values(*EXPORT_FIELDS).iterator(chunk_size=chunk_size):
+        for field in DATETIME_FIELDS:
+            row[field] = to_datetime(row[field])
+        yield row
+
+
+def _batched(lines, size):
+    """
+    Agrupa líneas para no escribir en el socket una vez por fila.
+    """
+    batch = []
+    for line in lines:
+        batch.append(line)
+        if len(batch) >= size:
+            yield "".join(batch)
+            batch = []
+    if batch:
+        yield "".join(batch)
+
+
+def ndjson_lines(rows):
+    for row in rows:
+        yield json.dumps(row, ensure_ascii=False) + "\n"
+
+
+def csv_lines(rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(EXPORT_FIELDS)
+    for row in rows:
+        yield writer.writerow(row[field] for field in EXPORT_FIELDS)
+
+
+def stream_export(queryset, renderer):
+    """
+    Retorna un StreamingHttpResponse con las tareas de `queryset` en el formato de `renderer`.
+    """
+    chunk_size = settings.TASKS_EXPORT_CHUNK_SIZE
+    lines = csv_lines if renderer.format == "csv" else ndjson_lines
+    # La zona horaria se fija aquí: el generador se consume después de que la vista retorna.
+    rows = export_rows(queryset, chunk_size, _datetime_representation())
+    response = StreamingHttpResponse(
+        _batched(lines(rows), chunk_size),
+        content_type=f"{renderer.media_type}; charset={renderer.charset}",
+    )
+    response["Content-Disposition"] = f'attachment; filename="tasks.{renderer.format}"'
+    return response
@@ -0,0 +1,205 @@
+"""
+Importación masiva de tareas desde NDJSON o CSV (POST /api/tasks/import/ y
+`manage.py import_tasks`).
+
+El archivo se lee línea a línea: los parsers retornan un iterador perezoso de
+filas, y TaskImporter las valida por bloques con las reglas de TaskSerializer y
+escribe cada bloque con bulk_create (COPY en PostgreSQL) en su propia
+transacción. El avance y los errores por fila se emiten como eventos a medida
+que se procesan, así que nunca se guarda el archivo completo en memoria.
+
+En la API los eventos se generan mientras se envía la respuesta, después de que
+los middlewares retornaron: la vista fija la petición al primario antes de
+retornar (config.routers.use_primary) y un bloque que no se puede guardar se
+informa como evento en lugar de cortar el stream.
+"""
+
+import csv
+import io
+import json
+import logging
+from itertools import islice
+
+from django.conf import settings
+from django.db import DatabaseError, connections, router, transaction
+from django.utils import timezone
+
+from rest_framework.exceptions import ParseError, ValidationError
+from rest_framework.parsers import BaseParser
+
+from .models import Task, TaskCounters
+from .serializers import TaskSerializer
+
+logger = logging.getLogger(__name__)
+
+COPY_COLUMNS = ("title", "description", "status", "priority", "due_date", "created_at", "updated_at", "user_id")
+
+
+def parse_ndjson(lines):
+    """
+    Itera (número de línea, fila) de un archivo NDJSON. Las líneas inválidas se
+    retornan como ParseError para informarlas sin detener la importación.
+    """
+    for number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except (ValueError, UnicodeDecodeError):
+            yield number, ParseError("JSON inválido.")
+            continue
+        yield number, row if isinstance(row, dict) else ParseError("Cada línea debe ser un objeto JSON.")
+
+
+def parse_csv(lines):
+    """
+    Itera (número de línea, fila) de un CSV con encabezado. Las celdas vacías se
+    omiten para que se apliquen los valores por defecto del modelo.
+    """
+    text = (line.decode("utf-8-sig" if number == 0 else "utf-8", errors="replace") for number, line in enumerate(lines))
+    reader = csv.reader(text)
+    header = next(reader, None)
+    if header is None:
+        return
+    for values in reader:
+        if not any(values):
+            continue
+        if len(values) != len(header):
+            yield reader.line_num, ParseError("La fila no tiene la misma cantidad de columnas que el encabezado.")
+            continue
+        yield reader.line_num, {name: value for name, value in zip(header, values) if value != ""}
+
+
+class NDJSONParser(BaseParser):
+    """
+    Parser perezoso: `request.data` es un iterador de (línea, fila).
+    """
+
+    media_type = "application/x-ndjson"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        return parse_ndjson(stream or [])
+
+
+class CSVParser(BaseParser):
+    """
+    Parser perezoso de CSV con encabezado; igual que NDJSONParser.
+    """
+
+    media_type = "text/csv"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        return parse_csv(stream or [])
+
+
+class TaskImporter:
+    """
+    Valida y escribe filas de tareas para `user` en bloques de `chunk_size`.
+
+    `run(rows)` recibe un iterable de (número de línea, fila) y genera eventos:
+    `{"event": "error", "row": n, "errors": {...}}` por cada fila inválida,
+    `{"event": "error", "rows": [primera, última], "errors": {...}}` si un bloque
+    no se pudo guardar, `{"event": "progress", ...}` después de cada bloque y
+    `{"event": "done", ...}` al terminar. Las filas válidas se guardan aunque
+    otras tengan errores; sin el evento `done` la importación se interrumpió.
+    """
+
+    def __init__(self, user, chunk_size=None, using=None):
+        self.user = user
+        self.chunk_size = chunk_size or settings.TASKS_IMPORT_CHUNK_SIZE
+        self.using = using or router.db_for_write(Task)
+        self.serializer = TaskSerializer(context={})
+        self.processed = self.imported = self.failed = 0
+
+    def run(self, rows):
+        rows = iter(rows)
+        while chunk := list(islice(rows, self.chunk_size)):
+            tasks = []
+            for number, row in chunk:
+                try:
+                    tasks.append(self.build(row))
+                except (ParseError, ValidationError) as exc:
+                    self.failed += 1
+                    yield {"event": "error", "row": number, "errors": self.error_detail(exc)}
+            if tasks:
+                try:
+                    self.write(tasks)
+                except DatabaseError:
+                    # La transacción del bloque se revirtió: sus filas no se guardaron.
+                    logger.exception("No se pudo guardar el bloque de filas %s-%s.", chunk[0][0], chunk[-1][0])
+                    self.failed += len(tasks)
+                    tasks = []
+                    yield {
+                        "event": "error",
+                        "rows": [chunk[0][0], chunk[-1][0]],
+                        "errors": {"non_field_errors": ["No se pudo guardar el bloque."]},
+                    }
+            self.processed += len(chunk)
+            self.imported += len(tasks)
+            yield {"event": "progress", **self.summary()}
+        yield {"event": "done", **self.summary()}
+
+    def summary(self):
+        return {"processed": self.processed, "imported": self.imported, "failed": self.failed}
+
+    def build(self, row):
+        """
+        Valida una fila con las reglas de TaskSerializer y retorna la Task sin guardar.
+        """
+        if isinstance(row, ParseError):
+            raise row
+        attrs = self.serializer.run_validation(row)
+        attrs.pop("user_id", None)
+        return Task(user=self.user, **attrs)
+
+    @staticmethod
+    def error_detail(exc):
+        if isinstance(exc, ValidationError) and isinstance(exc.detail, dict):
+            return exc.detail
+        return {"non_field_errors": [str(exc.detail)]}
+
+    def write(self, tasks):
+        with transaction.atomic(using=self.using):
+            if connections[self.using].vendor == "postgresql":
+                self.copy(tasks)
+            else:
+                Task.objects.using(self.using).bulk_create(tasks)
+            changes = [(None, (task.status, task.priority)) for task in tasks]
+            TaskCounters.objects.record_changes(self.user.pk, changes, using=self.using)
+
+    def copy(self, tasks):
+        """
+        Inserta el bloque con COPY ... FROM STDIN (CSV). Los triggers de la tabla
+        (p. ej. el de `search_vector`) se ejecutan igual que con INSERT.
+        """
+        now = timezone.now()
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for task in tasks:
+            due_date = task.due_date.isoformat() if task.due_date else ""
+            writer.writerow(
+                [
+                    task.title,
+                    task.description,
+                    task.status,
+                    task.priority,
+                    due_date,
+                    now.isoformat(),
+                    now.isoformat(),
+                    self.user.pk,
+                ]
+            )
+        buffer.seek(0)
+
+        # Solo due_date admite NULL: una celda vacía en las columnas de texto es "".
+        sql = (
+            f"COPY {Task._meta.db_table} ({', '.join(COPY_COLUMNS)}) FROM STDIN "
+            "WITH (FORMAT csv, FORCE_NOT_NULL (title, description, status, priority))"
+        )
+        with connections[self.using].cursor() as cursor:
+            if hasattr(cursor, "copy_expert"):
+                cursor.copy_expert(sql, buffer)
+            else:
+                with cursor.copy(sql) as copy:
+                    copy.write(buffer.getvalue())
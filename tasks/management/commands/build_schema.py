@@ -0,0 +1,28 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from config.schema import build, code_version, schema_cache
+
+
+class Command(BaseCommand):
+    """
+    python manage.py build_schema [--lang es] [--keep-stale]
+    Genera el esquema OpenAPI de /api/schema/ en SCHEMA_CACHE["DIR"] (al construir la imagen).
+    """
+
+    help = "Genera el esquema OpenAPI de cada formato para la versión actual del código."
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument("--lang", action="append", dest="languages", help="Idioma adicional (?lang=); se puede repetir.")
+        parser.add_argument("--keep-stale", action="store_true", help="No borra los esquemas de otras versiones.")
+
+    def handle(self, *args, **options):
+        variants = build(languages=(None, *(options["languages"] or ())))
+        pruned = 0 if options["keep_stale"] else schema_cache.prune()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Esquema {code_version()} en {settings.SCHEMA_CACHE['DIR']}: {variants} variantes; "
+                f"versiones anteriores borradas: {pruned}."
+            )
+        )
@@ -0,0 +1,52 @@
+import json
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from tasks.importers import TaskImporter, parse_csv, parse_ndjson
+
+PARSERS = {"ndjson": parse_ndjson, "csv": parse_csv}
+
+
+class Command(BaseCommand):
+    """
+    python manage.py import_tasks ARCHIVO --user USUARIO [--format ndjson|csv]
+    Importa tareas leyendo el archivo en streaming.
+    """
+
+    help = "Importa tareas desde un archivo NDJSON o CSV con bulk_create (COPY en PostgreSQL)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Archivo a importar.")
+        parser.add_argument("--user", required=True, help="ID o username del dueño de las tareas.")
+        parser.add_argument("--format", choices=sorted(PARSERS), help="Por defecto se deduce de la extensión.")
+        parser.add_argument("--chunk-size", type=int, help="Filas por transacción.")
+
+    def handle(self, *args, **options):
+        user = self.get_user(options["user"])
+        file_format = options["format"] or options["path"].rsplit(".", 1)[-1].lower()
+        if file_format not in PARSERS:
+            raise CommandError("No se pudo deducir el formato; use --format ndjson|csv.")
+
+        importer = TaskImporter(user, chunk_size=options["chunk_size"])
+        with open(options["path"], "rb") as file:
+            for event in importer.run(PARSERS[file_format](file)):
+                if event["event"] == "error":
+                    rows = f"Fila {event['row']}" if "row" in event else "Filas {}-{}".format(*event["rows"])
+                    self.stderr.write(f"{rows}: {json.dumps(event['errors'], ensure_ascii=False)}")
+                elif event["event"] == "progress" and options["verbosity"] > 1:
+                    self.stdout.write(f"{event['processed']} filas procesadas, {event['imported']} importadas.")
+
+        summary = importer.summary()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Importadas {summary['imported']} tareas de {summary['processed']} filas ({summary['failed']} con errores)."
+            )
+        )
+
+    def get_user(self, value):
+        lookup = {"pk": int(value)} if value.isdigit() else {"username": value}
+        try:
+            return User.objects.get(**lookup)
+        except User.DoesNotExist:
+            raise CommandError(f"No existe el usuario {value}.")
@@ -0,0 +1,83 @@
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand, CommandError
+
+# Lo que carga un worker antes de atender: settings, apps, URLs y la aplicación.
+STARTUP_SCRIPT = """
+import django
+django.setup()
+from django.urls import get_resolver
+get_resolver().url_patterns
+import config.{entrypoint}
+"""
+
+# "import time:       self [us] | cumulative | imported package"
+LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+def parse_import_times(output):
+    """
+    Retorna [(módulo, self en µs, acumulado en µs, profundidad)] de la salida de `python -X importtime`.
+    """
+    modules = []
+    for line in output.splitlines():
+        match = LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+    return modules
+
+
+class Command(BaseCommand):
+    """
+    python manage.py import_times [--sort self|cumulative] [--limit N] [--prefix PAQUETE] [--packages] [--asgi]
+    Importa la aplicación en un proceso nuevo con `python -X importtime` y
+    muestra los módulos más lentos.
+    """
+
+    help = "Tiempo de importación por módulo al arrancar la aplicación en un proceso nuevo."
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sort", choices=("self", "cumulative"), default="cumulative", help="Orden (por defecto el tiempo acumulado)."
+        )
+        parser.add_argument("--limit", type=int, default=30, help="Filas a mostrar (por defecto 30).")
+        parser.add_argument("--prefix", help="Solo los módulos que empiezan por este prefijo (p. ej. tasks).")
+        parser.add_argument("--packages", action="store_true", help="Agrupa el tiempo propio por paquete de primer nivel.")
+        parser.add_argument("--asgi", action="store_true", help="Carga config.asgi en lugar de config.wsgi.")
+
+    def handle(self, *args, **options):
+        script = STARTUP_SCRIPT.format(entrypoint="asgi" if options["asgi"] else "wsgi")
+        env = {**os.environ, "DJANGO_SETTINGS_MODULE": os.environ.get("DJANGO_SETTINGS_MODULE", "config.settings")}
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", script], env=env, capture_output=True, text=True)
+        modules = parse_import_times(result.stderr)
+        if result.returncode or not modules:
+            raise CommandError(f"No se pudo importar la aplicación:\n{result.stderr[-2000:]}")
+
+        total = sum(self_us for _, self_us, _, _ in modules)
+        self.stdout.write(f"{len(modules)} módulos, {total / 1000:.1f} ms de importación")
+
+        if options["packages"]:
+            packages = defaultdict(int)
+            for name, self_us, _, _ in modules:
+                packages[name.split(".")[0]] += self_us
+            rows = sorted(packages.items(), key=lambda item: item[1], reverse=True)
+            if options["prefix"]:
+                rows = [row for row in rows if row[0].startswith(options["prefix"])]
+            self.stdout.write(f"{'propio ms':>10}  paquete")
+            for name, self_us in rows[: options["limit"]]:
+                self.stdout.write(f"{self_us / 1000:>10.1f}  {name}")
+            return
+
+        if options["prefix"]:
+            modules = [module for module in modules if module[0].startswith(options["prefix"])]
+        column = 1 if options["sort"] == "self" else 2
+        modules.sort(key=lambda module: module[column], reverse=True)
+        self.stdout.write(f"{'acum. ms':>10}  {'propio ms':>10}  módulo")
+        for name, self_us, cumulative_us, _ in modules[: options["limit"]]:
+            self.stdout.write(f"{cumulative_us / 1000:>10.1f}  {self_us / 1000:>10.1f}  {name}")
@@ -0,0 +1,28 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from tasks.models import TaskTombstone
+
+
+class Command(BaseCommand):
+    """
+    python manage.py purge_task_tombstones [--days N]
+    Elimina las lápidas fuera del horizonte de sincronización.
+    """
+
+    help = "Purga las lápidas de tareas eliminadas más antiguas que el horizonte de retención."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.TASKS_TOMBSTONE_RETENTION_DAYS,
+            help="Días de retención (por defecto TASKS_TOMBSTONE_RETENTION_DAYS).",
+        )
+
+    def handle(self, *args, **options):
+        purged = TaskTombstone.objects.purge(before=timezone.now() - timedelta(days=options["days"]))
+        self.stdout.write(self.style.SUCCESS(f"Lápidas purgadas: {purged}."))
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from tasks.models import TaskCounters
+
+
+class Command(BaseCommand):
+    """
+    python manage.py rebuild_task_counters [--user ID ...]
+    Reconcilia TaskCounters con la tabla de tareas (incluye el `tasks_count` del perfil).
+    """
+
+    help = "Reconstruye los contadores de tareas por usuario con una única consulta de agregación."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            action="append",
+            type=int,
+            dest="user_ids",
+            help="ID de usuario a reconciliar (se puede repetir). Por defecto, todos.",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000, help="Filas por upsert.")
+
+    def handle(self, *args, **options):
+        written = TaskCounters.objects.rebuild(user_ids=options["user_ids"], batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Contadores reconstruidos para {written} usuarios."))
@@ -0,0 +1,62 @@
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from config.profiling import ProfileStore, make_token
+
+
+class Command(BaseCommand):
+    """
+    python manage.py request_profiles list [--limit N]
+    python manage.py request_profiles dump ID [--collapsed]
+    python manage.py request_profiles token
+    Consulta los perfiles guardados por RequestProfilingMiddleware.
+    """
+
+    help = "Lista y vuelca los perfiles de peticiones, o genera un token para el encabezado X-Profile."
+
+    def add_arguments(self, parser):
+        subcommands = parser.add_subparsers(dest="subcommand", required=True)
+
+        list_parser = subcommands.add_parser("list", help="Perfiles guardados, del más reciente al más antiguo.")
+        list_parser.add_argument("--limit", type=int, default=20, help="Perfiles a mostrar (por defecto 20).")
+
+        dump_parser = subcommands.add_parser("dump", help="Vuelca un perfil en JSON.")
+        dump_parser.add_argument("profile_id", help="Id del perfil (encabezado X-Profile-Id).")
+        dump_parser.add_argument(
+            "--collapsed", action="store_true", help="Solo las pilas, en formato collapsed (flamegraph.pl, speedscope)."
+        )
+
+        subcommands.add_parser("token", help="Token firmado para el encabezado de perfilado.")
+
+    def handle(self, *args, **options):
+        getattr(self, f"handle_{options['subcommand']}")(options)
+
+    def handle_list(self, options):
+        profiles = ProfileStore().list()[: options["limit"]]
+        if not profiles:
+            self.stdout.write("No hay perfiles guardados.")
+            return
+        for profile in profiles:
+            path = profile["path"] + (f"?{profile['query_string']}" if profile["query_string"] else "")
+            self.stdout.write(
+                f"{profile['id']}  {profile['method']} {path}  {profile['status']}  {profile['duration_ms']} ms  "
+                f"{profile['samples']} muestras  {len(profile['queries'])} consultas  ({profile['trigger']})"
+            )
+
+    def handle_dump(self, options):
+        profile = ProfileStore().load(options["profile_id"])
+        if profile is None:
+            raise CommandError(f"No existe el perfil {options['profile_id']}.")
+        if options["collapsed"]:
+            for stack, count in profile["stacks"].items():
+                self.stdout.write(f"{stack} {count}")
+        else:
+            self.stdout.write(json.dumps(profile, indent=2, ensure_ascii=False))
+
+    def handle_token(self, options):
+        self.stdout.write(make_token())
+        self.stderr.write(
+            f"Enviar como '{settings.PROFILING['HEADER']}: <token>'; vale {settings.PROFILING['TOKEN_MAX_AGE']} segundos."
+        )
@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from tasks.seeding import DEFAULT_PASSWORD, TaskSeeder
+
+
+class Command(BaseCommand):
+    """
+    python manage.py seed_tasks [--users N] [--tasks M] [--seed S]
+    Genera N usuarios con M tareas cada uno para desarrollo y benchmarks.
+    """
+
+    help = "Genera usuarios y tareas sintéticos con bulk_create."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=10, help="Usuarios a generar (por defecto 10).")
+        parser.add_argument("--tasks", type=int, default=100, help="Tareas por usuario (por defecto 100).")
+        parser.add_argument("--prefix", default="seed", help="Prefijo de los nombres de usuario (por defecto seed).")
+        parser.add_argument("--seed", type=int, help="Semilla aleatoria, para repetir los mismos datos.")
+        parser.add_argument("--batch-size", type=int, default=2000, help="Filas por INSERT.")
+
+    def handle(self, *args, **options):
+        if options["users"] < 1 or options["tasks"] < 0:
+            raise CommandError("--users debe ser al menos 1 y --tasks no puede ser negativo.")
+
+        seeder = TaskSeeder(
+            options["users"],
+            options["tasks"],
+            prefix=options["prefix"],
+            seed=options["seed"],
+            batch_size=options["batch_size"],
+        )
+        users = seeder.run()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Generadas {len(users) * options['tasks']} tareas para {len(users)} usuarios "
+                f"({users[0].username}..{users[-1].username}, contraseña {DEFAULT_PASSWORD})."
+            )
+        )
@@ -0,0 +1,43 @@
+# Generated by Django 6.0.1 on 2026-10-18 12:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("tasks", "0003_task_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TaskCounters",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="task_counters",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Usuario",
+                    ),
+                ),
+                ("total", models.IntegerField(default=0, verbose_name="Total")),
+                ("pending", models.IntegerField(default=0, verbose_name="Pendientes")),
+                ("in_progress", models.IntegerField(default=0, verbose_name="En progreso")),
+                ("completed", models.IntegerField(default=0, verbose_name="Completadas")),
+                ("cancelled", models.IntegerField(default=0, verbose_name="Canceladas")),
+                ("high_priority", models.IntegerField(default=0, verbose_name="Prioridad alta")),
+                ("medium_priority", models.IntegerField(default=0, verbose_name="Prioridad media")),
+                ("low_priority", models.IntegerField(default=0, verbose_name="Prioridad baja")),
+            ],
+            options={
+                "verbose_name": "Contadores de tareas",
+                "verbose_name_plural": "Contadores de tareas",
+            },
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 6.0.1 on 2026-10-18 12:00
+
+from django.db import migrations
+
+INSTALL_SQL = [
+    "ALTER TABLE tasks_task ADD COLUMN IF NOT EXISTS search_vector tsvector",
+    """
+    CREATE OR REPLACE FUNCTION tasks_task_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('simple', coalesce(NEW.title, '')), 'A') ||
+            setweight(to_tsvector('simple', coalesce(NEW.description, '')), 'B');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS tasks_task_search_vector_trigger ON tasks_task",
+    """
+    CREATE TRIGGER tasks_task_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, description ON tasks_task
+    FOR EACH ROW EXECUTE FUNCTION tasks_task_search_vector_update()
+    """,
+    # Rellena las filas existentes una sola vez; el trigger se dispara al tocar `title`.
+    "UPDATE tasks_task SET title = title WHERE search_vector IS NULL",
+    "CREATE INDEX IF NOT EXISTS task_search_vector_gin ON tasks_task USING gin (search_vector)",
+]
+
+UNINSTALL_SQL = [
+    "DROP INDEX IF EXISTS task_search_vector_gin",
+    "DROP TRIGGER IF EXISTS tasks_task_search_vector_trigger ON tasks_task",
+    "DROP FUNCTION IF EXISTS tasks_task_search_vector_update()",
+    "ALTER TABLE tasks_task DROP COLUMN IF EXISTS search_vector",
+]
+
+
+def execute(schema_editor, statements):
+    # Solo PostgreSQL tiene tsvector; en otros motores la búsqueda usa el índice en memoria.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def install(apps, schema_editor):
+    execute(schema_editor, INSTALL_SQL)
+
+
+def uninstall(apps, schema_editor):
+    execute(schema_editor, UNINSTALL_SQL)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tasks", "0004_taskcounters"),
+    ]
+
+    operations = [
+        migrations.RunPython(install, uninstall),
+    ]
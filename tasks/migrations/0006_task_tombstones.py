@@ -0,0 +1,50 @@
+# Generated by Django 6.0.1 on 2026-10-18 12:00
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tasks", "0005_task_search_vector"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TaskTombstone",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("task_id", models.BigIntegerField(verbose_name="Tarea")),
+                ("deleted_at", models.DateTimeField(default=django.utils.timezone.now, verbose_name="Fecha de eliminación")),
+            ],
+            options={
+                "verbose_name": "Tarea eliminada",
+                "verbose_name_plural": "Tareas eliminadas",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(fields=["user", "updated_at", "id"], name="task_user_updated_idx"),
+        ),
+        migrations.AddField(
+            model_name="tasktombstone",
+            name="user",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="task_tombstones",
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="Usuario",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="tasktombstone",
+            index=models.Index(fields=["user", "deleted_at"], name="tombstone_user_deleted_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="tasktombstone",
+            index=models.Index(fields=["deleted_at"], name="tombstone_deleted_idx"),
+        ),
+    ]
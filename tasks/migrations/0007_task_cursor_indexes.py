@@ -0,0 +1,30 @@
+# Generated by Django 6.0.1 on 2026-10-18 12:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tasks", "0006_task_tombstones"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="task",
+            name="task_user_priority_idx",
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(fields=["user", "priority", "id"], name="task_user_priority_idx"),
+        ),
+        migrations.RemoveIndex(
+            model_name="task",
+            name="task_user_due_date_idx",
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(fields=["user", "due_date", "id"], name="task_user_due_date_idx"),
+        ),
+    ]
@@ -1,5 +1,11 @@
 from django.contrib.auth.models import User
-from django.db import models
+from django.db import connections, models, router, transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from asgiref.sync import sync_to_async
+
+from .signals import tasks_changed
 
 
 class Task(models.Model):
@@ -40,6 +46,349 @@ class Task(models.Model):
         ordering = ["-created_at"]
         verbose_name = "Tarea"
         verbose_name_plural = "Tareas"
+        # Indices alineados con las consultas de TaskViewSet: siempre se filtra por
+        # usuario y luego por estado/prioridad u ordenando por fecha.
+        indexes = [
+            models.Index(fields=["user", "-created_at"], name="task_user_created_idx"),
+            models.Index(fields=["user", "status", "-created_at"], name="task_user_status_created_idx"),
+            # Incluyen id para servir el orden (campo, id) de la paginación por cursor:
+            # priority y due_date (NULL) tienen grupos grandes de valores repetidos.
+            models.Index(fields=["user", "priority", "id"], name="task_user_priority_idx"),
+            models.Index(fields=["user", "due_date", "id"], name="task_user_due_date_idx"),
+            # Incluye id para servir el orden (updated_at, id) de /api/tasks/changes/.
+            models.Index(fields=["user", "updated_at", "id"], name="task_user_updated_idx"),
+        ]
 
     def __str__(self):
         return f"{self.title} - {self.get_status_display()}"
+
+    def _lock_stored_counter_state(self, using):
+        """
+        Bloquea la fila y retorna (user_id, status, priority) tal como están
+        guardados, o None si la tarea es nueva.
+        """
+        if self._state.adding or self.pk is None:
+            return None
+        return (
+            Task.objects.using(using)
+            .select_for_update()
+            .filter(pk=self.pk)
+            .values_list("user_id", "status", "priority")
+            .first()
+        )
+
+    def save(self, *args, **kwargs):
+        """
+        Guarda la tarea y actualiza los contadores del usuario en la misma
+        transacción. Si la tarea cambia de dueño, se descuenta del anterior.
+        """
+        using = kwargs.get("using") or router.db_for_write(Task, instance=self)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and not {"status", "priority", "user", "user_id"} & set(update_fields):
+            super().save(*args, **kwargs)
+            tasks_changed.send(sender=Task, user_id=self.user_id, using=using)
+            return
+
+        with transaction.atomic(using=using):
+            stored = self._lock_stored_counter_state(using)
+            super().save(*args, **kwargs)
+
+            previous_user_id, previous = (stored[0], stored[1:]) if stored else (self.user_id, None)
+            user_id, current = self.user_id, (self.status, self.priority)
+            if stored and update_fields is not None:
+                saved = set(update_fields)
+                if not {"user", "user_id"} & saved:
+                    user_id = previous_user_id
+                current = tuple(
+                    value if name in saved else stored_value
+                    for name, value, stored_value in zip(("status", "priority"), current, previous)
+                )
+            if user_id == previous_user_id:
+                TaskCounters.objects.record_change(user_id, previous, current, using=using)
+            else:
+                TaskCounters.objects.record_change(previous_user_id, previous, None, using=using)
+                TaskCounters.objects.record_change(user_id, None, current, using=using)
+
+    def delete(self, *args, **kwargs):
+        """
+        Elimina la tarea, descuenta sus contadores y deja una lápida para
+        /api/tasks/changes/, todo en la misma transacción.
+        """
+        using = kwargs.get("using") or router.db_for_write(Task, instance=self)
+        task_id = self.pk
+
+        with transaction.atomic(using=using):
+            stored = self._lock_stored_counter_state(using)
+            result = super().delete(*args, **kwargs)
+            if stored is None:
+                TaskCounters.objects.record_change(self.user_id, None, None, using=using)
+            else:
+                TaskCounters.objects.record_change(stored[0], stored[1:], None, using=using)
+                TaskTombstone.objects.using(using).create(user_id=stored[0], task_id=task_id)
+
+        return result
+
+
+class TaskCountersManager(models.Manager):
+    """
+    Manager con las operaciones de mantenimiento de TaskCounters.
+    """
+
+    def counter_fields(self, status, priority):
+        """
+        Retorna los contadores afectados por una tarea con `status` y `priority`.
+        """
+        return [field for field in ("total", status, f"{priority}_priority") if field in TaskCounters.COUNTER_FIELDS]
+
+    def record_change(self, user_id, previous, current, using=None):
+        """
+        Aplica la variación entre dos estados (status, priority) de una tarea.
+        `previous` es None al crear y `current` es None al eliminar.
+        """
+        self.record_changes(user_id, [(previous, current)], using=using)
+
+    def record_changes(self, user_id, changes, using=None):
+        """
+        Igual que `record_change` para varias tareas del mismo usuario, con un único UPDATE.
+        """
+        deltas = {}
+        for previous, current in changes:
+            for state, sign in ((previous, -1), (current, 1)):
+                if state is None:
+                    continue
+                for field in self.counter_fields(*state):
+                    deltas[field] = deltas.get(field, 0) + sign
+
+        self.apply_deltas(user_id, deltas, using=using)
+
+    def apply_deltas(self, user_id, deltas, using=None):
+        """
+        Suma `deltas` ({campo: variación}) a la fila del usuario con un único UPDATE.
+        Si la fila aún no existe se reconstruye a partir de las tareas, con el
+        usuario bloqueado (`_lock_user`) para que dos primeras escrituras
+        concurrentes no se pisen.
+
+        Todas las escrituras de tareas pasan por aquí, así que también envía
+        `tasks_changed` aunque los contadores no varíen (p. ej. al editar el título).
+        """
+        tasks_changed.send(sender=Task, user_id=user_id, using=using)
+        deltas = {field: delta for field, delta in deltas.items() if delta}
+        if not deltas:
+            return
+
+        manager = self.db_manager(using)
+        increments = {field: F(field) + delta for field, delta in deltas.items()}
+        if manager.filter(user_id=user_id).update(**increments):
+            return
+
+        db = manager._write_db()
+        with transaction.atomic(using=db, savepoint=False):
+            manager._lock_user(user_id, db)
+            # Quien tenía el bloqueo pudo crear la fila: su reconstrucción no
+            # incluye las tareas de esta transacción, así que se suman.
+            if not manager.filter(user_id=user_id).update(**increments):
+                manager.rebuild(user_ids=[user_id])
+
+    def deltas_for(self, queryset, sign=1):
+        """
+        Calcula, en una sola consulta, la variación por usuario que produce agregar
+        (sign=1) o quitar (sign=-1) las tareas de `queryset`.
+        """
+        rows = queryset.order_by().values("user_id").annotate(**self._aggregates(prefix=""))
+        return {row.pop("user_id"): {field: sign * value for field, value in row.items() if value} for row in rows}
+
+    def apply_many(self, deltas_by_user, using=None):
+        """
+        Aplica el resultado de `deltas_for` a cada usuario afectado.
+        """
+        for user_id, deltas in deltas_by_user.items():
+            self.apply_deltas(user_id, deltas, using=using)
+
+    def total_for(self, user_id):
+        """
+        Retorna el número de tareas del usuario sin escribir: la fila de contadores
+        si existe o, si no, un COUNT de sus tareas.
+        """
+        total = self.filter(user_id=user_id).values_list("total", flat=True).first()
+        if total is None:
+            total = Task.objects.using(self.db).filter(user_id=user_id).count()
+        return total
+
+    def for_user(self, user):
+        """
+        Retorna la fila de contadores del usuario, creándola si no existe.
+        """
+        counters = self.filter(user_id=user.pk).first()
+        if counters is None:
+            # La fila recién escrita puede no haber llegado a la réplica: se lee del primario.
+            db = self._write_db()
+            with transaction.atomic(using=db, savepoint=False):
+                self._lock_user(user.pk, db)
+                counters = self.db_manager(db).filter(user_id=user.pk).first()
+                if counters is None:
+                    self.rebuild(user_ids=[user.pk])
+                    counters = self.db_manager(db).get(user_id=user.pk)
+        return counters
+
+    async def afor_user(self, user):
+        """
+        Versión asíncrona de `for_user`.
+        """
+        counters = await self.filter(user_id=user.pk).afirst()
+        if counters is None:
+            counters = await sync_to_async(self.for_user)(user)
+        return counters
+
+    def rebuild(self, user_ids=None, batch_size=1000):
+        """
+        Recalcula los contadores desde la tabla de tareas con una única consulta de
+        agregación condicional y los escribe mediante upsert.
+        Retorna el número de filas escritas.
+
+        Las tareas se leen del mismo alias en el que se escribe (el primario
+        salvo `using`): una réplica atrasada dejaría contadores incorrectos.
+        """
+        db = self._write_db()
+        users = User.objects.using(db).order_by()
+        if user_ids is not None:
+            users = users.filter(pk__in=user_ids)
+        rows = users.values("id").annotate(**self._aggregates(prefix="tasks__"))
+
+        written = 0
+        batch = []
+        with transaction.atomic(using=db, savepoint=False):
+            for row in rows.iterator(chunk_size=batch_size):
+                batch.append(TaskCounters(user_id=row.pop("id"), **row))
+                if len(batch) >= batch_size:
+                    written += self._upsert(batch, db)
+                    batch = []
+            if batch:
+                written += self._upsert(batch, db)
+        return written
+
+    def _write_db(self):
+        return self._db or router.db_for_write(TaskCounters)
+
+    def _lock_user(self, user_id, db):
+        """
+        Bloquea la fila del usuario hasta el fin de la transacción. La fila de
+        contadores puede no existir aún, así que es lo que serializa las
+        reconstrucciones de un mismo usuario.
+        """
+        # FOR NO KEY UPDATE no espera al FOR KEY SHARE que el INSERT de una tarea
+        # toma sobre su usuario; FOR UPDATE haría que dos altas se bloquearan entre sí.
+        no_key = connections[db].features.has_select_for_no_key_update
+        list(User.objects.using(db).select_for_update(no_key=no_key).filter(pk=user_id).values_list("pk", flat=True))
+
+    def _upsert(self, batch, db):
+        self.db_manager(db).bulk_create(
+            batch,
+            update_conflicts=True,
+            unique_fields=["user"],
+            update_fields=list(TaskCounters.COUNTER_FIELDS),
+        )
+        return len(batch)
+
+    def _aggregates(self, prefix):
+        """
+        Expresiones Count(... filter=Q(...)) para cada contador.
+        """
+        pk = f"{prefix}id"
+        aggregates = {"total": Count(pk)}
+        for status, _ in Task.STATUS_CHOICES:
+            aggregates[status] = Count(pk, filter=Q(**{f"{prefix}status": status}))
+        for priority, _ in Task.PRIORITY_CHOICES:
+            aggregates[f"{priority}_priority"] = Count(pk, filter=Q(**{f"{prefix}priority": priority}))
+        return aggregates
+
+
+class TaskCounters(models.Model):
+    """
+    Contadores de tareas por usuario, mantenidos de forma incremental para servir
+    /api/tasks/stats/ leyendo una sola fila.
+    """
+
+    COUNTER_FIELDS = (
+        "total",
+        "pending",
+        "in_progress",
+        "completed",
+        "cancelled",
+        "high_priority",
+        "medium_priority",
+        "low_priority",
+    )
+
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="task_counters",
+        verbose_name="Usuario",
+    )
+    total = models.IntegerField(default=0, verbose_name="Total")
+    pending = models.IntegerField(default=0, verbose_name="Pendientes")
+    in_progress = models.IntegerField(default=0, verbose_name="En progreso")
+    completed = models.IntegerField(default=0, verbose_name="Completadas")
+    cancelled = models.IntegerField(default=0, verbose_name="Canceladas")
+    high_priority = models.IntegerField(default=0, verbose_name="Prioridad alta")
+    medium_priority = models.IntegerField(default=0, verbose_name="Prioridad media")
+    low_priority = models.IntegerField(default=0, verbose_name="Prioridad baja")
+
+    objects = TaskCountersManager()
+
+    class Meta:
+        verbose_name = "Contadores de tareas"
+        verbose_name_plural = "Contadores de tareas"
+
+    def __str__(self):
+        return f"{self.user} - {self.total} tareas"
+
+    def as_dict(self):
+        """
+        Retorna los contadores con el formato de /api/tasks/stats/.
+        """
+        return {field: getattr(self, field) for field in self.COUNTER_FIELDS}
+
+
+class TaskTombstoneManager(models.Manager):
+    def record_deletions(self, queryset):
+        """
+        Crea las lápidas de las tareas de `queryset`; llamar antes de eliminarlas.
+        """
+        rows = queryset.order_by().values_list("id", "user_id")
+        return self.db_manager(queryset.db).bulk_create(
+            TaskTombstone(task_id=task_id, user_id=user_id) for task_id, user_id in rows
+        )
+
+    def purge(self, before):
+        """
+        Elimina las lápidas anteriores a `before`. Retorna cuántas se eliminaron.
+        """
+        deleted, _ = self.filter(deleted_at__lt=before).delete()
+        return deleted
+
+
+class TaskTombstone(models.Model):
+    """
+    Registro mínimo de una tarea eliminada, para que la sincronización
+    incremental informe las eliminaciones. Se purgan pasado el horizonte de
+    retención (TASKS_TOMBSTONE_RETENTION_DAYS).
+    """
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="task_tombstones", verbose_name="Usuario")
+    task_id = models.BigIntegerField(verbose_name="Tarea")
+    deleted_at = models.DateTimeField(default=timezone.now, verbose_name="Fecha de eliminación")
+
+    objects = TaskTombstoneManager()
+
+    class Meta:
+        verbose_name = "Tarea eliminada"
+        verbose_name_plural = "Tareas eliminadas"
+        indexes = [
+            models.Index(fields=["user", "deleted_at"], name="tombstone_user_deleted_idx"),
+            models.Index(fields=["deleted_at"], name="tombstone_deleted_idx"),
+        ]
+
+    def __str__(self):
+        return f"Tarea {self.task_id} eliminada"
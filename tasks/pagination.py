@@ -0,0 +1,201 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+
+from django.core.exceptions import ValidationError
+from django.core.paginator import InvalidPage
+from django.db import connections
+from django.db.models import F, Q
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class TaskCursorPagination(BasePagination):
+    """
+    Paginación keyset para el listado de tareas.
+
+    Cada página se pide con `WHERE (clave, id) > (última clave, último id)` y
+    `LIMIT`, por lo que su costo no depende de la profundidad, y las páginas no se
+    desplazan cuando se insertan tareas en paralelo. A diferencia de
+    CursorPagination de DRF, el desempate por `id` es exacto (sin offset) y admite
+    columnas nulas como `due_date`.
+
+    El orden es el que aplicó OrderingFilter (un solo campo). Los NULL se ubican
+    donde los deja la base de datos de forma nativa para que los índices
+    (user, campo) sigan sirviendo el ORDER BY.
+    """
+
+    cursor_query_param = "cursor"
+    page_size = api_settings.PAGE_SIZE
+    invalid_cursor_message = "Cursor inválido."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.field_name, self.descending = self.get_ordering(queryset, view)
+        self.field = queryset.model._meta.get_field(self.field_name)
+        self.nulls_largest = connections[queryset.db].features.nulls_order_largest
+
+        cursor = self.decode_cursor(request)
+        reverse = bool(cursor and cursor["r"])
+        descending = self.descending != reverse
+
+        queryset = queryset.order_by(*self._order_by(descending))
+        if cursor is not None:
+            queryset = queryset.filter(self._after(cursor["k"], cursor["i"], descending))
+
+        rows = list(queryset[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        self.page = rows[: self.page_size]
+        if reverse:
+            self.page.reverse()
+
+        # Al avanzar siempre existe la página anterior (venimos de ella) y viceversa.
+        self.has_next = has_more if not reverse else True
+        self.has_previous = cursor is not None if not reverse else has_more
+        return self.page
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_ordering(self, queryset, view):
+        """
+        Retorna (campo, descendente) a partir del orden aplicado por OrderingFilter.
+        """
+        ordering = list(queryset.query.order_by) or list(getattr(view, "ordering", None) or queryset.model._meta.ordering)
+        allowed = set(getattr(view, "ordering_fields", None) or []) | {"id", "pk"}
+
+        term = ordering[0] if ordering else "-pk"
+        if not isinstance(term, str) or term.lstrip("-") not in allowed:
+            # Órdenes calculados (p. ej. relevancia) no tienen una clave estable.
+            term = (getattr(view, "ordering", None) or ["-pk"])[0]
+
+        name = term.lstrip("-")
+        return ("id" if name == "pk" else name), term.startswith("-")
+
+    def encode_cursor(self, row, reverse):
+        key = self._value(row, self.field_name)
+        payload = {
+            "o": self._ordering_term(),
+            "k": key.isoformat() if hasattr(key, "isoformat") else key,
+            "i": self._value(row, "id"),
+            "r": reverse,
+        }
+        encoded = urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+
+        try:
+            payload = json.loads(urlsafe_b64decode(encoded.encode()).decode())
+            if payload["o"] != self._ordering_term() or not isinstance(payload["i"], int):
+                raise ValueError
+            key = payload["k"]
+            if key is not None:
+                key = self.field.to_python(key)
+            return {"k": key, "i": payload["i"], "r": bool(payload["r"])}
+        except (TypeError, ValueError, KeyError, ValidationError, UnicodeDecodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def _ordering_term(self):
+        return f"-{self.field_name}" if self.descending else self.field_name
+
+    def _nulls_first(self, descending):
+        return descending == self.nulls_largest
+
+    def _order_by(self, descending):
+        key, pk = F(self.field_name), F("id")
+        if descending:
+            return key.desc(), pk.desc()
+        return key.asc(), pk.asc()
+
+    def _after(self, key, pk, descending):
+        """
+        Condición "(clave, id) viene después de (key, pk)" en el orden recorrido.
+        """
+        name = self.field_name
+        cmp = "lt" if descending else "gt"
+        bound = "lte" if descending else "gte"
+        null_after = self.field.null and not self._nulls_first(descending)
+
+        if key is None:
+            tail = Q(**{f"{name}__isnull": True, f"id__{cmp}": pk})
+            return tail if null_after else Q(**{f"{name}__isnull": False}) | tail
+
+        # La cota redundante permite al planificador usar el índice como rango.
+        condition = Q(**{f"{name}__{bound}": key}) & (Q(**{f"{name}__{cmp}": key}) | Q(**{name: key, f"id__{cmp}": pk}))
+        if null_after:
+            condition |= Q(**{f"{name}__isnull": True})
+        return condition
+
+    @staticmethod
+    def _value(row, name):
+        return row[name] if isinstance(row, dict) else getattr(row, name)
+
+
+def wants_cursor_pagination(request):
+    """
+    Indica si el cliente pidió el modo cursor (`?pagination=cursor` o un cursor).
+    """
+    params = request.query_params
+    return params.get("pagination") == "cursor" or TaskCursorPagination.cursor_query_param in params
+
+
+async def apaginate_queryset(paginator, queryset, request):
+    """
+    Equivalente asíncrono de PageNumberPagination.paginate_queryset: el conteo
+    y la página se leen con el ORM async. Deja `paginator` listo para
+    `get_paginated_response`.
+    """
+    page_size = paginator.get_page_size(request)
+    if not page_size:
+        return None
+
+    django_paginator = paginator.django_paginator_class(queryset, page_size)
+    # `count` es una cached_property; se asigna para que Paginator no lo calcule de forma síncrona.
+    django_paginator.count = await queryset.acount()
+    page_number = paginator.get_page_number(request, django_paginator)
+    try:
+        page = django_paginator.page(page_number)
+    except InvalidPage as exc:
+        raise NotFound(paginator.invalid_page_message.format(page_number=page_number, message=str(exc)))
+    page.object_list = [row async for row in page.object_list]
+
+    if django_paginator.num_pages > 1 and paginator.template is not None:
+        paginator.display_page_controls = True
+    paginator.page = page
+    paginator.request = request
+    return list(page)
@@ -0,0 +1,258 @@
+"""
+Búsqueda de texto completo para `?search=` en TaskViewSet.
+
+En PostgreSQL la tabla de tareas tiene una columna `search_vector` (tsvector)
+mantenida por un trigger y un índice GIN; las consultas usan `@@` y se ordenan
+con `ts_rank`. En otros motores (SQLite en tests y benchmarks locales) se usa un
+índice invertido en memoria, por usuario, que se reconstruye cuando cambian sus
+tareas.
+
+Ambos backends buscan por prefijo de palabra: `pan` encuentra "pan" y
+"panadería", y todas las palabras buscadas deben aparecer (en el título o en la
+descripción), igual que con SearchFilter. A diferencia de SearchFilter no
+encuentra subcadenas en medio de una palabra (`adería` no encuentra
+"panadería"). Con TASKS_SEARCH_SUBSTRING, TaskSearchFilter agrega en la misma
+consulta las coincidencias por subcadena de SearchFilter, con relevancia 0; esa
+condición no puede usar el índice y recorre todas las tareas del usuario.
+
+La migración 0005 crea la columna, el trigger y el índice y rellena las filas
+existentes; `install_search_on_migrate` solo los crea cuando las tablas se
+crearon sin migraciones.
+"""
+
+import operator
+import re
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from functools import reduce
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import Case, Count, FloatField, Max, Q, Value, When
+from django.db.models.expressions import RawSQL
+
+from rest_framework import filters
+
+from .models import Task
+
+SEARCH_CONFIG = "simple"
+TITLE_WEIGHT = 1.0
+DESCRIPTION_WEIGHT = 0.4
+
+WORD_RE = re.compile(r"\w+")
+
+INSTALL_SQL = [
+    "ALTER TABLE tasks_task ADD COLUMN IF NOT EXISTS search_vector tsvector",
+    f"""
+    CREATE OR REPLACE FUNCTION tasks_task_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(NEW.title, '')), 'A') ||
+            setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(NEW.description, '')), 'B');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS tasks_task_search_vector_trigger ON tasks_task",
+    """
+    CREATE TRIGGER tasks_task_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, description ON tasks_task
+    FOR EACH ROW EXECUTE FUNCTION tasks_task_search_vector_update()
+    """,
+    "CREATE INDEX IF NOT EXISTS task_search_vector_gin ON tasks_task USING gin (search_vector)",
+]
+
+
+def install_postgres_search(connection):
+    """
+    Crea (o actualiza) la columna, el trigger y el índice GIN. Es idempotente.
+    """
+    if connection.vendor != "postgresql":
+        return
+    with connection.cursor() as cursor:
+        for statement in INSTALL_SQL:
+            cursor.execute(statement)
+
+
+def install_search_on_migrate(sender, using, **kwargs):
+    """
+    Receptor de post_migrate: crea la columna y el trigger cuando las tablas se
+    crean sin migraciones (p. ej. `pytest --nomigrations`). Con migraciones ya
+    existen y no se hace nada.
+    """
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return
+    with connection.cursor() as cursor:
+        if Task._meta.db_table not in connection.introspection.table_names(cursor):
+            return
+        columns = {column.name for column in connection.introspection.get_table_description(cursor, Task._meta.db_table)}
+    if "search_vector" not in columns:
+        install_postgres_search(connection)
+
+
+def tokenize(text):
+    return WORD_RE.findall(text.lower())
+
+
+class PostgresSearchBackend:
+    """
+    Búsqueda sobre la columna `search_vector` con el índice GIN.
+    """
+
+    def search(self, queryset, words, user_id, also=None):
+        """
+        Retorna las tareas que coinciden por prefijo (o con la condición `also`),
+        anotadas con `search_rank` (0 si solo cumplen `also`).
+        """
+        from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVectorField
+
+        query = SearchQuery(" & ".join(f"{word}:*" for word in words), search_type="raw", config=SEARCH_CONFIG)
+        vector = RawSQL(f'"{Task._meta.db_table}"."search_vector"', [], output_field=SearchVectorField())
+        matches = Q(search_vector=query)
+        rank = Case(When(matches, then=SearchRank(vector, query)), default=Value(0.0), output_field=FloatField())
+        queryset = queryset.alias(search_vector=vector)
+        return queryset.filter(matches if also is None else matches | also).annotate(search_rank=rank)
+
+
+class _UserIndex:
+    """
+    Índice invertido de las tareas de un usuario: token -> {task_id: peso}.
+    """
+
+    def __init__(self, fingerprint, rows):
+        self.fingerprint = fingerprint
+        self.postings = {}
+        for task_id, title, description in rows:
+            for weight, text in ((TITLE_WEIGHT, title), (DESCRIPTION_WEIGHT, description)):
+                for token in tokenize(text or ""):
+                    documents = self.postings.setdefault(token, {})
+                    documents[task_id] = documents.get(task_id, 0.0) + weight
+        self.tokens = sorted(self.postings)
+
+    def match(self, word):
+        """
+        Retorna {task_id: puntaje} de los tokens que empiezan con `word`.
+        """
+        scores = {}
+        position = bisect_left(self.tokens, word)
+        while position < len(self.tokens) and self.tokens[position].startswith(word):
+            for task_id, weight in self.postings[self.tokens[position]].items():
+                scores[task_id] = scores.get(task_id, 0.0) + weight
+            position += 1
+        return scores
+
+
+class InvertedIndexSearchBackend:
+    """
+    Respaldo en Python puro para motores sin tsvector.
+
+    Cada proceso guarda un índice por usuario (hasta `max_users`, LRU). Antes de
+    usarlo se compara una huella barata de las tareas del usuario (conteo, máximo
+    id y máxima fecha de actualización); si cambió, el índice se reconstruye.
+    """
+
+    def __init__(self, max_users=128):
+        self.max_users = max_users
+        self._indexes = OrderedDict()
+        self._lock = threading.Lock()
+
+    def clear(self):
+        with self._lock:
+            self._indexes.clear()
+
+    def search(self, queryset, words, user_id, also=None):
+        """
+        Retorna las tareas que coinciden por prefijo (o con la condición `also`),
+        anotadas con `search_rank` (0 si solo cumplen `also`).
+        """
+        index = self.get_index(queryset.db, user_id)
+
+        scores = None
+        for word in words:
+            matches = index.match(word)
+            if scores is None:
+                scores = matches
+            else:
+                scores = {task_id: score + matches[task_id] for task_id, score in scores.items() if task_id in matches}
+            if not scores:
+                break
+
+        matches = Q(id__in=list(scores))
+        rank = Case(
+            *(When(id=task_id, then=Value(score)) for task_id, score in scores.items()),
+            default=Value(0.0),
+            output_field=FloatField(),
+        )
+        return queryset.filter(matches if also is None else matches | also).annotate(search_rank=rank)
+
+    def get_index(self, using, user_id):
+        tasks = Task.objects.using(using).filter(user_id=user_id).order_by()
+        fingerprint = tuple(tasks.aggregate(count=Count("id"), last_id=Max("id"), last_update=Max("updated_at")).values())
+        key = (using, user_id)
+
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is not None and index.fingerprint == fingerprint:
+                self._indexes.move_to_end(key)
+                return index
+
+        index = _UserIndex(fingerprint, tasks.values_list("id", "title", "description").iterator())
+        with self._lock:
+            self._indexes[key] = index
+            self._indexes.move_to_end(key)
+            while len(self._indexes) > self.max_users:
+                self._indexes.popitem(last=False)
+        return index
+
+
+postgres_backend = PostgresSearchBackend()
+inverted_index_backend = InvertedIndexSearchBackend()
+
+
+def get_search_backend(using):
+    if connections[using].vendor == "postgresql":
+        return postgres_backend
+    return inverted_index_backend
+
+
+class TaskSearchFilter(filters.SearchFilter):
+    """
+    Reemplazo de SearchFilter que usa el índice de texto completo.
+    Mantiene el parámetro `?search=` y anota `search_rank` con la relevancia.
+    Con TASKS_SEARCH_SUBSTRING incluye también las coincidencias por subcadena
+    de SearchFilter, con relevancia 0.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        words = [word for term in self.get_search_terms(request) for word in tokenize(term)]
+        if not words:
+            return queryset
+
+        substring = self.substring_condition(request, queryset, view) if settings.TASKS_SEARCH_SUBSTRING else None
+        return get_search_backend(queryset.db).search(queryset, words, request.user.pk, also=substring)
+
+    def substring_condition(self, request, queryset, view):
+        """
+        Condición de SearchFilter: cada término aparece (icontains) en algún campo.
+        """
+        lookups = [self.construct_search(str(field), queryset) for field in self.get_search_fields(view, request)]
+        if not lookups:
+            return None
+        conditions = (
+            reduce(operator.or_, (Q(**{lookup: term}) for lookup in lookups)) for term in self.get_search_terms(request)
+        )
+        return reduce(operator.and_, conditions)
+
+
+class RankedOrderingFilter(filters.OrderingFilter):
+    """
+    OrderingFilter que, al buscar sin `?ordering=` explícito, ordena por relevancia.
+    """
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        if not request.query_params.get(self.ordering_param) and "search_rank" in queryset.query.annotations:
+            return ["-search_rank", *(ordering or [])]
+        return ordering
@@ -0,0 +1,123 @@
+"""
+Datos sintéticos de tareas para desarrollo y benchmarks (`manage.py seed_tasks`).
+
+Las proporciones imitan una cuenta real: la mayoría de las tareas están
+pendientes o completadas, la prioridad media domina y cerca de un tercio no
+tiene fecha límite. Las abiertas vencen alrededor de hoy (algunas ya
+atrasadas) y las cerradas tienen la fecha en el pasado.
+"""
+
+import random
+from datetime import timedelta
+from itertools import islice
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import router, transaction
+from django.utils import timezone
+
+from .models import Task, TaskCounters
+from .signals import tasks_changed
+
+STATUS_WEIGHTS = {"pending": 35, "in_progress": 20, "completed": 40, "cancelled": 5}
+PRIORITY_WEIGHTS = {"low": 30, "medium": 50, "high": 20}
+NO_DUE_DATE_RATIO = 0.3
+NO_DESCRIPTION_RATIO = 0.4
+
+# Días respecto de hoy entre los que cae la fecha límite, según el estado.
+OPEN_DUE_DAYS = (-10, 45)
+CLOSED_DUE_DAYS = (-90, 0)
+
+VERBS = ["Revisar", "Preparar", "Enviar", "Actualizar", "Llamar a", "Comprar", "Corregir", "Planificar", "Documentar"]
+SUBJECTS = [
+    "el informe mensual",
+    "la factura del proveedor",
+    "el presupuesto",
+    "la reunión de equipo",
+    "el contrato",
+    "la presentación",
+    "los tests de integración",
+    "el inventario",
+    "la documentación de la API",
+    "el cliente",
+]
+DETAILS = [
+    "Pendiente de confirmar con el equipo.",
+    "Revisar los comentarios de la última versión.",
+    "Adjuntar los documentos antes del viernes.",
+    "Coordinar con finanzas.",
+    "Priorizar los puntos bloqueantes.",
+]
+
+DEFAULT_PASSWORD = "seedpass123"
+
+
+class TaskSeeder:
+    """
+    Genera `tasks_per_user` tareas para cada uno de `users` usuarios.
+
+    Los usuarios se llaman `<prefix>1`, `<prefix>2`, ...; los que ya existen se
+    reutilizan. Con la misma `seed` se obtienen los mismos datos.
+    """
+
+    def __init__(self, users, tasks_per_user, prefix="seed", seed=None, batch_size=2000, using=None):
+        self.users = users
+        self.tasks_per_user = tasks_per_user
+        self.prefix = prefix
+        self.random = random.Random(seed)
+        self.batch_size = batch_size
+        self.using = using or router.db_for_write(Task)
+        self.now = timezone.now()
+
+    def run(self):
+        """
+        Crea usuarios y tareas y retorna los usuarios, ordenados por nombre.
+        """
+        users = self.create_users()
+        tasks = (self.build(user) for user in users for _ in range(self.tasks_per_user))
+        while batch := list(islice(tasks, self.batch_size)):
+            with transaction.atomic(using=self.using):
+                Task.objects.using(self.using).bulk_create(batch)
+
+        user_ids = [user.pk for user in users]
+        TaskCounters.objects.db_manager(self.using).rebuild(user_ids=user_ids)
+        for user_id in user_ids:
+            tasks_changed.send(sender=Task, user_id=user_id, using=self.using)
+        return users
+
+    def create_users(self):
+        usernames = [f"{self.prefix}{number}" for number in range(1, self.users + 1)]
+        existing = set(User.objects.using(self.using).filter(username__in=usernames).values_list("username", flat=True))
+        # Un solo hash para todos: calcularlo por usuario dominaría el tiempo de carga.
+        password = make_password(DEFAULT_PASSWORD)
+        User.objects.using(self.using).bulk_create(
+            User(username=username, email=f"{username}@example.com", password=password)
+            for username in usernames
+            if username not in existing
+        )
+        return list(User.objects.using(self.using).filter(username__in=usernames).order_by("pk"))
+
+    def build(self, user):
+        status = self.choice(STATUS_WEIGHTS)
+        return Task(
+            title=f"{self.random.choice(VERBS)} {self.random.choice(SUBJECTS)}",
+            description=self.description(),
+            status=status,
+            priority=self.choice(PRIORITY_WEIGHTS),
+            due_date=self.due_date(status),
+            user=user,
+        )
+
+    def choice(self, weights):
+        return self.random.choices(list(weights), weights=list(weights.values()))[0]
+
+    def description(self):
+        if self.random.random() < NO_DESCRIPTION_RATIO:
+            return ""
+        return " ".join(self.random.sample(DETAILS, self.random.randint(1, 3)))
+
+    def due_date(self, status):
+        if self.random.random() < NO_DUE_DATE_RATIO:
+            return None
+        low, high = CLOSED_DUE_DAYS if status in ("completed", "cancelled") else OPEN_DUE_DAYS
+        return self.now + timedelta(days=self.random.uniform(low, high))
@@ -1,12 +1,17 @@
+from django.conf import settings
 from django.contrib.auth.models import User
+from django.db import transaction
 from django.utils import timezone
 
-from rest_framework import serializers
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
 
-from .models import Task
+from config.timing import TimedSerializerMixin, timed
 
+from .models import Task, TaskCounters
 
-class UserSerializer(serializers.ModelSerializer):
+
+class UserSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """
     Serializer para mostrar información básica del usuario.
     """
@@ -17,7 +22,75 @@ class UserSerializer(serializers.ModelSerializer):
         read_only_fields = ["id"]
 
 
-class TaskSerializer(serializers.ModelSerializer):
+class TaskBulkListSerializer(serializers.ListSerializer):
+    """
+    ListSerializer de TaskSerializer para escrituras masivas.
+
+    Para actualizar, `instance` es un dict {id: Task} cargado con una sola
+    consulta; cada elemento de la lista debe traer el `id` de una de esas tareas.
+    """
+
+    def run_child_validation(self, data):
+        if self.instance is not None:
+            task_id = data.get("id") if isinstance(data, dict) else None
+            if task_id not in self.instance:
+                raise serializers.ValidationError({"id": ["Tarea no encontrada."]})
+            if task_id in self._seen_ids:
+                raise serializers.ValidationError({"id": ["La tarea está repetida en el lote."]})
+            self._seen_ids.add(task_id)
+            self.child.instance = self.instance[task_id]
+            self.child.initial_data = data
+        return super().run_child_validation(data)
+
+    def to_internal_value(self, data):
+        self._seen_ids = set()
+        return super().to_internal_value(data)
+
+    def create(self, validated_data):
+        """
+        Inserta todas las tareas con bulk_create y ajusta los contadores una vez.
+        """
+        tasks = []
+        for attrs in validated_data:
+            attrs.pop("user_id", None)
+            tasks.append(Task(**attrs))
+
+        with transaction.atomic():
+            tasks = Task.objects.bulk_create(tasks)
+            for user_id in {task.user_id for task in tasks}:
+                TaskCounters.objects.record_changes(
+                    user_id, [(None, (task.status, task.priority)) for task in tasks if task.user_id == user_id]
+                )
+        return tasks
+
+    def update(self, instance, validated_data):
+        """
+        Aplica los cambios con un único bulk_update y ajusta los contadores una vez.
+        """
+        now = timezone.now()
+        tasks, changes, fields = [], [], {"updated_at"}
+
+        for data, attrs in zip(self.initial_data, validated_data):
+            attrs.pop("user_id", None)
+            task = instance[data["id"]]
+            previous = (task.status, task.priority)
+            for attr, value in attrs.items():
+                setattr(task, attr, value)
+            task.updated_at = now
+            fields.update(attrs)
+            tasks.append(task)
+            changes.append((previous, (task.status, task.priority)))
+
+        with transaction.atomic():
+            Task.objects.bulk_update(tasks, sorted(fields))
+            for user_id in {task.user_id for task in tasks}:
+                TaskCounters.objects.record_changes(
+                    user_id, [change for task, change in zip(tasks, changes) if task.user_id == user_id]
+                )
+        return tasks
+
+
+class TaskSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """
     Serializer para el modelo Task.
     """
@@ -40,6 +113,7 @@ class TaskSerializer(serializers.ModelSerializer):
             "user_id",
         ]
         read_only_fields = ["id", "created_at", "updated_at", "user"]
+        list_serializer_class = TaskBulkListSerializer
 
     def create(self, validated_data):
         """
@@ -63,7 +137,19 @@ class TaskSerializer(serializers.ModelSerializer):
         return value
 
 
-class TaskListSerializer(serializers.ModelSerializer):
+class TaskBulkDeleteSerializer(serializers.Serializer):
+    """
+    Serializer para DELETE /api/tasks/bulk/.
+    """
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False,
+        max_length=settings.TASKS_BULK_MAX_ITEMS,
+    )
+
+
+class TaskListSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """
     Serializer simplificado para listar tareas (sin detalles completos).
     """
@@ -85,3 +171,70 @@ class TaskListSerializer(serializers.ModelSerializer):
             "created_at",
             "user_username",
         ]
+
+    # Columnas que lee el camino rápido: las del listado más las claves de orden.
+    FAST_VALUES = (
+        "id",
+        "title",
+        "status",
+        "priority",
+        "due_date",
+        "created_at",
+        "updated_at",
+        "user__username",
+    )
+
+    @classmethod
+    def fast_values(cls, queryset):
+        """
+        Reduce el queryset a diccionarios con solo las columnas necesarias
+        (y el JOIN con auth_user para el username).
+        """
+        return queryset.values(*cls.FAST_VALUES)
+
+    @classmethod
+    @timed("serializer")
+    def fast_serialize(cls, rows):
+        """
+        Serializa filas de `fast_values` sin instanciar modelos ni campos DRF.
+        La salida es idéntica a `TaskListSerializer(tasks, many=True).data`.
+        """
+        status_display = {value: str(label) for value, label in Task.STATUS_CHOICES}
+        priority_display = {value: str(label) for value, label in Task.PRIORITY_CHOICES}
+        to_datetime = _datetime_representation()
+
+        return [
+            {
+                "id": row["id"],
+                "title": row["title"],
+                "status": row["status"],
+                "status_display": status_display.get(row["status"], row["status"]),
+                "priority": row["priority"],
+                "priority_display": priority_display.get(row["priority"], row["priority"]),
+                "due_date": to_datetime(row["due_date"]),
+                "created_at": to_datetime(row["created_at"]),
+                "user_username": row["user__username"],
+            }
+            for row in rows
+        ]
+
+
+def _datetime_representation():
+    """
+    Retorna una función equivalente a DateTimeField.to_representation para el
+    formato ISO 8601 con USE_TZ; en otra configuración delega en el campo de DRF.
+    """
+    if api_settings.DATETIME_FORMAT != ISO_8601 or not settings.USE_TZ:
+        return serializers.DateTimeField().to_representation
+
+    current_timezone = timezone.get_current_timezone()
+
+    def to_representation(value):
+        if not value:
+            return None
+        value = value.astimezone(current_timezone).isoformat()
+        if value.endswith("+00:00"):
+            value = value[:-6] + "Z"
+        return value
+
+    return to_representation
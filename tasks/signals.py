@@ -0,0 +1,4 @@
+from django.dispatch import Signal
+
+# Se envía cada vez que se escriben tareas de un usuario, con `user_id` y `using`.
+tasks_changed = Signal()
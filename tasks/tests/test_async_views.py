@@ -0,0 +1,131 @@
+import sys
+
+from django.db import connection
+from django.test import AsyncClient
+from django.test.utils import CaptureQueriesContext
+from django.urls import include, path
+
+import pytest
+from asgiref.sync import async_to_sync
+from rest_framework import status
+from rest_framework.routers import DefaultRouter
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from tasks.async_views import AsyncTaskViewSet
+from tasks.models import Task
+from users.tokens import ClaimsTokenObtainPairSerializer
+
+router = DefaultRouter()
+router.register(r"", AsyncTaskViewSet, basename="task")
+urlpatterns = [path("api/tasks/", include(router.urls))]
+
+URL = "/api/tasks/"
+
+
+@pytest.fixture(autouse=True)
+def async_urls(settings):
+    """Monta AsyncTaskViewSet en /api/tasks/ (como con TASKS_ASYNC_VIEWS)."""
+    settings.ROOT_URLCONF = sys.modules[__name__]
+
+
+@pytest.mark.django_db
+class TestAsyncTaskViewSet:
+    """Tests para AsyncTaskViewSet."""
+
+    def test_list(self, authenticated_client, task):
+        """Test que el listado async pagina y serializa como el síncrono."""
+        response = authenticated_client.get(URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == 1
+        assert response.data["results"][0]["id"] == task.id
+        assert response.data["results"][0]["status_display"] == "Pendiente"
+        assert response["ETag"]
+
+    def test_list_filters_and_pages(self, authenticated_client, user):
+        """Test que el listado async aplica filtros, orden y páginas."""
+        Task.objects.bulk_create(Task(title=f"T{i}", status="pending" if i % 2 else "completed", user=user) for i in range(25))
+
+        response = authenticated_client.get(URL, {"status": "pending", "ordering": "created_at", "page": 2})
+
+        assert response.data["count"] == 12
+        assert len(response.data["results"]) == 2
+        assert response.data["next"] is None
+        assert authenticated_client.get(URL, {"page": 9}).status_code == status.HTTP_404_NOT_FOUND
+
+    def test_list_cursor_falls_back(self, authenticated_client, task):
+        """Test que la paginación por cursor usa la implementación síncrona."""
+        response = authenticated_client.get(URL, {"pagination": "cursor"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.data["results"]] == [task.id]
+
+    def test_retrieve_and_not_modified(self, authenticated_client, task):
+        """Test que el detalle async responde 304 con una ETag vigente."""
+        response = authenticated_client.get(f"{URL}{task.id}/")
+        assert response.data["title"] == task.title
+
+        again = authenticated_client.get(f"{URL}{task.id}/", HTTP_IF_NONE_MATCH=response["ETag"])
+        assert again.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_other_users_task_not_found(self, authenticated_client, other_user):
+        """Test que no se pueden ver tareas de otro usuario."""
+        other_task = Task.objects.create(title="Ajena", user=other_user)
+
+        assert authenticated_client.get(f"{URL}{other_task.id}/").status_code == status.HTTP_404_NOT_FOUND
+        assert authenticated_client.get(f"{URL}abc/").status_code == status.HTTP_404_NOT_FOUND
+
+    def test_create_complete_and_stats(self, authenticated_client, user):
+        """Test que crear y completar actualizan las estadísticas."""
+        created = authenticated_client.post(URL, {"title": "Nueva", "priority": "high"}, format="json")
+        assert created.status_code == status.HTTP_201_CREATED
+        assert created.data["user"]["id"] == user.id
+
+        completed = authenticated_client.post(f"{URL}{created.data['id']}/complete/")
+        assert completed.data["status"] == "completed"
+
+        stats = authenticated_client.get(f"{URL}stats/").data
+        assert stats["total"] == 1
+        assert stats["completed"] == 1
+
+    def test_pending_and_completed_cached(self, authenticated_client, task):
+        """Test que pending usa la caché de respuestas."""
+        first = authenticated_client.get(f"{URL}pending/")
+        second = authenticated_client.get(f"{URL}pending/")
+
+        assert [item["id"] for item in first.data] == [task.id]
+        assert (first["X-Cache"], second["X-Cache"]) == ("MISS", "HIT")
+        assert authenticated_client.get(f"{URL}completed/").data == []
+
+    def test_sync_actions_fall_back(self, authenticated_client, task):
+        """Test que las acciones sin versión async siguen funcionando."""
+        updated = authenticated_client.patch(f"{URL}{task.id}/", {"title": "Editada"}, format="json")
+        deleted = authenticated_client.delete(f"{URL}{task.id}/")
+
+        assert updated.data["title"] == "Editada"
+        assert deleted.status_code == status.HTTP_204_NO_CONTENT
+
+    def test_unauthenticated(self, api_client):
+        """Test que sin token la respuesta es 401."""
+        assert api_client.get(URL).status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_stateless_skips_user_query(self, settings, api_client, user, task):
+        """Test que la autenticación async sin estado no consulta auth_user."""
+        settings.JWT_STATELESS = True
+        token = ClaimsTokenObtainPairSerializer.get_token(user).access_token
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get(f"{URL}{task.id}/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [q for q in context.captured_queries if 'FROM "auth_user" WHERE' in q["sql"]] == []
+
+    def test_asgi_client(self, user, task):
+        """Test que la vista responde a través del handler ASGI."""
+        headers = {"Authorization": f"Bearer {RefreshToken.for_user(user).access_token}"}
+
+        response = async_to_sync(AsyncClient().get)(f"{URL}{task.id}/", headers=headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["id"] == task.id
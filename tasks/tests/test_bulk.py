@@ -0,0 +1,160 @@
+from datetime import timedelta
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+import pytest
+from rest_framework import status
+
+from tasks.models import Task, TaskCounters
+
+URL = "/api/tasks/bulk/"
+
+
+@pytest.mark.django_db
+class TestBulkCreate:
+    """Tests para POST /api/tasks/bulk/."""
+
+    def test_creates_all(self, authenticated_client, user):
+        """Test crear varias tareas en una petición."""
+        payload = [{"title": f"Tarea {i}", "priority": "high"} for i in range(5)]
+
+        response = authenticated_client.post(URL, payload, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert [item["title"] for item in response.data] == [f"Tarea {i}" for i in range(5)]
+        assert all(item["id"] for item in response.data)
+        assert Task.objects.filter(user=user).count() == 5
+        assert TaskCounters.objects.get(user=user).high_priority == 5
+
+    def test_single_insert(self, authenticated_client):
+        """Test que se usa un solo INSERT para todo el lote."""
+        payload = [{"title": f"Tarea {i}"} for i in range(20)]
+
+        with CaptureQueriesContext(connection) as context:
+            authenticated_client.post(URL, payload, format="json")
+
+        inserts = [q for q in context.captured_queries if q["sql"].startswith('INSERT INTO "tasks_task"')]
+        assert len(inserts) == 1
+
+    def test_errors_per_item(self, authenticated_client, user):
+        """Test que un elemento inválido reporta su índice y no se crea nada."""
+        payload = [
+            {"title": "Válida"},
+            {"description": "Sin título"},
+            {"title": "Vencida", "due_date": (timezone.now() - timedelta(days=1)).isoformat()},
+        ]
+
+        response = authenticated_client.post(URL, payload, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert [error["index"] for error in response.data["errors"]] == [1, 2]
+        assert "title" in response.data["errors"][0]["errors"]
+        assert "due_date" in response.data["errors"][1]["errors"]
+        assert not Task.objects.filter(user=user).exists()
+
+    def test_rejects_non_list(self, authenticated_client):
+        """Test que el cuerpo debe ser una lista no vacía."""
+        assert authenticated_client.post(URL, {"title": "x"}, format="json").status_code == status.HTTP_400_BAD_REQUEST
+        assert authenticated_client.post(URL, [], format="json").status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_max_items(self, authenticated_client, settings):
+        """Test que se respeta TASKS_BULK_MAX_ITEMS."""
+        settings.TASKS_BULK_MAX_ITEMS = 2
+
+        response = authenticated_client.post(URL, [{"title": "x"}] * 3, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "non_field_errors" in response.data
+
+
+@pytest.mark.django_db
+class TestBulkUpdate:
+    """Tests para PATCH /api/tasks/bulk/."""
+
+    def test_updates_all(self, authenticated_client, user):
+        """Test actualizar varias tareas con un solo UPDATE."""
+        tasks = [Task.objects.create(title=f"T{i}", user=user) for i in range(3)]
+        payload = [{"id": task.id, "status": "completed"} for task in tasks]
+
+        with CaptureQueriesContext(connection) as context:
+            response = authenticated_client.patch(URL, payload, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["status"] for item in response.data] == ["completed"] * 3
+        assert Task.objects.filter(user=user, status="completed").count() == 3
+        counters = TaskCounters.objects.get(user=user)
+        assert (counters.pending, counters.completed) == (0, 3)
+        updates = [q for q in context.captured_queries if q["sql"].startswith('UPDATE "tasks_task"')]
+        assert len(updates) == 1
+
+    def test_touches_updated_at(self, authenticated_client, task):
+        """Test que bulk_update actualiza updated_at."""
+        before = task.updated_at
+
+        authenticated_client.patch(URL, [{"id": task.id, "title": "Nuevo"}], format="json")
+
+        task.refresh_from_db()
+        assert task.title == "Nuevo"
+        assert task.updated_at > before
+
+    def test_ownership_single_query(self, authenticated_client, user, other_user):
+        """Test que tareas ajenas o inexistentes se reportan y no se modifica nada."""
+        own = Task.objects.create(title="Propia", user=user)
+        foreign = Task.objects.create(title="Ajena", user=other_user)
+        payload = [{"id": own.id, "title": "X"}, {"id": foreign.id, "title": "X"}, {"id": 999999, "title": "X"}]
+
+        with CaptureQueriesContext(connection) as context:
+            response = authenticated_client.patch(URL, payload, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert [error["index"] for error in response.data["errors"]] == [1, 2]
+        own.refresh_from_db()
+        foreign.refresh_from_db()
+        assert (own.title, foreign.title) == ("Propia", "Ajena")
+        selects = [q for q in context.captured_queries if 'FROM "tasks_task"' in q["sql"]]
+        assert len(selects) == 1
+
+    def test_duplicate_ids(self, authenticated_client, task):
+        """Test que un id repetido en el lote es un error."""
+        payload = [{"id": task.id, "title": "A"}, {"id": task.id, "title": "B"}]
+
+        response = authenticated_client.patch(URL, payload, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["errors"][0]["index"] == 1
+
+
+@pytest.mark.django_db
+class TestBulkDelete:
+    """Tests para DELETE /api/tasks/bulk/."""
+
+    def test_deletes_all(self, authenticated_client, user):
+        """Test eliminar varias tareas con un solo DELETE."""
+        tasks = [Task.objects.create(title=f"T{i}", status="completed", user=user) for i in range(3)]
+
+        response = authenticated_client.delete(URL, {"ids": [task.id for task in tasks]}, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {"deleted": 3}
+        assert not Task.objects.filter(user=user).exists()
+        counters = TaskCounters.objects.get(user=user)
+        assert (counters.total, counters.completed) == (0, 0)
+
+    def test_foreign_ids_rejected(self, authenticated_client, user, other_user):
+        """Test que no se pueden eliminar tareas ajenas."""
+        own = Task.objects.create(title="Propia", user=user)
+        foreign = Task.objects.create(title="Ajena", user=other_user)
+
+        response = authenticated_client.delete(URL, {"ids": [own.id, foreign.id]}, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["errors"] == [{"index": 1, "id": foreign.id, "errors": {"id": ["Tarea no encontrada."]}}]
+        assert Task.objects.count() == 2
+
+    def test_invalid_body(self, authenticated_client):
+        """Test que `ids` es obligatorio."""
+        response = authenticated_client.delete(URL, {}, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,193 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+import pytest
+from rest_framework import status
+
+from config.cache import LRUCache
+from tasks.cache import response_cache
+from tasks.models import Task
+
+URL = "/api/tasks/"
+
+
+def _task_queries(client, url, params=None):
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url, params or {})
+    queries = [q for q in context.captured_queries if 'FROM "tasks_task"' in q["sql"]]
+    return response, queries
+
+
+class TestLRUCache:
+    """Tests para la LRU acotada de la capa local."""
+
+    def test_evicts_least_recently_used(self):
+        """Test que al superar el límite se descarta la entrada menos usada."""
+        lru = LRUCache(max_entries=2)
+        lru.set("a", 1)
+        lru.set("b", 2)
+        lru.get("a")
+        lru.set("c", 3)
+
+        assert lru.get("b") is None
+        assert lru.get("a") == 1
+        assert lru.stats()["evictions"] == 1
+
+    def test_ttl_expires(self, monkeypatch):
+        """Test que las entradas vencidas cuentan como fallo."""
+        lru = LRUCache(max_entries=2, ttl=10)
+        lru.set("a", 1)
+        monkeypatch.setattr("config.cache.time.monotonic", lambda: float("inf"))
+
+        assert lru.get("a") is None
+        assert lru.stats()["misses"] == 1
+
+
+@pytest.mark.django_db
+class TestTaskResponseCache:
+    """Tests para la caché de respuestas de lectura de tareas."""
+
+    @pytest.mark.parametrize("url", [URL, f"{URL}pending/", f"{URL}completed/"])
+    def test_second_read_is_served_from_cache(self, authenticated_client, task, url):
+        """Test que la segunda lectura no consulta la tabla de tareas."""
+        first, _ = _task_queries(authenticated_client, url)
+        second, queries = _task_queries(authenticated_client, url)
+
+        assert first["X-Cache"] == "MISS"
+        assert second["X-Cache"] == "HIT"
+        assert queries == []
+        assert second.data == first.data
+
+    def test_query_params_are_normalized(self, authenticated_client, task):
+        """Test que el orden de los parámetros y los valores vacíos no cambian la clave."""
+        authenticated_client.get(f"{URL}?status=pending&priority=medium&search=")
+
+        response = authenticated_client.get(f"{URL}?priority=medium&status=pending")
+
+        assert response["X-Cache"] == "HIT"
+
+    def test_different_params_are_cached_separately(self, authenticated_client, task):
+        """Test que filtros distintos no comparten entrada."""
+        authenticated_client.get(URL, {"status": "pending"})
+
+        response = authenticated_client.get(URL, {"status": "completed"})
+
+        assert response["X-Cache"] == "MISS"
+        assert response.data["count"] == 0
+
+    def test_isolated_per_user(self, authenticated_client, api_client, task, other_user):
+        """Test que un usuario nunca recibe la respuesta en caché de otro."""
+        authenticated_client.get(URL)
+        api_client.force_authenticate(user=other_user)
+
+        response = api_client.get(URL)
+
+        assert response["X-Cache"] == "MISS"
+        assert response.data["count"] == 0
+
+    def test_invalidated_by_api_writes(self, authenticated_client, task, task_data):
+        """Test que crear, editar, completar y eliminar invalidan el listado."""
+        authenticated_client.get(URL)
+        authenticated_client.post(URL, task_data, format="json")
+        assert authenticated_client.get(URL).data["count"] == 2
+
+        authenticated_client.patch(f"{URL}{task.id}/", {"title": "Editada"}, format="json")
+        titles = [item["title"] for item in authenticated_client.get(URL).data["results"]]
+        assert "Editada" in titles
+
+        authenticated_client.post(f"{URL}{task.id}/complete/")
+        assert authenticated_client.get(f"{URL}completed/").data[0]["id"] == task.id
+
+        authenticated_client.delete(f"{URL}{task.id}/")
+        assert authenticated_client.get(f"{URL}completed/").data == []
+
+    def test_invalidated_by_bulk_writes(self, authenticated_client, task):
+        """Test que los endpoints en lote también invalidan el listado."""
+        authenticated_client.get(URL)
+
+        authenticated_client.post(f"{URL}bulk/", [{"title": "A"}, {"title": "B"}], format="json")
+        assert authenticated_client.get(URL).data["count"] == 3
+
+        authenticated_client.patch(f"{URL}bulk/", [{"id": task.id, "title": "Cambiada"}], format="json")
+        assert "Cambiada" in [item["title"] for item in authenticated_client.get(URL).data["results"]]
+
+        authenticated_client.delete(f"{URL}bulk/", {"ids": [task.id]}, format="json")
+        assert authenticated_client.get(URL).data["count"] == 2
+
+    def test_invalidated_by_update_fields_save(self, authenticated_client, task):
+        """Test que save(update_fields=...) sin tocar contadores también invalida."""
+        authenticated_client.get(URL)
+        task.title = "Solo título"
+        task.save(update_fields=["title", "updated_at"])
+
+        response = authenticated_client.get(URL)
+
+        assert response["X-Cache"] == "MISS"
+        assert response.data["results"][0]["title"] == "Solo título"
+
+    def test_invalidated_by_username_change(self, authenticated_client, task, user):
+        """Test que cambiar el username invalida el listado y su ETag."""
+        first = authenticated_client.get(URL)
+        user.username = "renombrado"
+        user.save()
+
+        response = authenticated_client.get(URL, HTTP_IF_NONE_MATCH=first["ETag"])
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["X-Cache"] == "MISS"
+        assert response["ETag"] != first["ETag"]
+        assert response.data["results"][0]["user_username"] == "renombrado"
+
+    def test_password_change_keeps_cache(self, authenticated_client, task, user):
+        """Test que un save(update_fields=["password"]) no invalida las respuestas."""
+        authenticated_client.get(URL)
+        user.set_password("OtraClave123!")
+        user.save(update_fields=["password"])
+
+        assert authenticated_client.get(URL)["X-Cache"] == "HIT"
+
+    def test_other_user_writes_keep_cache(self, authenticated_client, task, other_user):
+        """Test que escribir tareas de otro usuario no invalida la caché propia."""
+        authenticated_client.get(URL)
+        Task.objects.create(title="Ajena", user=other_user)
+
+        assert authenticated_client.get(URL)["X-Cache"] == "HIT"
+
+    def test_shared_tier_serves_other_processes(self, authenticated_client, task):
+        """Test que sin la capa local la respuesta se recupera de la compartida."""
+        authenticated_client.get(URL)
+        response_cache.local.clear()
+
+        response = authenticated_client.get(URL)
+
+        assert response["X-Cache"] == "HIT"
+        assert response_cache.stats()["shared_hits"] == 1
+
+    def test_stats_counters(self, authenticated_client, task):
+        """Test que se cuentan aciertos y fallos."""
+        authenticated_client.get(URL)
+        authenticated_client.get(URL)
+        authenticated_client.get(URL)
+
+        stats = response_cache.stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+
+    def test_errors_are_not_cached(self, authenticated_client, task):
+        """Test que las respuestas de error no se guardan."""
+        authenticated_client.get(URL, {"cursor": "basura"})
+
+        response = authenticated_client.get(URL, {"cursor": "basura"})
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response_cache.stats()["hits"] == 0
+
+    def test_disabled(self, authenticated_client, task, settings):
+        """Test que con ENABLED=False no se usa la caché."""
+        settings.TASKS_RESPONSE_CACHE = {**settings.TASKS_RESPONSE_CACHE, "ENABLED": False}
+        authenticated_client.get(URL)
+
+        response = authenticated_client.get(URL)
+
+        assert "X-Cache" not in response
+        assert response_cache.stats()["hits"] == 0
@@ -0,0 +1,156 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils.http import http_date
+
+import pytest
+from rest_framework import status
+
+from tasks.cache import response_cache
+from tasks.models import Task
+
+URL = "/api/tasks/"
+
+
+@pytest.fixture(autouse=True)
+def without_response_cache(settings):
+    settings.TASKS_RESPONSE_CACHE = {**settings.TASKS_RESPONSE_CACHE, "ENABLED": False}
+
+
+@pytest.mark.django_db
+class TestConditionalList:
+    """Tests para ETag/Last-Modified en los listados."""
+
+    @pytest.mark.parametrize("url", [URL, f"{URL}pending/", f"{URL}completed/"])
+    def test_not_modified(self, authenticated_client, task, url):
+        """Test que If-None-Match con la ETag vigente responde 304 sin cuerpo."""
+        first = authenticated_client.get(url)
+
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == first["ETag"]
+        assert not response.content
+
+    def test_not_modified_skips_row_query(self, authenticated_client, task):
+        """Test que el 304 se decide con la agregación, sin leer ni serializar filas."""
+        etag = authenticated_client.get(URL)["ETag"]
+
+        with CaptureQueriesContext(connection) as context:
+            authenticated_client.get(URL, HTTP_IF_NONE_MATCH=etag)
+
+        task_queries = [q["sql"] for q in context.captured_queries if 'FROM "tasks_task"' in q["sql"]]
+        assert len(task_queries) == 1
+        assert "MAX(" in task_queries[0].upper()
+
+    def test_etag_changes_on_update_create_and_delete(self, authenticated_client, task, task_data):
+        """Test que editar, crear o eliminar tareas cambia la ETag del listado."""
+        etags = [authenticated_client.get(URL)["ETag"]]
+
+        authenticated_client.patch(f"{URL}{task.id}/", {"title": "Editada"}, format="json")
+        etags.append(authenticated_client.get(URL)["ETag"])
+        created = authenticated_client.post(URL, task_data, format="json")
+        etags.append(authenticated_client.get(URL)["ETag"])
+        authenticated_client.delete(f"{URL}{created.data['id']}/")
+        etags.append(authenticated_client.get(URL)["ETag"])
+
+        assert len(set(etags[:3])) == 3
+        # Tras eliminar la tarea creada el listado vuelve a ser el de antes.
+        assert etags[3] == etags[1]
+
+    def test_etag_depends_on_query_params(self, authenticated_client, task):
+        """Test que distintos filtros o páginas tienen ETag distinta."""
+        etag = authenticated_client.get(URL)["ETag"]
+
+        response = authenticated_client.get(URL, {"status": "pending"}, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] != etag
+
+    def test_no_last_modified(self, authenticated_client, user, task):
+        """Test que el listado no usa Last-Modified: eliminar una tarea antigua no mueve Max(updated_at)."""
+        newest = Task.objects.create(title="Nueva", user=user)
+        response = authenticated_client.get(URL)
+        assert "ETag" in response
+        assert "Last-Modified" not in response
+
+        authenticated_client.delete(f"{URL}{task.id}/")
+        since = http_date(int(newest.updated_at.timestamp()) + 60)
+        after_delete = authenticated_client.get(URL, HTTP_IF_MODIFIED_SINCE=since)
+        not_matching = authenticated_client.get(URL, HTTP_IF_NONE_MATCH=response["ETag"])
+
+        assert after_delete.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in after_delete.data["results"]] == [newest.id]
+        assert not_matching.status_code == status.HTTP_200_OK
+
+    def test_not_modified_from_response_cache(self, authenticated_client, task, settings):
+        """Test que con la caché de respuestas el 304 no consulta la base de datos."""
+        settings.TASKS_RESPONSE_CACHE = {**settings.TASKS_RESPONSE_CACHE, "ENABLED": True}
+        etag = authenticated_client.get(URL)["ETag"]
+
+        with CaptureQueriesContext(connection) as context:
+            response = authenticated_client.get(URL, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["X-Cache"] == "HIT"
+        assert not [q for q in context.captured_queries if 'FROM "tasks_task"' in q["sql"]]
+        assert response_cache.stats()["hits"] == 1
+
+
+@pytest.mark.django_db
+class TestConditionalDetail:
+    """Tests para ETag/Last-Modified e If-Match en el detalle."""
+
+    def test_not_modified(self, authenticated_client, task):
+        """Test que el detalle responde 304 con la ETag vigente."""
+        etag = authenticated_client.get(f"{URL}{task.id}/")["ETag"]
+
+        response = authenticated_client.get(f"{URL}{task.id}/", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_etag_changes_after_update(self, authenticated_client, task):
+        """Test que la respuesta de PATCH trae la nueva ETag."""
+        etag = authenticated_client.get(f"{URL}{task.id}/")["ETag"]
+
+        response = authenticated_client.patch(f"{URL}{task.id}/", {"title": "Nueva"}, format="json")
+
+        assert response["ETag"] != etag
+        assert authenticated_client.get(f"{URL}{task.id}/", HTTP_IF_NONE_MATCH=response["ETag"]).status_code == 304
+
+    @pytest.mark.parametrize("method", ["put", "patch"])
+    def test_if_match_current(self, authenticated_client, task, task_data, method):
+        """Test que If-Match con la ETag vigente permite la escritura."""
+        etag = authenticated_client.get(f"{URL}{task.id}/")["ETag"]
+
+        response = getattr(authenticated_client, method)(f"{URL}{task.id}/", task_data, format="json", HTTP_IF_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        task.refresh_from_db()
+        assert task.title == task_data["title"]
+
+    @pytest.mark.parametrize("method", ["put", "patch"])
+    def test_if_match_stale(self, authenticated_client, task, task_data, method):
+        """Test que If-Match con una ETag vieja responde 412 y no guarda."""
+        etag = authenticated_client.get(f"{URL}{task.id}/")["ETag"]
+        Task.objects.get(pk=task.pk).save()
+
+        response = getattr(authenticated_client, method)(f"{URL}{task.id}/", task_data, format="json", HTTP_IF_MATCH=etag)
+
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+        task.refresh_from_db()
+        assert task.title == "Test Task"
+
+    def test_without_if_match(self, authenticated_client, task):
+        """Test que sin If-Match la actualización funciona como antes."""
+        response = authenticated_client.patch(f"{URL}{task.id}/", {"title": "Libre"}, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["title"] == "Libre"
+
+    def test_other_user_task_not_found(self, api_client, task, other_user):
+        """Test que las tareas ajenas siguen respondiendo 404."""
+        api_client.force_authenticate(user=other_user)
+
+        response = api_client.patch(f"{URL}{task.id}/", {"title": "X"}, format="json", HTTP_IF_MATCH='"x"')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,147 @@
+from io import StringIO
+
+from django.contrib import admin
+from django.core.management import call_command
+
+import pytest
+from rest_framework import status
+
+from tasks.models import Task, TaskCounters, TaskCountersManager
+
+
+def _counters(user):
+    return TaskCounters.objects.get(user=user).as_dict()
+
+
+@pytest.mark.django_db
+class TestTaskCounters:
+    """Tests para el mantenimiento incremental de TaskCounters."""
+
+    def test_create_increments(self, user):
+        """Test que crear tareas incrementa los contadores."""
+        Task.objects.create(title="T1", status="pending", priority="high", user=user)
+        Task.objects.create(title="T2", status="completed", priority="low", user=user)
+
+        counters = _counters(user)
+        assert counters["total"] == 2
+        assert counters["pending"] == 1
+        assert counters["completed"] == 1
+        assert counters["high_priority"] == 1
+        assert counters["low_priority"] == 1
+
+    def test_update_moves_counts(self, task):
+        """Test que cambiar estado y prioridad mueve los conteos."""
+        task.status = "in_progress"
+        task.priority = "high"
+        task.save()
+
+        counters = _counters(task.user)
+        assert counters["total"] == 1
+        assert counters["pending"] == 0
+        assert counters["in_progress"] == 1
+        assert counters["medium_priority"] == 0
+        assert counters["high_priority"] == 1
+
+    def test_update_from_stale_instance(self, task):
+        """Test que una instancia desactualizada no duplica el cambio."""
+        stale = Task.objects.get(pk=task.pk)
+        task.status = "completed"
+        task.save()
+
+        stale.status = "completed"
+        stale.save()
+
+        counters = _counters(task.user)
+        assert counters["pending"] == 0
+        assert counters["completed"] == 1
+
+    def test_delete_decrements(self, task):
+        """Test que eliminar una tarea descuenta los contadores."""
+        user = task.user
+        task.delete()
+
+        assert _counters(user) == dict.fromkeys(TaskCounters.COUNTER_FIELDS, 0)
+
+    def test_change_owner_moves_counts(self, task, other_user):
+        """Test que cambiar el dueño de una tarea la descuenta del anterior y la suma al nuevo."""
+        user = task.user
+        task.user = other_user
+        task.save(update_fields=["user"])
+
+        assert _counters(user)["total"] == 0
+        assert _counters(user)["pending"] == 0
+        assert _counters(other_user)["total"] == 1
+        assert _counters(other_user)["pending"] == 1
+
+    def test_row_created_while_waiting_for_lock(self, user, monkeypatch):
+        """Test que si otra transacción crea la fila mientras se espera el bloqueo, se suman los cambios."""
+        lock_user = TaskCountersManager._lock_user
+
+        def concurrent_rebuild(manager, user_id, db):
+            lock_user(manager, user_id, db)
+            TaskCounters.objects.using(db).create(user_id=user_id, total=1, pending=1, medium_priority=1)
+
+        monkeypatch.setattr(TaskCountersManager, "_lock_user", concurrent_rebuild)
+        Task.objects.create(title="T1", user=user)
+
+        assert _counters(user)["total"] == 2
+        assert _counters(user)["pending"] == 2
+
+    def test_admin_bulk_delete(self, user, other_user):
+        """Test que "eliminar seleccionados" del admin descuenta los contadores."""
+        Task.objects.create(title="T1", status="pending", user=user)
+        Task.objects.create(title="T2", status="completed", user=user)
+        Task.objects.create(title="T3", status="completed", user=other_user)
+
+        admin.site._registry[Task].delete_queryset(None, Task.objects.filter(status="completed"))
+
+        assert _counters(user)["total"] == 1
+        assert _counters(user)["completed"] == 0
+        assert _counters(other_user)["total"] == 0
+
+    def test_rebuild_fixes_drift(self, user, other_user):
+        """Test que el comando de reconciliación corrige contadores desviados."""
+        Task.objects.create(title="T1", status="cancelled", priority="low", user=user)
+        Task.objects.bulk_create([Task(title="Sin contar", user=user)])
+        TaskCounters.objects.filter(user=user).update(total=99)
+
+        out = StringIO()
+        call_command("rebuild_task_counters", stdout=out)
+
+        counters = _counters(user)
+        assert counters["total"] == 2
+        assert counters["cancelled"] == 1
+        assert counters["pending"] == 1
+        assert _counters(other_user)["total"] == 0
+        assert "2 usuarios" in out.getvalue()
+
+
+@pytest.mark.django_db
+class TestStatsFromCounters:
+    """Tests para /api/tasks/stats/ servido desde TaskCounters."""
+
+    def test_stats_after_complete_action(self, authenticated_client, task):
+        """Test que la acción complete actualiza las estadísticas."""
+        authenticated_client.post(f"/api/tasks/{task.pk}/complete/")
+
+        response = authenticated_client.get("/api/tasks/stats/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["pending"] == 0
+        assert response.data["completed"] == 1
+
+    def test_stats_single_counters_query(self, authenticated_client, task, django_assert_num_queries):
+        """Test que stats lee una sola fila (más la consulta de autenticación)."""
+        with django_assert_num_queries(2):
+            response = authenticated_client.get("/api/tasks/stats/")
+
+        assert response.data["total"] == 1
+
+    def test_stats_without_counters_row(self, authenticated_client, task):
+        """Test que stats reconstruye la fila si no existe."""
+        TaskCounters.objects.all().delete()
+
+        response = authenticated_client.get("/api/tasks/stats/")
+
+        assert response.data["total"] == 1
+        assert response.data["medium_priority"] == 1
@@ -0,0 +1,34 @@
+from django.db import connection
+
+import pytest
+from rest_framework import status
+
+from config.database import pool_stats
+
+URL = "/api/db-pool/"
+
+
+@pytest.mark.django_db
+class TestDatabasePoolStats:
+    """Tests para las métricas del pool de conexiones."""
+
+    def test_stats_per_alias(self):
+        """Test que hay métricas para cada alias de DATABASES."""
+        stats = pool_stats()["default"]
+
+        if getattr(connection, "pool", None) is None:
+            assert stats["pooled"] is False
+        else:
+            assert stats["pooled"] is True
+            assert {"pool_size", "pool_available", "requests_waiting"} <= set(stats)
+
+    def test_admin_only(self, authenticated_client, user):
+        """Test que las métricas solo las ven los administradores."""
+        assert authenticated_client.get(URL).status_code == status.HTTP_403_FORBIDDEN
+
+        user.is_staff = True
+        user.save()
+
+        response = authenticated_client.get(URL)
+        assert response.status_code == status.HTTP_200_OK
+        assert "default" in response.data
@@ -0,0 +1,106 @@
+import csv
+import io
+import json
+
+import pytest
+from rest_framework import status
+
+from tasks.models import Task
+
+URL = "/api/tasks/export/"
+
+
+def _content(response):
+    return b"".join(response.streaming_content).decode()
+
+
+def _ndjson(response):
+    return [json.loads(line) for line in _content(response).splitlines()]
+
+
+@pytest.fixture
+def export_tasks(user, other_user):
+    Task.objects.create(title="Comprar pan", status="pending", priority="high", user=user)
+    Task.objects.create(title="Pagar luz", description='Con "comillas", y comas', status="completed", user=user)
+    Task.objects.create(title="Llamar", status="pending", priority="low", user=user)
+    Task.objects.create(title="Ajena", user=other_user)
+    return user
+
+
+@pytest.mark.django_db
+class TestTaskExport:
+    """Tests para GET /api/tasks/export/."""
+
+    def test_ndjson_default(self, authenticated_client, export_tasks):
+        """Test que sin formato se exporta NDJSON con todas las tareas propias."""
+        response = authenticated_client.get(URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        assert response["Content-Type"].startswith("application/x-ndjson")
+        rows = _ndjson(response)
+        assert [row["title"] for row in rows] == ["Llamar", "Pagar luz", "Comprar pan"]
+        assert set(rows[0]) == {
+            "id",
+            "title",
+            "description",
+            "status",
+            "priority",
+            "due_date",
+            "created_at",
+            "updated_at",
+        }
+
+    def test_csv(self, authenticated_client, export_tasks):
+        """Test que ?format=csv exporta CSV con encabezado y escapa comillas y comas."""
+        response = authenticated_client.get(URL, {"format": "csv"})
+
+        assert response["Content-Type"].startswith("text/csv")
+        assert response["Content-Disposition"] == 'attachment; filename="tasks.csv"'
+        rows = list(csv.DictReader(io.StringIO(_content(response))))
+        assert len(rows) == 3
+        assert rows[1]["description"] == 'Con "comillas", y comas'
+
+    def test_not_paginated(self, authenticated_client, user):
+        """Test que la exportación no se limita a PAGE_SIZE."""
+        Task.objects.bulk_create(Task(title=f"T{i}", user=user) for i in range(25))
+
+        assert len(_ndjson(authenticated_client.get(URL))) == 25
+
+    def test_filters_search_and_ordering(self, authenticated_client, export_tasks):
+        """Test que se aplican los mismos filtros, búsqueda y orden del listado."""
+        filtered = _ndjson(authenticated_client.get(URL, {"status": "pending", "ordering": "priority"}))
+        searched = _ndjson(authenticated_client.get(URL, {"format": "ndjson", "search": "pagar"}))
+
+        assert [row["title"] for row in filtered] == ["Comprar pan", "Llamar"]
+        assert [row["title"] for row in searched] == ["Pagar luz"]
+
+    def test_dates_match_api(self, authenticated_client, export_tasks):
+        """Test que las fechas tienen el mismo formato que en el detalle."""
+        row = _ndjson(authenticated_client.get(URL))[0]
+
+        detail = authenticated_client.get(f"/api/tasks/{row['id']}/")
+
+        assert row["created_at"] == detail.data["created_at"]
+        assert row["due_date"] is None
+
+    def test_streams_in_chunks(self, authenticated_client, user, settings):
+        """Test que la respuesta se escribe por bloques de TASKS_EXPORT_CHUNK_SIZE filas."""
+        settings.TASKS_EXPORT_CHUNK_SIZE = 2
+        Task.objects.bulk_create(Task(title=f"T{i}", user=user) for i in range(5))
+
+        chunks = list(authenticated_client.get(URL).streaming_content)
+
+        assert [chunk.count(b"\n") for chunk in chunks] == [2, 2, 1]
+
+    def test_unknown_format(self, authenticated_client, export_tasks):
+        """Test que un formato no soportado responde 404."""
+        response = authenticated_client.get(URL, {"format": "xml"})
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_requires_authentication(self, api_client):
+        """Test que exportar requiere autenticación."""
+        response = api_client.get(URL, {"format": "csv"})
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,174 @@
+import json
+from datetime import timedelta
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import DatabaseError
+from django.utils import timezone
+
+import pytest
+from rest_framework import status
+
+from config.routers import pin_key
+from tasks.importers import TaskImporter
+from tasks.models import Task, TaskCounters
+
+URL = "/api/tasks/import/"
+
+
+def _post(client, body, content_type):
+    return client.post(URL, data=body.encode(), content_type=content_type)
+
+
+def _events(response):
+    return [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+
+
+@pytest.mark.django_db
+class TestTaskImport:
+    """Tests para POST /api/tasks/import/."""
+
+    def test_ndjson(self, authenticated_client, user):
+        """Test que se importan las filas NDJSON y se actualizan los contadores."""
+        body = "\n".join(
+            [
+                json.dumps({"title": "Uno", "priority": "high"}),
+                json.dumps({"title": "Dos", "status": "completed", "user_id": 999}),
+                "",
+            ]
+        )
+
+        events = _events(_post(authenticated_client, body, "application/x-ndjson"))
+
+        assert events[-1] == {"event": "done", "processed": 2, "imported": 2, "failed": 0}
+        assert sorted(Task.objects.filter(user=user).values_list("title", flat=True)) == ["Dos", "Uno"]
+        counters = TaskCounters.objects.get(user=user)
+        assert (counters.total, counters.completed, counters.high_priority) == (2, 1, 1)
+
+    def test_csv(self, authenticated_client, user):
+        """Test que se importa un CSV con encabezado y celdas vacías."""
+        body = 'title,description,priority\nUno,,low\n"Dos, con coma","Multi\nlínea",\n'
+
+        events = _events(_post(authenticated_client, body, "text/csv"))
+
+        assert events[-1]["imported"] == 2
+        task = Task.objects.get(title="Dos, con coma")
+        assert task.description == "Multi\nlínea"
+        assert task.priority == "medium"
+
+    def test_row_errors_are_reported(self, authenticated_client, user):
+        """Test que las filas inválidas se informan con su línea y el resto se importa."""
+        past = (timezone.now() - timedelta(days=1)).isoformat()
+        body = "\n".join(
+            [
+                json.dumps({"title": "Válida"}),
+                "{no es json",
+                json.dumps({"title": "Vencida", "due_date": past}),
+                json.dumps({"status": "pending"}),
+                json.dumps(["lista"]),
+            ]
+        )
+
+        events = _events(_post(authenticated_client, body, "application/x-ndjson"))
+
+        errors = {event["row"]: event["errors"] for event in events if event["event"] == "error"}
+        assert set(errors) == {2, 3, 4, 5}
+        assert "due_date" in errors[3]
+        assert "title" in errors[4]
+        assert events[-1] == {"event": "done", "processed": 5, "imported": 1, "failed": 4}
+        assert list(Task.objects.values_list("title", flat=True)) == ["Válida"]
+
+    def test_progress_per_chunk(self, authenticated_client, user, settings):
+        """Test que se emite un evento de avance por bloque."""
+        settings.TASKS_IMPORT_CHUNK_SIZE = 2
+        body = "\n".join(json.dumps({"title": f"T{i}"}) for i in range(5))
+
+        events = _events(_post(authenticated_client, body, "application/x-ndjson"))
+
+        assert [event["processed"] for event in events if event["event"] == "progress"] == [2, 4, 5]
+        assert Task.objects.filter(user=user).count() == 5
+
+    def test_chunk_write_error_is_reported(self, authenticated_client, user, settings, monkeypatch):
+        """Test que un bloque que no se puede guardar se informa y el resto se importa."""
+        settings.TASKS_IMPORT_CHUNK_SIZE = 2
+        write = TaskImporter.write
+
+        def failing_write(importer, tasks):
+            if tasks[0].title == "T2":
+                raise DatabaseError("sin conexión")
+            write(importer, tasks)
+
+        monkeypatch.setattr(TaskImporter, "write", failing_write)
+        body = "\n".join(json.dumps({"title": f"T{i}"}) for i in range(5))
+
+        events = _events(_post(authenticated_client, body, "application/x-ndjson"))
+
+        assert {"event": "error", "rows": [3, 4], "errors": {"non_field_errors": ["No se pudo guardar el bloque."]}} in events
+        assert events[-1] == {"event": "done", "processed": 5, "imported": 3, "failed": 2}
+        assert sorted(Task.objects.filter(user=user).values_list("title", flat=True)) == ["T0", "T1", "T4"]
+        assert TaskCounters.objects.get(user=user).total == 3
+
+    def test_pins_user_to_primary(self, authenticated_client, user, settings):
+        """Test que la petición fija al usuario al primario antes de escribir en el stream."""
+        settings.DB_PRIMARY_PIN_SECONDS = 10
+        cache.delete(pin_key(user.pk))
+
+        response = _post(authenticated_client, json.dumps({"title": "Nueva"}), "application/x-ndjson")
+
+        assert cache.get(pin_key(user.pk)) is True
+        assert _events(response)[-1]["imported"] == 1
+
+    def test_pin_renewed_after_stream(self, authenticated_client, user, settings):
+        """Test que la fijación se renueva al terminar de escribir, no solo al iniciar el stream."""
+        settings.DB_PRIMARY_PIN_SECONDS = 10
+        response = _post(authenticated_client, json.dumps({"title": "Nueva"}), "application/x-ndjson")
+        cache.delete(pin_key(user.pk))  # Como si la fijación inicial hubiera expirado.
+
+        assert _events(response)[-1]["event"] == "done"
+        assert cache.get(pin_key(user.pk)) is True
+
+    def test_invalidates_list_cache(self, authenticated_client, user):
+        """Test que importar invalida la caché del listado."""
+        assert authenticated_client.get("/api/tasks/").data["count"] == 0
+
+        _events(_post(authenticated_client, json.dumps({"title": "Nueva"}), "application/x-ndjson"))
+
+        assert authenticated_client.get("/api/tasks/").data["count"] == 1
+
+    def test_unsupported_media_type(self, authenticated_client):
+        """Test que un Content-Type no soportado responde 415."""
+        response = authenticated_client.post(URL, [{"title": "X"}], format="json")
+
+        assert response.status_code == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+
+    def test_requires_authentication(self, api_client):
+        """Test que importar requiere autenticación."""
+        response = _post(api_client, "title\nX\n", "text/csv")
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+class TestImportTasksCommand:
+    """Tests para manage.py import_tasks."""
+
+    def test_imports_file(self, tmp_path, user):
+        """Test que el comando importa un archivo y reporta los errores por fila."""
+        path = tmp_path / "tareas.csv"
+        path.write_text("title,status\nUno,pending\n,completed\nTres,cancelled\n", encoding="utf-8")
+        out, err = StringIO(), StringIO()
+
+        call_command("import_tasks", str(path), "--user", user.username, stdout=out, stderr=err)
+
+        assert Task.objects.filter(user=user).count() == 2
+        assert "Fila 3" in err.getvalue()
+        assert "Importadas 2 tareas de 3 filas (1 con errores)." in out.getvalue()
+
+    def test_unknown_user(self, tmp_path, db):
+        """Test que un usuario inexistente es un error del comando."""
+        path = tmp_path / "tareas.ndjson"
+        path.write_text("", encoding="utf-8")
+
+        with pytest.raises(CommandError):
+            call_command("import_tasks", str(path), "--user", "999")
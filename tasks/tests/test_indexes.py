@@ -0,0 +1,152 @@
+import re
+
+from django.db import connection
+from django.db.models import Q
+
+import pytest
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from tasks.models import Task
+from tasks.sync import EPOCH, _after
+from tasks.views import TaskViewSet
+
+SORT_NODE = re.compile(r"(^|->)\s*(incremental )?sort\b")
+
+
+def _viewset_queryset(user, params=None):
+    """
+    Construye el queryset que TaskViewSet.list ejecutaría para `params`.
+    """
+    request = Request(APIRequestFactory().get("/api/tasks/", params or {}))
+    request.user = user
+    view = TaskViewSet(request=request, action="list", format_kwarg=None)
+    return view.filter_queryset(view.get_queryset())
+
+
+def _plan(queryset):
+    """
+    Retorna el plan de ejecución del queryset en minúsculas.
+    """
+    return queryset.explain().lower()
+
+
+def assert_index_plan(queryset, index_name):
+    """
+    Verifica que el plan use `index_name` y no recorra la tabla ni ordene en memoria.
+    """
+    plan = _plan(queryset)
+
+    assert index_name in plan, plan
+    if connection.vendor == "postgresql":
+        assert "seq scan" not in plan, plan
+        assert not any(SORT_NODE.search(line.strip()) for line in plan.splitlines()), plan
+    else:
+        assert "scan tasks_task" not in plan, plan
+        assert "temp b-tree" not in plan, plan
+
+
+@pytest.fixture
+def populated_user(user, other_user):
+    """
+    Usuario con suficientes tareas (propias y ajenas) para que el planificador elija índices.
+    """
+    statuses = [choice for choice, _ in Task.STATUS_CHOICES]
+    priorities = [choice for choice, _ in Task.PRIORITY_CHOICES]
+    Task.objects.bulk_create(
+        Task(
+            title=f"Tarea {i}",
+            status=statuses[i % len(statuses)],
+            priority=priorities[i % len(priorities)],
+            user=user if i % 4 else other_user,
+        )
+        for i in range(200)
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+        if connection.vendor == "postgresql":
+            # Con pocas filas un seq scan siempre es más barato; forzamos al planificador
+            # a revelar si existe un índice capaz de servir la consulta.
+            cursor.execute("SET LOCAL enable_seqscan = off")
+    return user
+
+
+@pytest.mark.django_db
+class TestTaskQueryPlans:
+    """Tests que verifican que las consultas de TaskViewSet usan los índices compuestos."""
+
+    def test_list_default_ordering(self, populated_user):
+        """Test que el listado por defecto (-created_at) usa (user, -created_at)."""
+        queryset = _viewset_queryset(populated_user)
+
+        assert_index_plan(queryset, "task_user_created_idx")
+
+    def test_list_filter_by_status(self, populated_user):
+        """Test que filtrar por estado usa (user, status, -created_at)."""
+        queryset = _viewset_queryset(populated_user, {"status": "in_progress"})
+
+        assert_index_plan(queryset, "task_user_status_created_idx")
+
+    def test_list_ordering_by_due_date(self, populated_user):
+        """Test que ordenar por due_date usa (user, due_date)."""
+        queryset = _viewset_queryset(populated_user, {"ordering": "due_date"})
+
+        assert_index_plan(queryset, "task_user_due_date_idx")
+
+    def test_cursor_page_by_priority(self, populated_user):
+        """Test que una página por cursor en orden (priority, id) usa (user, priority, id)."""
+        after = Q(priority__gt="medium") | Q(priority="medium", id__gt=50)
+        queryset = _viewset_queryset(populated_user, {"ordering": "priority"}).filter(after).order_by("priority", "id")
+
+        assert_index_plan(queryset, "task_user_priority_idx")
+
+    def test_cursor_page_by_due_date(self, populated_user):
+        """Test que el orden (due_date, id) de la paginación por cursor usa (user, due_date, id)."""
+        queryset = _viewset_queryset(populated_user, {"ordering": "due_date"}).order_by("due_date", "id")
+
+        assert_index_plan(queryset, "task_user_due_date_idx")
+
+    def test_search(self, populated_user):
+        """Test que ?search= filtra con el índice de texto completo sin recorrer la tabla."""
+        plan = _plan(_viewset_queryset(populated_user, {"search": "tarea 12"}))
+
+        if connection.vendor == "postgresql":
+            assert "task_search_vector_gin" in plan, plan
+            assert "seq scan" not in plan, plan
+        else:
+            # El índice invertido resuelve los ids; la consulta los busca por clave primaria.
+            assert "scan tasks_task" not in plan, plan
+            assert "primary key" in plan, plan
+
+    def test_pending_queryset(self, populated_user):
+        """Test que el queryset de /pending/ usa (user, status, -created_at)."""
+        queryset = _viewset_queryset(populated_user).filter(status="pending")
+
+        assert_index_plan(queryset, "task_user_status_created_idx")
+
+    def test_completed_queryset(self, populated_user):
+        """Test que el queryset de /completed/ usa (user, status, -created_at)."""
+        queryset = _viewset_queryset(populated_user).filter(status="completed")
+
+        assert_index_plan(queryset, "task_user_status_created_idx")
+
+    @pytest.mark.parametrize("status", ["pending", "in_progress", "completed", "cancelled"])
+    def test_stats_status_counts(self, populated_user, status):
+        """Test que los conteos por estado de /stats/ usan (user, status, -created_at)."""
+        queryset = Task.objects.filter(user=populated_user, status=status).order_by()
+
+        assert_index_plan(queryset, "task_user_status_created_idx")
+
+    @pytest.mark.parametrize("priority", ["low", "medium", "high"])
+    def test_stats_priority_counts(self, populated_user, priority):
+        """Test que los conteos por prioridad de /stats/ usan (user, priority)."""
+        queryset = Task.objects.filter(user=populated_user, priority=priority).order_by()
+
+        assert_index_plan(queryset, "task_user_priority_idx")
+
+    def test_changes_since_cursor(self, populated_user):
+        """Test que /changes/ recorre (user, updated_at, id) sin ordenar en memoria."""
+        queryset = Task.objects.filter(user=populated_user).filter(_after("updated_at", EPOCH, 0)).order_by("updated_at", "id")
+
+        assert_index_plan(queryset, "task_user_updated_idx")
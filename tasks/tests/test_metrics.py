@@ -0,0 +1,85 @@
+import pytest
+from prometheus_client import REGISTRY
+from rest_framework import status
+
+from config import metrics
+
+URL = "/metrics"
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+@pytest.mark.django_db
+class TestMetrics:
+    """Tests para las métricas de Prometheus."""
+
+    def test_request_metrics(self, authenticated_client, task):
+        """Test que se registran latencia, consultas, tiempo de base de datos y tamaño por ruta."""
+        labels = {"route": "TaskViewSet.retrieve", "method": "GET", "status": "200"}
+        before = sample("http_request_duration_seconds_count", **labels)
+
+        response = authenticated_client.get(f"/api/tasks/{task.id}/")
+
+        assert sample("http_request_duration_seconds_count", **labels) == before + 1
+        assert sample("http_request_db_queries_count", **labels) == before + 1
+        assert sample("http_request_db_duration_seconds_count", **labels) == before + 1
+        assert sample("http_response_size_bytes_sum", **labels) >= len(response.content)
+
+    def test_endpoint_exposes_text_format(self, api_client, authenticated_client):
+        """Test que /metrics responde en el formato de texto de Prometheus."""
+        authenticated_client.get("/api/tasks/")
+
+        response = api_client.get(URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"].startswith("text/plain")
+        body = response.content.decode()
+        assert 'http_request_duration_seconds_bucket{le="0.005",method="GET",route="TaskViewSet.list"' in body
+        assert "http_requests_in_progress" in body
+
+    def test_in_progress_back_to_zero(self, authenticated_client):
+        """Test que el gauge de peticiones en curso vuelve a cero al terminar."""
+        authenticated_client.get("/api/tasks/")
+
+        assert sample("http_requests_in_progress", method="GET") == 0
+
+    def test_auth_cache_events(self, authenticated_client, task):
+        """Test que se cuentan los fallos y aciertos de la caché de usuarios."""
+        misses = sample("auth_user_cache_events_total", event="misses")
+        hits = sample("auth_user_cache_events_total", event="hits")
+
+        authenticated_client.get(f"/api/tasks/{task.id}/")
+        authenticated_client.get(f"/api/tasks/{task.id}/")
+
+        assert sample("auth_user_cache_events_total", event="misses") == misses + 1
+        assert sample("auth_user_cache_events_total", event="hits") == hits + 1
+
+    def test_token(self, settings, api_client):
+        """Test que con METRICS_TOKEN se exige el token."""
+        settings.METRICS = {**settings.METRICS, "TOKEN": "secreto"}
+
+        assert api_client.get(URL).status_code == status.HTTP_403_FORBIDDEN
+        assert api_client.get(URL, HTTP_AUTHORIZATION="Bearer secreto").status_code == status.HTTP_200_OK
+
+    def test_internal_ips_without_token(self, api_client):
+        """Test que sin METRICS_TOKEN solo responde a las IP internas."""
+        assert api_client.get(URL).status_code == status.HTTP_200_OK
+        assert api_client.get(URL, REMOTE_ADDR="203.0.113.7").status_code == status.HTTP_403_FORBIDDEN
+
+    def test_disabled(self, settings, authenticated_client):
+        """Test que con METRICS_ENABLED=False no se registran peticiones."""
+        settings.METRICS = {**settings.METRICS, "ENABLED": False}
+        labels = {"route": "TaskViewSet.list", "method": "GET", "status": "200"}
+        before = sample("http_request_duration_seconds_count", **labels)
+
+        authenticated_client.get("/api/tasks/")
+
+        assert sample("http_request_duration_seconds_count", **labels) == before
+
+    def test_multiprocess_registry(self, monkeypatch, tmp_path):
+        """Test que con PROMETHEUS_MULTIPROC_DIR se exportan los archivos de los workers."""
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+
+        assert metrics.registry() is not REGISTRY
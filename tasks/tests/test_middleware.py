@@ -0,0 +1,141 @@
+import logging
+
+from django.core.cache import cache
+from django.core.checks.security import base, csrf
+from django.core.handlers.asgi import ASGIHandler
+from django.test import AsyncClient, RequestFactory
+
+import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from config.middleware import is_api_request
+from config.profiling import ProfileStore, make_token
+from config.routers import pin_key
+
+URL = "/api/tasks/"
+
+
+@pytest.fixture(autouse=True)
+def static_storage(settings):
+    """Las plantillas del admin no necesitan el manifiesto de collectstatic."""
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+    }
+
+
+def full_middleware(settings):
+    web_only = {lean: original for original, lean in settings.WEB_ONLY_MIDDLEWARE.items()}
+    return [web_only.get(path, path) for path in settings.MIDDLEWARE]
+
+
+@pytest.mark.django_db
+class TestAPIProfile:
+    """Tests para la cadena de middleware reducida de la API."""
+
+    def test_api_paths(self):
+        """Test que la documentación y el admin no son rutas de la API."""
+        factory = RequestFactory()
+
+        assert is_api_request(factory.get("/api/tasks/"))
+        assert is_api_request(factory.get("/metrics"))
+        assert not is_api_request(factory.get("/api/schema/swagger-ui/"))
+        assert not is_api_request(factory.get("/admin/login/"))
+
+    def test_deploy_checks_find_security_middleware(self):
+        """Test que check --deploy reconoce CSRF y clickjacking con el perfil de API."""
+        assert csrf.check_csrf_middleware(None) == []
+        assert base.check_xframe_options_middleware(None) == []
+
+    def test_api_skips_web_middleware(self, authenticated_client, task):
+        """Test que la API responde sin pasar por la sesión."""
+        response = authenticated_client.get(f"{URL}{task.id}/")
+
+        assert response.status_code == 200
+        assert not hasattr(response.wsgi_request, "session")
+        assert "Cookie" not in response.get("Vary", "")
+        assert response.wsgi_request.user == task.user
+
+    def test_admin_and_docs_keep_full_chain(self, client):
+        """Test que /admin/ y la documentación conservan la cadena completa."""
+        admin = client.get("/admin/login/")
+        docs = client.get("/api/schema/swagger-ui/")
+
+        assert admin.status_code == 200
+        assert admin["X-Frame-Options"] == "DENY"
+        assert "csrftoken" in admin.cookies
+        assert docs["X-Frame-Options"] == "DENY"
+
+    def test_admin_login_with_session(self, client, user):
+        """Test que el login del admin sigue usando sesión y CSRF."""
+        user.is_staff = True
+        user.save()
+
+        client.force_login(user)
+
+        assert client.get("/admin/").status_code == 200
+
+    def test_profile_disabled(self, settings, api_client):
+        """Test que con la cadena completa la API vuelve a pasar por todos los middleware."""
+        settings.MIDDLEWARE = full_middleware(settings)
+
+        response = api_client.get(URL)
+
+        assert hasattr(response.wsgi_request, "session")
+
+
+@pytest.mark.django_db
+class TestAsyncMiddleware:
+    """Tests para la cadena de middleware bajo ASGI."""
+
+    @pytest.fixture
+    def asgi_get(self, user):
+        headers = {"authorization": f"Bearer {RefreshToken.for_user(user).access_token}"}
+
+        def get(path, **extra):
+            return async_to_sync(AsyncClient().get)(path, headers={**headers, **extra})
+
+        return get
+
+    def test_no_sync_adaptation(self, settings, caplog):
+        """Test que ASGIHandler carga la cadena sin adaptar ningún middleware ni hook a síncrono."""
+        settings.DEBUG = True
+
+        with caplog.at_level(logging.DEBUG, logger="django.request"):
+            handler = ASGIHandler()
+
+        assert [record.getMessage() for record in caplog.records if "adapted" in record.getMessage()] == []
+        assert iscoroutinefunction(handler._middleware_chain)
+        assert all(iscoroutinefunction(method) for method in handler._view_middleware)
+
+    def test_api_request_measured(self, settings, authenticated_client, asgi_get, task):
+        """Test que en modo async se cuentan las consultas hechas en el hilo de la vista."""
+        settings.REQUEST_TIMING = {**settings.REQUEST_TIMING, "HEADER": True}
+        authenticated_client.get(f"{URL}{task.id}/")  # Deja el usuario en caché.
+        sync = authenticated_client.get(f"{URL}{task.id}/")
+        response = asgi_get(f"{URL}{task.id}/")
+
+        assert response.status_code == 200
+        assert 'desc="1 consultas"' in sync["Server-Timing"]
+        assert 'desc="1 consultas"' in response["Server-Timing"]
+        assert "Cookie" not in response.get("Vary", "")
+
+    def test_profiled_and_pinned(self, settings, tmp_path, user, asgi_get):
+        """Test que el perfilado y la fijación al primario funcionan en modo async."""
+        settings.PROFILING = {**settings.PROFILING, "DIR": str(tmp_path), "INTERVAL": 0.001}
+        headers = {"authorization": f"Bearer {RefreshToken.for_user(user).access_token}", "x-profile": make_token()}
+
+        response = async_to_sync(AsyncClient().post)(URL, {"title": "Nueva"}, content_type="application/json", headers=headers)
+
+        assert response.status_code == 201
+        assert any("tasks_task" in query["sql"] for query in ProfileStore().load(response["X-Profile-Id"])["queries"])
+        assert cache.get(pin_key(user.pk)) is True
+
+    def test_web_paths_keep_full_chain(self, asgi_get):
+        """Test que el admin conserva sesión, CSRF y clickjacking en modo async."""
+        response = asgi_get("/admin/login/")
+
+        assert response.status_code == 200
+        assert response["X-Frame-Options"] == "DENY"
+        assert "csrftoken" in response.cookies
@@ -0,0 +1,137 @@
+from datetime import timedelta
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+import pytest
+from rest_framework import status
+
+from tasks.models import Task
+
+URL = "/api/tasks/"
+
+
+def _walk(client, params):
+    """
+    Recorre todas las páginas siguiendo `next` y retorna los ids en orden.
+    """
+    ids = []
+    response = client.get(URL, {"pagination": "cursor", **params})
+    while True:
+        assert response.status_code == status.HTTP_200_OK
+        ids.extend(item["id"] for item in response.data["results"])
+        if not response.data["next"]:
+            return ids
+        response = client.get(response.data["next"])
+
+
+def _expected(user, field, descending):
+    """
+    Orden esperado (campo, id) con los NULL donde los ubica la base de datos.
+    """
+    tasks = list(Task.objects.filter(user=user))
+    nulls_largest = connection.features.nulls_order_largest
+
+    def key(task):
+        value = getattr(task, field)
+        return ((value is None) == nulls_largest, value if value is not None else 0, task.id)
+
+    return [task.id for task in sorted(tasks, key=key, reverse=descending)]
+
+
+@pytest.fixture
+def many_tasks(user, other_user):
+    """
+    25 tareas con marcas de tiempo repetidas y due_date nulos para ejercitar el desempate.
+    """
+    now = timezone.now()
+    priorities = [choice for choice, _ in Task.PRIORITY_CHOICES]
+    for i in range(25):
+        Task.objects.create(
+            title=f"Tarea {i}",
+            priority=priorities[i % 3],
+            due_date=now + timedelta(days=i % 4) if i % 5 else None,
+            user=user,
+        )
+    Task.objects.create(title="Ajena", user=other_user)
+    # Fuerza empates en created_at para que el orden dependa del id.
+    Task.objects.filter(user=user, id__in=Task.objects.filter(user=user).values("id")[:10]).update(created_at=now)
+    return user
+
+
+@pytest.mark.django_db
+class TestTaskCursorPagination:
+    """Tests para la paginación keyset del listado de tareas."""
+
+    def test_default_pagination_unchanged(self, authenticated_client, many_tasks):
+        """Test que sin `pagination=cursor` se mantiene PageNumberPagination."""
+        response = authenticated_client.get(URL)
+
+        assert response.data["count"] == 25
+        assert len(response.data["results"]) == 10
+
+    def test_cursor_response_shape(self, authenticated_client, many_tasks):
+        """Test que el modo cursor no calcula el total."""
+        response = authenticated_client.get(URL, {"pagination": "cursor"})
+
+        assert set(response.data) == {"next", "previous", "results"}
+        assert response.data["previous"] is None
+        assert len(response.data["results"]) == 10
+
+    @pytest.mark.parametrize(
+        "ordering",
+        ["created_at", "-created_at", "updated_at", "-updated_at", "due_date", "-due_date", "priority", "-priority"],
+    )
+    def test_walk_every_ordering(self, authenticated_client, many_tasks, ordering):
+        """Test que recorrer todas las páginas entrega cada tarea una vez y en orden."""
+        ids = _walk(authenticated_client, {"ordering": ordering})
+
+        assert ids == _expected(many_tasks, ordering.lstrip("-"), ordering.startswith("-"))
+
+    def test_stable_under_concurrent_inserts(self, authenticated_client, many_tasks):
+        """Test que insertar tareas entre páginas no duplica ni salta resultados."""
+        first = authenticated_client.get(URL, {"pagination": "cursor"})
+        Task.objects.create(title="Nueva", user=many_tasks)
+
+        second = authenticated_client.get(first.data["next"])
+
+        first_ids = {item["id"] for item in first.data["results"]}
+        second_ids = [item["id"] for item in second.data["results"]]
+        assert not first_ids & set(second_ids)
+        assert second_ids == _expected(many_tasks, "created_at", True)[11:21]
+
+    def test_previous_link(self, authenticated_client, many_tasks):
+        """Test que `previous` devuelve la página anterior."""
+        first = authenticated_client.get(URL, {"pagination": "cursor", "ordering": "due_date"})
+        second = authenticated_client.get(first.data["next"])
+
+        back = authenticated_client.get(second.data["previous"])
+
+        assert back.data["results"] == first.data["results"]
+        assert back.data["previous"] is None
+
+    def test_invalid_cursor(self, authenticated_client, many_tasks):
+        """Test que un cursor corrupto o de otro orden responde 404."""
+        first = authenticated_client.get(URL, {"pagination": "cursor"})
+        cursor = first.data["next"].split("cursor=")[1]
+
+        assert authenticated_client.get(URL, {"cursor": "basura"}).status_code == status.HTTP_404_NOT_FOUND
+        response = authenticated_client.get(URL, {"cursor": cursor, "ordering": "priority"})
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_deep_page_single_limited_query(self, authenticated_client, many_tasks):
+        """Test que una página profunda no ejecuta COUNT ni OFFSET, solo un SELECT con LIMIT."""
+        response = authenticated_client.get(URL, {"pagination": "cursor"})
+        response = authenticated_client.get(response.data["next"])
+
+        with CaptureQueriesContext(connection) as context:
+            authenticated_client.get(response.data["next"])
+
+        queries = [q["sql"].upper() for q in context.captured_queries]
+        # Se excluye la agregación MAX(updated_at)/COUNT de la ETag, que no lee filas.
+        task_queries = [sql for sql in queries if 'FROM "TASKS_TASK"' in sql and "MAX(" not in sql]
+        assert len(task_queries) == 1
+        assert "LIMIT" in task_queries[0]
+        assert "OFFSET" not in task_queries[0]
+        assert "COUNT(" not in task_queries[0]
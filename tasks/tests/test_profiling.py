@@ -0,0 +1,118 @@
+import json
+import threading
+import time
+from io import StringIO
+
+from django.core import signing
+from django.core.management import CommandError, call_command
+
+import pytest
+
+from config.profiling import SIGNING_SALT, ProfileStore, StackSampler, make_token
+
+URL = "/api/tasks/"
+
+
+@pytest.fixture(autouse=True)
+def profiles_dir(settings, tmp_path):
+    settings.PROFILING = {**settings.PROFILING, "DIR": str(tmp_path), "MAX_PROFILES": 3, "INTERVAL": 0.001}
+    return tmp_path
+
+
+def slow_function(done):
+    done.wait(5)
+
+
+@pytest.mark.django_db
+class TestRequestProfiling:
+    """Tests para el perfilado de peticiones bajo demanda."""
+
+    def test_not_profiled_by_default(self, authenticated_client, profiles_dir):
+        """Test que sin encabezado ni muestreo no se guarda nada."""
+        response = authenticated_client.get(URL)
+
+        assert "X-Profile-Id" not in response
+        assert list(profiles_dir.iterdir()) == []
+
+    def test_signed_header(self, authenticated_client, user, task):
+        """Test que un token firmado guarda el perfil con las consultas de la petición."""
+        response = authenticated_client.get(URL, {"search": "test"}, HTTP_X_PROFILE=make_token())
+
+        profile = ProfileStore().load(response["X-Profile-Id"])
+        assert profile["trigger"] == "header"
+        assert profile["path"] == URL
+        assert profile["query_string"] == "search=test"
+        assert profile["user_id"] == user.id
+        assert profile["status"] == 200
+        assert any("tasks_task" in query["sql"] for query in profile["queries"])
+        assert profile["samples"] == sum(profile["stacks"].values())
+
+    def test_invalid_or_expired_token_ignored(self, settings, authenticated_client):
+        """Test que un token inválido o vencido no activa el perfil."""
+        expired = signing.dumps("profile", salt=SIGNING_SALT)
+        settings.PROFILING = {**settings.PROFILING, "TOKEN_MAX_AGE": -1}
+
+        assert "X-Profile-Id" not in authenticated_client.get(URL, HTTP_X_PROFILE="falso")
+        assert "X-Profile-Id" not in authenticated_client.get(URL, HTTP_X_PROFILE=expired)
+
+    def test_sample_rate(self, settings, api_client):
+        """Test que con SAMPLE_RATE=1 se perfila toda petición."""
+        settings.PROFILING = {**settings.PROFILING, "SAMPLE_RATE": 1.0}
+
+        response = api_client.get(URL)
+
+        assert ProfileStore().load(response["X-Profile-Id"])["trigger"] == "sample"
+
+    def test_ring_buffer(self, authenticated_client, profiles_dir):
+        """Test que solo se conservan los MAX_PROFILES perfiles más recientes."""
+        ids = [authenticated_client.get(URL, HTTP_X_PROFILE=make_token())["X-Profile-Id"] for _ in range(5)]
+
+        assert [profile["id"] for profile in ProfileStore().list()] == ids[:1:-1]
+        assert len(list(profiles_dir.glob("*.json"))) == 3
+
+    def test_unwritable_directory(self, settings, authenticated_client, profiles_dir, caplog):
+        """Test que si el perfil no se puede guardar se registra y la respuesta sale sin X-Profile-Id."""
+        blocker = profiles_dir / "archivo"
+        blocker.write_text("")
+        settings.PROFILING = {**settings.PROFILING, "DIR": str(blocker / "perfiles")}
+
+        response = authenticated_client.get(URL, HTTP_X_PROFILE=make_token())
+
+        assert response.status_code == 200
+        assert "X-Profile-Id" not in response
+        assert "No se pudo guardar el perfil de GET /api/tasks/" in caplog.text
+
+    def test_sampler_collects_stacks(self):
+        """Test que el muestreador registra la pila del hilo observado."""
+        done = threading.Event()
+        thread = threading.Thread(target=slow_function, args=(done,))
+        thread.start()
+        sampler = StackSampler(thread.ident, 0.001)
+        sampler.start()
+        time.sleep(0.05)
+        sampler.stop()
+        done.set()
+        thread.join()
+
+        assert sampler.samples > 0
+        assert any("test_profiling.slow_function" in stack for stack in sampler.stacks)
+
+    def test_command(self, authenticated_client):
+        """Test que request_profiles lista, vuelca y genera tokens."""
+        profile_id = authenticated_client.get(URL, HTTP_X_PROFILE=make_token())["X-Profile-Id"]
+
+        out = StringIO()
+        call_command("request_profiles", "list", stdout=out)
+        assert profile_id in out.getvalue()
+        assert f"GET {URL}  200" in out.getvalue()
+
+        out = StringIO()
+        call_command("request_profiles", "dump", profile_id, stdout=out)
+        assert json.loads(out.getvalue())["id"] == profile_id
+
+        out = StringIO()
+        call_command("request_profiles", "token", stdout=out, stderr=StringIO())
+        assert "X-Profile-Id" in authenticated_client.get(URL, HTTP_X_PROFILE=out.getvalue().strip())
+
+        with pytest.raises(CommandError):
+            call_command("request_profiles", "dump", "no-existe")
@@ -0,0 +1,140 @@
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.db import connections
+from django.test import RequestFactory
+
+import pytest
+from rest_framework import status
+
+from config.routers import ReplicaRouter, ReplicaRoutingMiddleware, pin_key
+from tasks.checks import check_replica_pin_cache
+from tasks.models import Task, TaskCounters
+
+router = ReplicaRouter()
+
+
+@pytest.fixture(autouse=True)
+def replicas(settings):
+    settings.DATABASE_REPLICAS = ["replica_1"]
+    settings.DB_PRIMARY_PIN_SECONDS = 10
+
+
+def route(method, user, view=None):
+    """Pasa una petición por el middleware y devuelve el alias de lectura al terminar `view`."""
+    request = getattr(RequestFactory(), method)("/api/tasks/")
+    request.user = user
+    aliases = []
+
+    def get_response(request):
+        if view is not None:
+            view()
+        aliases.append(router.db_for_read(Task))
+        return None
+
+    ReplicaRoutingMiddleware(get_response)(request)
+    return aliases[0]
+
+
+@pytest.mark.django_db
+class TestReplicaRouter:
+    """Tests para el enrutamiento a réplicas."""
+
+    def test_safe_methods_read_replica(self, user):
+        """Test que las lecturas de un GET van a una réplica."""
+        assert route("get", user) == "replica_1"
+        assert route("head", AnonymousUser()) == "replica_1"
+
+    def test_replica_chosen_once_per_request(self, settings, user):
+        """Test que todas las lecturas de una petición van a la misma réplica."""
+        settings.DATABASE_REPLICAS = [f"replica_{number}" for number in range(1, 9)]
+        aliases = []
+
+        def read_many():
+            aliases.extend(router.db_for_read(Task) for _ in range(20))
+
+        for _ in range(5):
+            route("get", user, view=read_many)
+            assert len(set(aliases)) == 1
+            aliases.clear()
+
+    def test_rebuild_reads_primary(self, user, task):
+        """Test que reconstruir los contadores en un GET lee las tareas del primario."""
+        written = []
+        route("get", user, view=lambda: written.append(TaskCounters.objects.rebuild(user_ids=[user.pk])))
+
+        assert written == [1]
+        assert TaskCounters.objects.get(user=user).total == 1
+
+    def test_unsafe_methods_use_primary(self, user):
+        """Test que un POST lee y escribe en el primario."""
+        assert route("post", user) == "default"
+        assert router.db_for_write(Task) == "default"
+
+    def test_write_pins_user(self, user, other_user):
+        """Test que tras escribir el usuario lee del primario durante la ventana."""
+        assert route("get", user, view=lambda: router.db_for_write(Task)) == "default"
+        assert cache.get(pin_key(user.pk)) is True
+
+        assert route("get", user) == "default"
+        assert route("get", other_user) == "replica_1"
+
+        cache.delete(pin_key(user.pk))
+        assert route("get", user) == "replica_1"
+
+    def test_anonymous_write_not_pinned(self):
+        """Test que una escritura anónima no fija a nadie."""
+        assert route("post", AnonymousUser(), view=lambda: router.db_for_write(Task)) == "default"
+        assert route("get", AnonymousUser()) == "replica_1"
+
+    def test_pin_disabled(self, settings, user):
+        """Test que con DB_PRIMARY_PIN_SECONDS=0 no se fija al usuario."""
+        settings.DB_PRIMARY_PIN_SECONDS = 0
+
+        route("post", user, view=lambda: router.db_for_write(Task))
+
+        assert cache.get(pin_key(user.pk)) is None
+
+    def test_outside_request_uses_primary(self):
+        """Test que sin petición (comandos, shell) todo va al primario."""
+        assert router.db_for_read(Task) == "default"
+
+    def test_no_replicas(self, settings, user):
+        """Test que sin réplicas configuradas todo va al primario."""
+        settings.DATABASE_REPLICAS = []
+
+        assert route("get", user) == "default"
+
+    def test_per_process_pin_cache_check(self, settings, tmp_path):
+        """Test que el check avisa si hay réplicas y la fijación se guarda en la memoria del proceso."""
+        settings.DEBUG = False
+        assert [warning.id for warning in check_replica_pin_cache(None)] == ["tasks.W002"]
+
+        settings.DATABASE_REPLICAS = []
+        assert check_replica_pin_cache(None) == []
+
+        settings.DATABASE_REPLICAS = ["replica_1"]
+        settings.CACHES = {
+            **settings.CACHES,
+            "default": {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": str(tmp_path)},
+        }
+        assert check_replica_pin_cache(None) == []
+
+    def test_migrations_only_on_primary(self):
+        """Test que las migraciones solo se aplican al primario."""
+        assert router.allow_migrate("default", "tasks")
+        assert not router.allow_migrate("replica_1", "tasks")
+
+
+@pytest.mark.django_db(transaction=True, databases=["default", "replica_1"])
+@pytest.mark.skipif("replica_1" not in connections, reason="Sin DB_REPLICA_HOSTS")
+class TestReplicaRoutingIntegration:
+    """Tests de la API con una réplica espejo del primario."""
+
+    def test_create_then_list(self, authenticated_client, user):
+        """Test que el usuario ve su tarea justo después de crearla."""
+        created = authenticated_client.post("/api/tasks/", {"title": "Nueva"}, format="json")
+        assert created.status_code == status.HTTP_201_CREATED
+        assert cache.get(pin_key(user.pk)) is True
+
+        response = authenticated_client.get("/api/tasks/")
+        assert [item["id"] for item in response.data["results"]] == [created.data["id"]]
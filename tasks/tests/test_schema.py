@@ -0,0 +1,130 @@
+import gzip
+import json
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import RequestFactory
+
+import pytest
+from drf_spectacular.renderers import OpenApiJsonRenderer
+from drf_spectacular.views import SpectacularAPIView
+
+from config import schema
+from config.schema import code_version, schema_cache
+
+URL = "/api/schema/"
+
+
+@pytest.fixture
+def renders(monkeypatch):
+    """Cuenta las veces que se genera el esquema."""
+    calls = []
+    render_schema = schema.render_schema
+
+    def counted(*args, **kwargs):
+        calls.append(args)
+        return render_schema(*args, **kwargs)
+
+    monkeypatch.setattr(schema, "render_schema", counted)
+    return calls
+
+
+@pytest.mark.django_db
+class TestCachedSchema:
+    """Tests para el esquema OpenAPI precalculado."""
+
+    def test_generated_once_and_same_as_spectacular(self, client, renders, schema_cache_dir):
+        """Test que el esquema se genera una vez, se guarda en disco y no cambia respecto de drf-spectacular."""
+        first = client.get(URL)
+        second = client.get(URL)
+        original = SpectacularAPIView.as_view()(RequestFactory().get(URL)).render()
+
+        assert first.status_code == 200
+        assert first.content == second.content == original.content
+        assert first["Content-Type"] == original["Content-Type"]
+        assert len(renders) == 1
+        assert list((schema_cache_dir / code_version()).iterdir())
+
+    def test_loaded_from_disk(self, client, renders):
+        """Test que otro proceso (caché en memoria vacía) lee el esquema del disco."""
+        content = client.get(URL, {"format": "json"}).content
+        schema_cache.clear()
+
+        response = client.get(URL, {"format": "json"})
+
+        assert response.content == content
+        assert response["Content-Type"] == "application/vnd.oai.openapi+json"
+        assert len(renders) == 1
+
+    def test_etag_and_gzip(self, client):
+        """Test que la ETag permite responder 304 y que gzip tiene su propia ETag."""
+        response = client.get(URL)
+        compressed = client.get(URL, HTTP_ACCEPT_ENCODING="gzip, br")
+
+        assert client.get(URL, HTTP_IF_NONE_MATCH=response["ETag"]).status_code == 304
+        assert compressed["Content-Encoding"] == "gzip"
+        assert gzip.decompress(compressed.content) == response.content
+        assert compressed["ETag"] != response["ETag"]
+        assert "Accept-Encoding" in response["Vary"]
+
+    def test_cache_control(self, settings, client):
+        """Test que solo la URL con la versión del código se cachea como inmutable."""
+        current = client.get(URL, {"v": code_version()})
+        stale = client.get(URL, {"v": "otra"})
+
+        assert "immutable" in current["Cache-Control"]
+        assert f"max-age={schema.IMMUTABLE_MAX_AGE}" in current["Cache-Control"]
+        assert stale["Cache-Control"] == f"public, max-age={settings.SCHEMA_CACHE['MAX_AGE']}"
+
+    def test_docs_request_versioned_url(self, settings, client):
+        """Test que Swagger UI y Redoc piden el esquema con ?v=<versión>."""
+        settings.STORAGES = {
+            **settings.STORAGES,
+            "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+        }
+        version = code_version()
+
+        assert version in client.get("/api/schema/swagger-ui/").content.decode()
+        assert version in client.get("/api/schema/redoc/").content.decode()
+
+    def test_version_follows_settings(self, settings, monkeypatch):
+        """Test que la versión del código cambia con los settings que cambian el esquema."""
+        version = code_version()
+        monkeypatch.setattr(schema, "_version", None)
+        settings.TASKS_ASYNC_VIEWS = not settings.TASKS_ASYNC_VIEWS
+
+        assert code_version() != version
+
+    def test_uncached_variants(self, settings, client, renders):
+        """Test que un idioma desconocido o la caché desactivada usan la vista original."""
+        assert client.get(URL, {"lang": "xx"}).status_code == 200
+        settings.SCHEMA_CACHE = {**settings.SCHEMA_CACHE, "ENABLED": False}
+        response = client.get(URL)
+
+        assert response.status_code == 200
+        assert "ETag" not in response
+        assert renders == []
+
+    def test_build_schema_command(self, schema_cache_dir, renders):
+        """Test que build_schema genera cada formato y borra las versiones anteriores."""
+        (schema_cache_dir / "anterior").mkdir(parents=True)
+
+        out = StringIO()
+        call_command("build_schema", stdout=out)
+
+        assert sorted(path.name for path in schema_cache_dir.iterdir()) == [code_version()]
+        assert len(list((schema_cache_dir / code_version()).iterdir())) == 4
+        assert "versiones anteriores borradas: 1" in out.getvalue()
+        assert schema_cache.get(OpenApiJsonRenderer).content.startswith(b"{")
+
+    def test_declares_jwt_bearer_scheme(self):
+        """Test que el esquema declara jwtAuth para CachedJWTAuthentication y lo exige en las operaciones."""
+        document = json.loads(schema.render_schema(OpenApiJsonRenderer))
+
+        assert document["components"]["securitySchemes"]["jwtAuth"] == {
+            "type": "http",
+            "scheme": "bearer",
+            "bearerFormat": "JWT",
+        }
+        assert {"jwtAuth": []} in document["paths"]["/api/tasks/"]["get"]["security"]
+        assert {"jwtAuth": []} in document["paths"]["/api/users/me/"]["get"]["security"]
@@ -0,0 +1,146 @@
+from django.db import connection
+
+import pytest
+from rest_framework import status
+
+from tasks.models import Task
+from tasks.search import inverted_index_backend
+
+URL = "/api/tasks/"
+
+
+def _titles(response):
+    return [item["title"] for item in response.data["results"]]
+
+
+@pytest.fixture(autouse=True)
+def clear_search_index():
+    inverted_index_backend.clear()
+
+
+@pytest.mark.django_db
+class TestTaskSearch:
+    """Tests para la búsqueda de texto completo en ?search=."""
+
+    def test_prefix_matches_title_and_description(self, authenticated_client, user):
+        """Test que un prefijo encuentra palabras en título y descripción."""
+        Task.objects.create(title="Comprar pan", user=user)
+        Task.objects.create(title="Ir a la panadería", user=user)
+        Task.objects.create(title="Llamar", description="Pantalla rota", user=user)
+        Task.objects.create(title="Llamar doctor", description="Urgente", user=user)
+
+        response = authenticated_client.get(URL, {"search": "pan"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert sorted(_titles(response)) == ["Comprar pan", "Ir a la panadería", "Llamar"]
+
+    def test_all_terms_must_match(self, authenticated_client, user):
+        """Test que todas las palabras buscadas deben aparecer."""
+        Task.objects.create(title="Comprar pan", description="En la panadería", user=user)
+        Task.objects.create(title="Comprar leche", user=user)
+
+        response = authenticated_client.get(URL, {"search": "comprar pan"})
+
+        assert _titles(response) == ["Comprar pan"]
+
+    def test_case_insensitive(self, authenticated_client, user):
+        """Test que la búsqueda no distingue mayúsculas."""
+        Task.objects.create(title="Reunión con EQUIPO", user=user)
+
+        response = authenticated_client.get(URL, {"search": "Equipo"})
+
+        assert _titles(response) == ["Reunión con EQUIPO"]
+
+    def test_ranked_by_relevance(self, authenticated_client, user):
+        """Test que una coincidencia en el título supera a una en la descripción."""
+        Task.objects.create(title="Revisar", description="informe mensual", user=user)
+        Task.objects.create(title="Informe anual", user=user)
+
+        response = authenticated_client.get(URL, {"search": "informe"})
+
+        assert _titles(response) == ["Informe anual", "Revisar"]
+
+    def test_explicit_ordering_overrides_rank(self, authenticated_client, user):
+        """Test que ?ordering= tiene prioridad sobre la relevancia."""
+        Task.objects.create(title="Revisar", description="informe", priority="high", user=user)
+        Task.objects.create(title="Informe", priority="low", user=user)
+
+        response = authenticated_client.get(URL, {"search": "informe", "ordering": "priority"})
+
+        assert _titles(response) == ["Revisar", "Informe"]
+
+    def test_only_own_tasks(self, authenticated_client, user, other_user):
+        """Test que la búsqueda respeta el alcance del usuario."""
+        Task.objects.create(title="Proyecto propio", user=user)
+        Task.objects.create(title="Proyecto ajeno", user=other_user)
+
+        response = authenticated_client.get(URL, {"search": "proyecto"})
+
+        assert _titles(response) == ["Proyecto propio"]
+
+    def test_combines_with_filters(self, authenticated_client, user):
+        """Test que la búsqueda se combina con filterset_fields."""
+        Task.objects.create(title="Pagar luz", status="completed", user=user)
+        Task.objects.create(title="Pagar agua", status="pending", user=user)
+
+        response = authenticated_client.get(URL, {"search": "pagar", "status": "pending"})
+
+        assert _titles(response) == ["Pagar agua"]
+
+    def test_index_follows_writes(self, authenticated_client, user):
+        """Test que crear, editar y eliminar tareas se refleja en la búsqueda."""
+        task = Task.objects.create(title="Borrador", user=user)
+        assert _titles(authenticated_client.get(URL, {"search": "borrador"})) == ["Borrador"]
+
+        task.title = "Versión final"
+        task.save()
+        assert _titles(authenticated_client.get(URL, {"search": "borrador"})) == []
+        assert _titles(authenticated_client.get(URL, {"search": "final"})) == ["Versión final"]
+
+        task.delete()
+        assert _titles(authenticated_client.get(URL, {"search": "final"})) == []
+
+    def test_no_substring_matches_by_default(self, authenticated_client, user):
+        """Test que por defecto una subcadena en medio de una palabra no coincide."""
+        Task.objects.create(title="Ir a la panadería", user=user)
+
+        assert _titles(authenticated_client.get(URL, {"search": "adería"})) == []
+
+    def test_substring_matches(self, authenticated_client, user, settings):
+        """Test que con TASKS_SEARCH_SUBSTRING se encuentran las coincidencias por subcadena, como SearchFilter."""
+        settings.TASKS_SEARCH_SUBSTRING = True
+        Task.objects.create(title="Ir a la panadería", user=user)
+        Task.objects.create(title="Llamar", description="Empanadas para la cena", user=user)
+        Task.objects.create(title="Otra", user=user)
+
+        assert sorted(_titles(authenticated_client.get(URL, {"search": "anad"}))) == ["Ir a la panadería", "Llamar"]
+        assert _titles(authenticated_client.get(URL, {"search": "adería ir"})) == ["Ir a la panadería"]
+
+    def test_prefix_and_substring_matches(self, authenticated_client, user, settings):
+        """Test que las coincidencias por prefijo no ocultan las de subcadena, que quedan al final."""
+        settings.TASKS_SEARCH_SUBSTRING = True
+        Task.objects.create(title="Llamar", description="Empanadas para la cena", user=user)
+        Task.objects.create(title="Ir a la panadería", user=user)
+
+        assert _titles(authenticated_client.get(URL, {"search": "pan"})) == ["Ir a la panadería", "Llamar"]
+
+    def test_no_match(self, authenticated_client, user):
+        """Test que una búsqueda sin coincidencias retorna una lista vacía."""
+        Task.objects.create(title="Algo", user=user)
+
+        response = authenticated_client.get(URL, {"search": "nada"})
+
+        assert response.data["count"] == 0
+
+    @pytest.mark.skipif(connection.vendor != "postgresql", reason="Requiere PostgreSQL")
+    def test_postgres_uses_gin_index(self, user):
+        """Test que en PostgreSQL la búsqueda usa el índice GIN."""
+        from tasks.search import postgres_backend
+
+        Task.objects.create(title="Comprar pan", user=user)
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+        queryset = postgres_backend.search(Task.objects.all(), ["pan"], user.pk)
+
+        assert "task_search_vector_gin" in queryset.explain()
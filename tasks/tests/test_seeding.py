@@ -0,0 +1,58 @@
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import CommandError, call_command
+
+import pytest
+
+from tasks.models import Task, TaskCounters
+from tasks.seeding import DEFAULT_PASSWORD, TaskSeeder
+
+
+@pytest.mark.django_db
+class TestSeedTasks:
+    """Tests para el generador de datos sintéticos."""
+
+    def test_command_creates_users_and_tasks(self):
+        """Test que seed_tasks crea N usuarios con M tareas y sus contadores."""
+        out = StringIO()
+        call_command("seed_tasks", users=3, tasks=50, seed=1, stdout=out)
+
+        users = User.objects.filter(username__startswith="seed")
+        assert users.count() == 3
+        assert Task.objects.filter(user__in=users).count() == 150
+        assert TaskCounters.objects.for_user(users.first()).total == 50
+        assert users.first().check_password(DEFAULT_PASSWORD)
+        assert "Generadas 150 tareas para 3 usuarios" in out.getvalue()
+
+    def test_distributions(self):
+        """Test que los datos usan todos los estados y prioridades, con y sin fecha límite."""
+        TaskSeeder(1, 500, seed=1).run()
+
+        assert set(Task.objects.values_list("status", flat=True)) == {choice for choice, _ in Task.STATUS_CHOICES}
+        assert set(Task.objects.values_list("priority", flat=True)) == {choice for choice, _ in Task.PRIORITY_CHOICES}
+        assert 0 < Task.objects.filter(due_date__isnull=True).count() < 500
+        closed = Task.objects.filter(status__in=["completed", "cancelled"], due_date__isnull=False).first()
+        assert closed.due_date < closed.created_at
+
+    def test_same_seed_same_data(self):
+        """Test que la misma semilla genera los mismos datos."""
+        TaskSeeder(1, 20, prefix="a", seed=7).run()
+        TaskSeeder(1, 20, prefix="b", seed=7).run()
+
+        first = list(Task.objects.filter(user__username="a1").order_by("pk").values_list("title", "status", "priority"))
+        second = list(Task.objects.filter(user__username="b1").order_by("pk").values_list("title", "status", "priority"))
+        assert first == second
+
+    def test_reuses_existing_users(self, user):
+        """Test que los usuarios existentes se reutilizan y reciben más tareas."""
+        TaskSeeder(2, 5, prefix="testuser").run()
+        TaskSeeder(2, 5, prefix="testuser").run()
+
+        assert User.objects.filter(username__in=["testuser1", "testuser2"]).count() == 2
+        assert Task.objects.filter(user__username="testuser1").count() == 10
+
+    def test_invalid_arguments(self):
+        """Test que se rechaza generar cero usuarios."""
+        with pytest.raises(CommandError):
+            call_command("seed_tasks", users=0)
@@ -3,7 +3,9 @@ from datetime import timedelta
 from django.utils import timezone
 
 import pytest
+from rest_framework.renderers import JSONRenderer
 
+from tasks.models import Task
 from tasks.serializers import TaskListSerializer, TaskSerializer
 
 
@@ -100,3 +102,39 @@ class TestTaskListSerializer:
         serializer = TaskListSerializer(task)
 
         assert serializer.data["status_display"] == "Completada"
+
+
+@pytest.mark.django_db
+class TestTaskListFastPath:
+    """Tests para el camino rápido de TaskListSerializer."""
+
+    @pytest.fixture
+    def varied_tasks(self, user, other_user):
+        Task.objects.create(title="Sin fecha", status="in_progress", priority="low", user=user)
+        Task.objects.create(
+            title="Con fecha ñandú",
+            status="cancelled",
+            priority="high",
+            due_date=timezone.now() + timedelta(days=3),
+            user=other_user,
+        )
+        return Task.objects.order_by("id")
+
+    @pytest.mark.parametrize("tz", ["America/Santiago", "UTC"])
+    def test_output_byte_identical(self, varied_tasks, tz):
+        """Test que el JSON del camino rápido es idéntico byte a byte al del serializer."""
+        with timezone.override(tz):
+            expected = JSONRenderer().render(TaskListSerializer(varied_tasks, many=True).data)
+            fast = JSONRenderer().render(TaskListSerializer.fast_serialize(TaskListSerializer.fast_values(varied_tasks)))
+
+        assert fast == expected
+
+    def test_list_endpoint_constant_queries(self, authenticated_client, user, other_user, django_assert_num_queries):
+        """Test que el listado no consulta auth_user por cada fila."""
+        Task.objects.bulk_create(Task(title=f"T{i}", user=user) for i in range(10))
+
+        # Autenticación + validadores (MAX/COUNT) + COUNT + SELECT con JOIN.
+        with django_assert_num_queries(4):
+            response = authenticated_client.get("/api/tasks/")
+
+        assert response.data["results"][0]["user_username"] == user.username
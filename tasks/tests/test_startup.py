@@ -0,0 +1,84 @@
+import runpy
+from io import StringIO
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management import call_command
+
+from config.warmup import APP_STEPS, warm_up
+from tasks.management.commands.import_times import parse_import_times
+
+GUNICORN_CONF = Path(settings.BASE_DIR) / "gunicorn.conf.py"
+
+IMPORTTIME_OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     tasks.search
+import time:      2500 |       2620 |   tasks.views
+import time:        80 |         80 | yaml
+"""
+
+
+def gunicorn_config(monkeypatch, **env):
+    for name in ("GUNICORN_WORKER_CLASS", "GUNICORN_WORKERS", "GUNICORN_THREADS", "GUNICORN_PRELOAD"):
+        monkeypatch.delenv(name, raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    monkeypatch.setattr("os.sched_getaffinity", lambda pid: {0, 1, 2, 3}, raising=False)
+    # Definida (vacía) para que el setdefault del archivo no deje el modo multiproceso activo en los tests.
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", "")
+    return runpy.run_path(str(GUNICORN_CONF))
+
+
+class TestGunicornConfig:
+    """Tests para el dimensionado de gunicorn.conf.py."""
+
+    def test_gthread_default(self, monkeypatch):
+        """Test que por defecto hay un worker gthread por CPU, con preload."""
+        conf = gunicorn_config(monkeypatch)
+
+        assert (conf["worker_class"], conf["workers"], conf["threads"]) == ("gthread", 4, 4)
+        assert conf["wsgi_app"] == "config.wsgi:application"
+        assert conf["preload_app"] is True
+        assert conf["max_requests"] > 0 and conf["max_requests_jitter"] > 0
+
+    def test_sync_and_asgi(self, monkeypatch):
+        """Test el tamaño de los workers sync y que asgi sirve config.asgi con uvicorn."""
+        sync = gunicorn_config(monkeypatch, GUNICORN_WORKER_CLASS="sync")
+        asgi = gunicorn_config(monkeypatch, GUNICORN_WORKER_CLASS="asgi")
+
+        assert (sync["workers"], sync["threads"]) == (9, 1)
+        assert asgi["worker_class"] == "uvicorn_worker.UvicornWorker"
+        assert asgi["wsgi_app"] == "config.asgi:application"
+        assert asgi["workers"] == 4
+
+    def test_overrides(self, monkeypatch):
+        """Test que las variables de entorno reemplazan el cálculo."""
+        conf = gunicorn_config(monkeypatch, GUNICORN_WORKERS="2", GUNICORN_THREADS="8", GUNICORN_PRELOAD="False")
+
+        assert (conf["workers"], conf["threads"], conf["preload_app"]) == (2, 8, False)
+
+
+class TestWarmUp:
+    """Tests para el calentamiento y el comando import_times."""
+
+    def test_app_steps(self):
+        """Test que el calentamiento informa el tiempo de cada paso."""
+        timings = warm_up(APP_STEPS)
+
+        assert list(timings) == ["modules", "urls", "serializers", "schema"]
+        assert all(seconds >= 0 for seconds in timings.values())
+
+    def test_parse_import_times(self):
+        """Test que se interpreta la salida de python -X importtime."""
+        assert parse_import_times(IMPORTTIME_OUTPUT) == [
+            ("tasks.search", 120, 120, 2),
+            ("tasks.views", 2500, 2620, 1),
+            ("yaml", 80, 80, 0),
+        ]
+
+    def test_import_times_command(self):
+        """Test que import_times lista los módulos del proyecto."""
+        out = StringIO()
+        call_command("import_times", prefix="tasks", sort="self", limit=50, stdout=out)
+
+        assert "tasks.views" in out.getvalue()
+        assert "ms de importación" in out.getvalue()
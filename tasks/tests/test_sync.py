@@ -0,0 +1,155 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+import pytest
+from rest_framework import status
+
+from tasks.models import Task, TaskTombstone
+from tasks.sync import decode_cursor, encode_cursor
+
+URL = "/api/tasks/changes/"
+
+
+@pytest.fixture(autouse=True)
+def no_overlap(settings):
+    settings.TASKS_SYNC_OVERLAP_SECONDS = 0
+
+
+def _sync(client, since=None):
+    response = client.get(URL, {"since": since} if since else {})
+    assert response.status_code == status.HTTP_200_OK, response.data
+    return response.data
+
+
+def _ids(data):
+    return [item["id"] for item in data["updated"]]
+
+
+@pytest.mark.django_db
+class TestTaskChanges:
+    """Tests para la sincronización incremental de /api/tasks/changes/."""
+
+    def test_initial_sync_returns_everything(self, authenticated_client, user, other_user):
+        """Test que sin `since` se entregan todas las tareas propias."""
+        tasks = [Task.objects.create(title=f"T{i}", user=user) for i in range(3)]
+        Task.objects.create(title="Ajena", user=other_user)
+
+        data = _sync(authenticated_client)
+
+        assert _ids(data) == [task.id for task in tasks]
+        assert data["deleted"] == []
+        assert data["has_more"] is False
+        assert data["updated"][0]["title"] == "T0"
+
+    def test_only_changes_since_cursor(self, authenticated_client, user):
+        """Test que con `since` solo se entregan las tareas creadas o modificadas después."""
+        old, edited = Task.objects.create(title="Vieja", user=user), Task.objects.create(title="Editada", user=user)
+        cursor = _sync(authenticated_client)["next"]
+
+        edited.title = "Editada 2"
+        edited.save()
+        created = Task.objects.create(title="Nueva", user=user)
+        data = _sync(authenticated_client, cursor)
+
+        assert _ids(data) == [edited.id, created.id]
+        assert old.id not in _ids(data)
+        assert _sync(authenticated_client, data["next"])["updated"] == []
+
+    def test_deletions_are_reported(self, authenticated_client, user, task):
+        """Test que eliminar una tarea (individual o en lote) se informa como id eliminado."""
+        other = Task.objects.create(title="Otra", user=user)
+        cursor = _sync(authenticated_client)["next"]
+
+        authenticated_client.delete(f"/api/tasks/{task.id}/")
+        authenticated_client.delete("/api/tasks/bulk/", {"ids": [other.id]}, format="json")
+        data = _sync(authenticated_client, cursor)
+
+        assert data["updated"] == []
+        assert data["deleted"] == [task.id, other.id]
+
+    def test_paging_with_has_more(self, authenticated_client, user, settings):
+        """Test que con más cambios que el límite se pagina sin repetir ni saltar tareas."""
+        settings.TASKS_SYNC_PAGE_SIZE = 2
+        tasks = [Task.objects.create(title=f"T{i}", user=user) for i in range(5)]
+        Task.objects.filter(id__in=[tasks[1].id, tasks[2].id]).update(updated_at=tasks[1].updated_at)
+
+        ids, cursor = [], None
+        while True:
+            data = _sync(authenticated_client, cursor)
+            ids.extend(_ids(data))
+            cursor = data["next"]
+            if not data["has_more"]:
+                break
+
+        assert sorted(ids) == [task.id for task in tasks]
+        assert len(ids) == 5
+
+    def test_overlap_window_resends_recent_changes(self, authenticated_client, task, settings):
+        """Test que los cambios dentro de la ventana de solape se vuelven a entregar."""
+        settings.TASKS_SYNC_OVERLAP_SECONDS = 60
+        cursor = _sync(authenticated_client)["next"]
+
+        assert _ids(_sync(authenticated_client, cursor)) == [task.id]
+
+    def test_cost_does_not_depend_on_dataset(self, authenticated_client, user):
+        """Test que sin cambios la llamada consulta solo tareas posteriores al cursor."""
+        Task.objects.bulk_create(Task(title=f"T{i}", user=user) for i in range(20))
+        cursor = _sync(authenticated_client)["next"]
+
+        with CaptureQueriesContext(connection) as context:
+            data = _sync(authenticated_client, cursor)
+
+        task_queries = [q["sql"] for q in context.captured_queries if 'FROM "tasks_task"' in q["sql"]]
+        assert data["updated"] == []
+        assert len(task_queries) == 1
+        assert '"tasks_task"."updated_at" >' in task_queries[0]
+
+    def test_invalid_cursor(self, authenticated_client):
+        """Test que un cursor corrupto responde 404."""
+        response = authenticated_client.get(URL, {"since": "basura"})
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_expired_cursor(self, authenticated_client, user, settings):
+        """Test que un cursor anterior al horizonte de lápidas responde 410."""
+        old = timezone.now() - timedelta(days=settings.TASKS_TOMBSTONE_RETENTION_DAYS + 1)
+        cursor = encode_cursor({"updated": (old, 0), "deleted": (old, 0)})
+
+        response = authenticated_client.get(URL, {"since": cursor})
+
+        assert response.status_code == status.HTTP_410_GONE
+
+    def test_cursor_round_trip(self):
+        """Test que el cursor codifica ambas posiciones."""
+        now = timezone.now()
+        position = {"updated": (now, 3), "deleted": (now, 7)}
+
+        assert decode_cursor(encode_cursor(position)) == position
+
+
+@pytest.mark.django_db
+class TestTaskTombstones:
+    """Tests para las lápidas de tareas eliminadas."""
+
+    def test_model_delete_creates_tombstone(self, task):
+        """Test que Task.delete deja una lápida."""
+        task_id = task.id
+        task.delete()
+
+        assert list(TaskTombstone.objects.values_list("task_id", "user_id")) == [(task_id, task.user_id)]
+
+    def test_purge_command(self, user):
+        """Test que el comando purga solo las lápidas fuera del horizonte."""
+        TaskTombstone.objects.create(user=user, task_id=1, deleted_at=timezone.now() - timedelta(days=40))
+        TaskTombstone.objects.create(user=user, task_id=2)
+        out = StringIO()
+
+        call_command("purge_task_tombstones", stdout=out)
+
+        assert list(TaskTombstone.objects.values_list("task_id", flat=True)) == [2]
+        assert "Lápidas purgadas: 1." in out.getvalue()
@@ -0,0 +1,120 @@
+import json
+import logging
+import time
+
+import pytest
+from rest_framework import status
+
+from config import timing
+from config.timing import QueryBudgetExceeded
+from tasks.models import Task
+from tasks.views import TaskViewSet
+
+URL = "/api/tasks/"
+
+
+def server_timing(response):
+    """Retorna {métrica: dur} del encabezado Server-Timing."""
+    metrics = {}
+    for entry in response["Server-Timing"].split(", "):
+        name, *params = entry.split(";")
+        metrics[name] = float(dict(param.split("=", 1) for param in params)["dur"])
+    return metrics
+
+
+@pytest.fixture(autouse=True)
+def timing_header(settings):
+    settings.REQUEST_TIMING = {**settings.REQUEST_TIMING, "HEADER": True}
+
+
+@pytest.mark.django_db
+class TestRequestTiming:
+    """Tests para RequestTimingMiddleware y los presupuestos de consultas."""
+
+    def test_server_timing_header(self, authenticated_client, task):
+        """Test que la respuesta informa tiempo total, de base de datos y de serializers."""
+        response = authenticated_client.get(f"{URL}{task.id}/")
+
+        metrics = server_timing(response)
+        assert {"db", "total", "serializer"} <= set(metrics)
+        assert metrics["total"] >= metrics["db"]
+        assert 'desc="2 consultas"' in response["Server-Timing"]
+
+    def test_log_line(self, authenticated_client, task, caplog):
+        """Test que cada petición deja una línea JSON con la vista y su presupuesto."""
+        with caplog.at_level(logging.INFO, logger="config.timing"):
+            authenticated_client.get(URL)
+
+        line = json.loads(caplog.records[-1].getMessage())
+        assert line["view"] == "TaskViewSet.list"
+        assert line["status"] == 200
+        assert line["query_budget"] == TaskViewSet.query_budget["list"]
+        assert {"total_ms", "db_ms", "queries", "serializer_ms"} <= set(line)
+
+    def test_log_line_can_be_silenced(self, authenticated_client, task, caplog):
+        """Test que en nivel WARNING no se escribe una línea por petición."""
+        with caplog.at_level(logging.WARNING, logger="config.timing"):
+            authenticated_client.get(URL)
+
+        assert caplog.records == []
+
+    def test_header_is_opt_in(self, settings, authenticated_client, task, caplog):
+        """Test que sin HEADER no se envía Server-Timing, pero se sigue registrando la línea."""
+        settings.REQUEST_TIMING = {**settings.REQUEST_TIMING, "HEADER": False}
+        with caplog.at_level(logging.INFO, logger="config.timing"):
+            response = authenticated_client.get(URL)
+
+        assert "Server-Timing" not in response
+        assert json.loads(caplog.records[-1].getMessage())["view"] == "TaskViewSet.list"
+
+    def test_list_budget_independent_of_size(self, authenticated_client, user):
+        """Test que el listado no hace una consulta por tarea (user_username)."""
+        Task.objects.bulk_create(Task(title=f"T{i}", user=user) for i in range(40))
+
+        assert authenticated_client.get(URL, {"page_size": 40}).status_code == status.HTTP_200_OK
+
+    def test_budget_exceeded_raises(self, authenticated_client, task, monkeypatch):
+        """Test que con ENFORCE_BUDGETS superar el presupuesto falla la petición."""
+        monkeypatch.setattr(TaskViewSet, "query_budget", {**TaskViewSet.query_budget, "retrieve": 1})
+
+        with pytest.raises(QueryBudgetExceeded, match="2 consultas, presupuesto 1"):
+            authenticated_client.get(f"{URL}{task.id}/")
+
+    def test_budget_exceeded_logs(self, settings, authenticated_client, task, monkeypatch, caplog):
+        """Test que sin ENFORCE_BUDGETS solo se registra una advertencia."""
+        settings.REQUEST_TIMING = {**settings.REQUEST_TIMING, "ENFORCE_BUDGETS": False}
+        monkeypatch.setattr(TaskViewSet, "query_budget", {**TaskViewSet.query_budget, "retrieve": 1})
+
+        with caplog.at_level(logging.WARNING, logger="config.timing"):
+            response = authenticated_client.get(f"{URL}{task.id}/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "presupuesto 1" in caplog.records[-1].getMessage()
+
+    def test_function_view_budget(self, authenticated_client, caplog):
+        """Test que las vistas de función declaran su presupuesto con @query_budget."""
+        with caplog.at_level(logging.INFO, logger="config.timing"):
+            authenticated_client.get("/api/users/me/")
+
+        line = json.loads(caplog.records[-1].getMessage())
+        assert line["view"] == "current_user.get"
+        assert line["query_budget"] == 3
+
+    def test_disabled(self, settings, authenticated_client):
+        """Test que con ENABLED=False no se agrega el encabezado."""
+        settings.REQUEST_TIMING = {**settings.REQUEST_TIMING, "ENABLED": False}
+
+        assert "Server-Timing" not in authenticated_client.get(URL)
+
+    def test_nested_spans_count_once(self):
+        """Test que un span anidado del mismo nombre no duplica el tiempo."""
+        timings = timing.RequestTimings()
+        token = timing._timings.set(timings)
+        try:
+            with timing.span("serializer"):
+                with timing.span("serializer"):
+                    time.sleep(0.05)
+        finally:
+            timing._timings.reset(token)
+
+        assert 0.05 <= timings.spans["serializer"] < 0.1
@@ -1,11 +1,13 @@
+from django.conf import settings
 from django.urls import include, path
 
 from rest_framework.routers import DefaultRouter
 
+from .async_views import AsyncTaskViewSet
 from .views import TaskViewSet
 
 router = DefaultRouter()
-router.register(r"", TaskViewSet, basename="task")
+router.register(r"", AsyncTaskViewSet if settings.TASKS_ASYNC_VIEWS else TaskViewSet, basename="task")
 
 
 urlpatterns = [path("", include(router.urls))]
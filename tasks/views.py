@@ -1,11 +1,28 @@
+import json
+
+from django.conf import settings
+from django.db import transaction
+from django.http import StreamingHttpResponse
+
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework import filters, viewsets
+from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 
-from .models import Task
-from .serializers import TaskListSerializer, TaskSerializer
+from config.routers import pin_user, use_primary
+from users.authentication import StatelessJWTAuthentication
+
+from . import conditional
+from .cache import cached_response
+from .export import CSVRenderer, NDJSONRenderer, stream_export
+from .importers import CSVParser, NDJSONParser, TaskImporter
+from .models import Task, TaskCounters, TaskTombstone
+from .pagination import TaskCursorPagination, wants_cursor_pagination
+from .search import RankedOrderingFilter, TaskSearchFilter
+from .serializers import TaskBulkDeleteSerializer, TaskListSerializer, TaskSerializer
+from .sync import get_changes
 
 
 class TaskViewSet(viewsets.ModelViewSet):
@@ -19,24 +36,80 @@ class TaskViewSet(viewsets.ModelViewSet):
     - PUT /api/tasks/{id} - Actualizar tarea completa
     - PATCH /api/tasks/{id} - Actualizar tarea parcial
     - DELETE /api/tasks/{id} - Eliminar tarea
+    - POST/PATCH/DELETE /api/tasks/bulk/ - Crear, actualizar o eliminar en lote
+    - GET /api/tasks/export/?format=ndjson|csv - Exportar todas las tareas en streaming
+    - POST /api/tasks/import/ - Importar tareas desde un cuerpo NDJSON o CSV
+    - GET /api/tasks/changes/?since=<cursor> - Cambios desde la última sincronización
+
+    El listado admite paginación por cursor con `?pagination=cursor`.
+    `?search=` usa el índice de texto completo y ordena por relevancia.
+    Las lecturas de listados se sirven desde `response_cache` mientras el
+    usuario no modifique sus tareas. Listados y detalle responden con ETag (el
+    detalle también con Last-Modified) para GET condicional con 304, y PUT/PATCH
+    admiten If-Match.
+    Con JWT_STATELESS el usuario se toma de los claims del token.
     """
 
     permission_classes = [IsAuthenticated]
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
-        filters.OrderingFilter,
+        TaskSearchFilter,
+        RankedOrderingFilter,
     ]
     filterset_fields = ["status", "priority"]
     search_fields = ["title", "description"]
     ordering_fields = ["created_at", "updated_at", "due_date", "priority"]
     ordering = ["-created_at"]
 
+    # Consultas máximas por acción (config.timing), independientes del número de
+    # tareas. Incluyen la creación de la fila de TaskCounters la primera vez y los
+    # SAVEPOINT de las transacciones. En export e import solo cuentan las consultas
+    # previas al streaming.
+    query_budget = {
+        "list": 6,
+        "retrieve": 2,
+        "create": 9,
+        "update": 9,
+        "partial_update": 9,
+        "destroy": 8,
+        "pending": 3,
+        "completed": 3,
+        "complete": 7,
+        "stats": 7,
+        "changes": 3,
+        "export": 2,
+        "import_tasks": 1,
+        "bulk": 9,
+        "bulk_update": 8,
+        "bulk_destroy": 9,
+    }
+
+    def get_authenticators(self):
+        if settings.JWT_STATELESS:
+            return [StatelessJWTAuthentication()]
+        return super().get_authenticators()
+
     def get_queryset(self):
         """
         Retonar solo las tareas del usuario autenticado
         """
-        return Task.objects.filter(user=self.request.user)
+        queryset = Task.objects.filter(user=self.request.user).select_related("user")
+        if self.action in ("update", "partial_update"):
+            # If-Match se evalúa con la fila bloqueada hasta guardar.
+            queryset = queryset.select_for_update(of=("self",))
+        return queryset
+
+    @property
+    def paginator(self):
+        """
+        Usa paginación keyset cuando el cliente la pide; si no, la paginación global.
+        """
+        if not hasattr(self, "_paginator"):
+            if self.request is not None and wants_cursor_pagination(self.request):
+                self._paginator = TaskCursorPagination()
+            else:
+                return super().paginator
+        return self._paginator
 
     def get_serializer_class(self):
         """
@@ -46,6 +119,59 @@ class TaskViewSet(viewsets.ModelViewSet):
             return TaskListSerializer
         return TaskSerializer
 
+    @cached_response("list")
+    def list(self, request, *args, **kwargs):
+        """
+        Lista las tareas leyendo solo las columnas necesarias con values() y
+        serializándolas con el camino rápido de TaskListSerializer.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        return self.conditional_response(conditional.queryset_validators(request, queryset), lambda: self.fast_list(queryset))
+
+    def fast_list(self, queryset):
+        rows = TaskListSerializer.fast_values(queryset)
+
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(TaskListSerializer.fast_serialize(page))
+        return Response(TaskListSerializer.fast_serialize(rows))
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Detalle de la tarea; responde 304 sin serializar si el cliente ya tiene esta versión.
+        """
+        instance = self.get_object()
+        validators = conditional.instance_validators(request, instance)
+        return self.conditional_response(validators, lambda: Response(self.get_serializer(instance).data))
+
+    def update(self, request, *args, **kwargs):
+        """
+        Actualiza la tarea. Con If-Match solo se guarda si la tarea no cambió
+        desde que el cliente la leyó; si cambió responde 412.
+        """
+        partial = kwargs.pop("partial", False)
+        with transaction.atomic():
+            instance = self.get_object()
+            precondition = conditional.evaluate(request, *conditional.instance_validators(request, instance))
+            if precondition is not None:
+                return precondition
+
+            serializer = self.get_serializer(instance, data=request.data, partial=partial)
+            serializer.is_valid(raise_exception=True)
+            self.perform_update(serializer)
+
+        return conditional.set_validators(Response(serializer.data), *conditional.instance_validators(request, instance))
+
+    def conditional_response(self, validators, render):
+        """
+        Responde 304/412 según los encabezados condicionales, o llama a `render()`
+        y agrega sus validadores (ETag y, si hay, Last-Modified) a la respuesta.
+        """
+        response = conditional.evaluate(self.request, *validators)
+        if response is None:
+            response = conditional.set_validators(render(), *validators)
+        return response
+
     def perform_create(self, serializer):
         """
         Asigna automaticamente el usuario al crear una tarea.
@@ -53,24 +179,26 @@ class TaskViewSet(viewsets.ModelViewSet):
         serializer.save(user=self.request.user)
 
     @action(detail=False, methods=["get"])
+    @cached_response("pending")
     def pending(self, request):
         """
         Endpoint personalizado: GET /api/tasks/pending
         Retorna solo las tareas pendientes.
         """
         tasks = self.get_queryset().filter(status="pending")
-        serializer = self.get_serializer(tasks, many=True)
-        return Response(serializer.data)
+        validators = conditional.queryset_validators(request, tasks)
+        return self.conditional_response(validators, lambda: Response(self.get_serializer(tasks, many=True).data))
 
     @action(detail=False, methods=["get"])
+    @cached_response("completed")
     def completed(self, request):
         """
         Endpoint personalizado: GET /api/tasks/completed/
         Retorna solo las tareas completadas.
         """
         tasks = self.get_queryset().filter(status="completed")
-        serializer = self.get_serializer(tasks, many=True)
-        return Response(serializer.data)
+        validators = conditional.queryset_validators(request, tasks)
+        return self.conditional_response(validators, lambda: Response(self.get_serializer(tasks, many=True).data))
 
     @action(detail=True, methods=["post"])
     def complete(self, request, pk=None):
@@ -89,17 +217,140 @@ class TaskViewSet(viewsets.ModelViewSet):
         """
         Endpoint personalizado: GET /api/tasks/stats/
         Retorna estadisticas de las tareas de usuario.
+
+        Se sirven desde la fila de TaskCounters del usuario, que se mantiene
+        al crear, actualizar, completar y eliminar tareas.
+        """
+        counters = TaskCounters.objects.for_user(request.user)
+        return Response(counters.as_dict())
+
+    @action(detail=False, methods=["get"])
+    def changes(self, request):
+        """
+        Endpoint personalizado: GET /api/tasks/changes/?since=<cursor>
+        Retorna las tareas creadas o modificadas y los ids eliminados desde el
+        cursor, y el cursor para la próxima llamada. Si `has_more` es verdadero
+        hay que volver a llamar de inmediato con `next`.
         """
-        queryset = self.get_queryset()
-
-        stats = {
-            "total": queryset.count(),
-            "pending": queryset.filter(status="pending").count(),
-            "in_progress": queryset.filter(status="in_progress").count(),
-            "completed": queryset.filter(status="completed").count(),
-            "cancelled": queryset.filter(status="cancelled").count(),
-            "high_priority": queryset.filter(priority="high").count(),
-            "medium_priority": queryset.filter(priority="medium").count(),
-            "low_priority": queryset.filter(priority="low").count(),
-        }
-        return Response(stats)
+        changes = get_changes(self.get_queryset(), request.user, since=request.query_params.get("since"))
+        changes["updated"] = TaskSerializer(changes["updated"], many=True, context=self.get_serializer_context()).data
+        return Response(changes)
+
+    @action(detail=False, methods=["get"], renderer_classes=[NDJSONRenderer, CSVRenderer])
+    def export(self, request):
+        """
+        Endpoint personalizado: GET /api/tasks/export/?format=ndjson|csv
+        Exporta todas las tareas del usuario sin paginar, en streaming. Acepta
+        los mismos filtros, `?search=` y `?ordering=` que el listado.
+        """
+        return stream_export(self.filter_queryset(self.get_queryset()), request.accepted_renderer)
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="import",
+        parser_classes=[NDJSONParser, CSVParser],
+        renderer_classes=[NDJSONRenderer, JSONRenderer],
+    )
+    def import_tasks(self, request):
+        """
+        Endpoint personalizado: POST /api/tasks/import/
+        Importa tareas desde el cuerpo de la petición (Content-Type
+        application/x-ndjson o text/csv). La respuesta es un stream NDJSON con el
+        avance por bloque, los errores por fila y un resumen final.
+
+        Las filas se validan y escriben mientras se envía la respuesta, después
+        de los middlewares: la petición se fija al primario antes de retornar, y
+        la fijación se renueva antes del resumen final porque una importación
+        grande puede durar más que DB_PRIMARY_PIN_SECONDS.
+        """
+        use_primary()
+        user_id = request.user.pk
+        # El cuerpo se lee antes de responder para que 415/400 no lleguen a mitad del stream.
+        rows = request.data
+
+        def stream():
+            for event in TaskImporter(request.user).run(rows):
+                if event["event"] == "done":
+                    pin_user(user_id)
+                yield json.dumps(event, ensure_ascii=False) + "\n"
+
+        return StreamingHttpResponse(stream(), content_type="application/x-ndjson; charset=utf-8")
+
+    def get_bulk_serializer(self, *args, **kwargs):
+        """
+        TaskSerializer(many=True) con el límite de elementos por lote.
+        """
+        kwargs.update(many=True, allow_empty=False, max_length=settings.TASKS_BULK_MAX_ITEMS)
+        return self.get_serializer(*args, **kwargs)
+
+    def bulk_error_response(self, errors, ids=None):
+        """
+        Respuesta 400 con los errores de cada elemento del lote, identificados por su índice.
+        """
+        if isinstance(errors, list):
+            errors = {
+                "errors": [
+                    {"index": index, **({"id": ids[index]} if ids else {}), "errors": item_errors}
+                    for index, item_errors in enumerate(errors)
+                    if item_errors
+                ]
+            }
+        return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+
+    @action(detail=False, methods=["post"])
+    def bulk(self, request):
+        """
+        Endpoint personalizado: POST /api/tasks/bulk/
+        Crea una lista de tareas con un solo INSERT. Si algún elemento es
+        inválido no se crea ninguna y se informan los errores por índice.
+        """
+        serializer = self.get_bulk_serializer(data=request.data)
+        if not serializer.is_valid():
+            return self.bulk_error_response(serializer.errors)
+
+        serializer.save(user=request.user)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    @bulk.mapping.patch
+    def bulk_update(self, request):
+        """
+        Endpoint personalizado: PATCH /api/tasks/bulk/
+        Actualiza parcialmente una lista de tareas ([{"id": 1, ...}, ...]).
+        La propiedad de todas las tareas se verifica con una sola consulta.
+        """
+        items = request.data if isinstance(request.data, list) else []
+        ids = [item.get("id") for item in items if isinstance(item, dict)]
+
+        with transaction.atomic():
+            tasks = self.get_queryset().select_for_update(of=("self",)).in_bulk([i for i in ids if isinstance(i, int)])
+            serializer = self.get_bulk_serializer(tasks, data=request.data, partial=True)
+            if not serializer.is_valid():
+                return self.bulk_error_response(serializer.errors)
+            serializer.save()
+
+        return Response(serializer.data)
+
+    @bulk.mapping.delete
+    def bulk_destroy(self, request):
+        """
+        Endpoint personalizado: DELETE /api/tasks/bulk/
+        Elimina las tareas de {"ids": [...]} con un solo DELETE filtrado.
+        """
+        serializer = TaskBulkDeleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = serializer.validated_data["ids"]
+
+        with transaction.atomic():
+            queryset = self.get_queryset().filter(id__in=ids)
+            found = set(queryset.select_for_update(of=("self",)).values_list("id", flat=True))
+            if set(ids) - found:
+                errors = [{} if task_id in found else {"id": ["Tarea no encontrada."]} for task_id in ids]
+                return self.bulk_error_response(errors, ids=ids)
+
+            deltas = TaskCounters.objects.deltas_for(queryset, sign=-1)
+            TaskTombstone.objects.record_deletions(queryset)
+            deleted, _ = queryset.delete()
+            TaskCounters.objects.apply_many(deltas)
+
+        return Response({"deleted": deleted})
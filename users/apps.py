@@ -1,5 +1,20 @@
 from django.apps import AppConfig
+from django.contrib.auth import get_user_model
+from django.core import checks
+from django.db.models.signals import post_delete, post_save
 
 
 class UsersConfig(AppConfig):
     name = "users"
+
+    def ready(self):
+        from . import schema  # noqa: F401 (registra la extensión de drf-spectacular)
+        from .authentication import invalidate_cached_user, revoke_tokens_on_credentials_change
+        from .checks import check_token_generation_cache, check_user_cache
+
+        User = get_user_model()
+        post_save.connect(invalidate_cached_user, sender=User, dispatch_uid="users_cache_save")
+        post_delete.connect(invalidate_cached_user, sender=User, dispatch_uid="users_cache_delete")
+        post_save.connect(revoke_tokens_on_credentials_change, sender=User, dispatch_uid="users_token_generation")
+        checks.register(check_user_cache, checks.Tags.caches)
+        checks.register(check_token_generation_cache, checks.Tags.caches, checks.Tags.security)
@@ -0,0 +1,263 @@
+"""
+Autenticación JWT con caché de usuarios.
+
+JWTAuthentication consulta auth_user en cada petición. CachedJWTAuthentication
+guarda el usuario por `user_id` en una LRU acotada con TTL dentro del proceso y
+solo va a la base de datos en los fallos.
+
+Cada entrada recuerda la versión del usuario, guardada en la caché compartida
+(USER_CACHE["SHARED_CACHE"]). Guardar o eliminar un usuario (cambio de
+contraseña, edición del perfil, desactivación) incrementa esa versión, así que
+la entrada deja de valer también en los demás procesos. Las escrituras que no
+envían señales (p. ej. `User.objects.update(...)`) se reflejan al vencer el TTL.
+"""
+
+import copy
+import threading
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.utils.translation import gettext_lazy as _
+
+from asgiref.sync import sync_to_async
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from config import metrics
+from config.cache import LRUCache, aget_generation, bump_generation, get_generation
+
+from .models import ClaimsUser, TokenGeneration
+from .tokens import GENERATION_CLAIM
+
+
+class UserCache:
+    """
+    LRU de usuarios autenticados con invalidación por versión y métricas.
+    """
+
+    def __init__(self):
+        self._local = None
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.stale = self.invalidations = 0
+
+    @property
+    def config(self):
+        return settings.USER_CACHE
+
+    @property
+    def enabled(self):
+        return self.config["ENABLED"]
+
+    @property
+    def shared(self):
+        alias = self.config["SHARED_CACHE"]
+        return caches[alias] if alias else None
+
+    @property
+    def local(self):
+        if self._local is None:
+            self._local = LRUCache(self.config["MAX_ENTRIES"], ttl=self.config["TIMEOUT"])
+        return self._local
+
+    def version_key(self, user_id):
+        return f"users:version:{user_id}"
+
+    def version(self, user_id):
+        if self.shared is None:
+            return 0
+        return get_generation(self.shared, self.version_key(user_id))
+
+    async def aversion(self, user_id):
+        if self.shared is None:
+            return 0
+        return await aget_generation(self.shared, self.version_key(user_id))
+
+    def get(self, user_id):
+        """
+        Retorna (usuario, versión). El usuario es None si no está en caché o quedó obsoleto.
+        Hay que leer la versión antes de consultar la base de datos.
+        """
+        return self._lookup(user_id, self.version(user_id))
+
+    async def aget(self, user_id):
+        return self._lookup(user_id, await self.aversion(user_id))
+
+    def _lookup(self, user_id, version):
+        entry = self.local.get(user_id)
+        if entry is not None and entry[1] != version:
+            self.local.delete(user_id)
+            self._count("stale")
+            entry = None
+
+        self._count("hits" if entry is not None else "misses")
+        return (entry[0] if entry is not None else None), version
+
+    def set(self, user_id, user, version):
+        self.local.set(user_id, (user, version))
+
+    def invalidate(self, user_id):
+        """
+        Descarta el usuario ahora y de nuevo al confirmar la transacción, para que
+        una autenticación concurrente no guarde la fila previa al commit.
+        """
+        self.local.delete(user_id)
+        self._count("invalidations")
+        if self.shared is not None:
+            key = self.version_key(user_id)
+            bump_generation(self.shared, key)
+            transaction.on_commit(lambda: bump_generation(self.shared, key), robust=True)
+
+    def _count(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+        if metrics.enabled():
+            metrics.count_auth_cache(name)
+
+    def stats(self):
+        """
+        Métricas del proceso actual.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "invalidations": self.invalidations,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            "size": len(self.local),
+            "max_entries": self.local.max_entries,
+            "evictions": self.local.evictions,
+        }
+
+    def clear(self):
+        """
+        Vacía la caché local y reinicia las métricas (útil en tests).
+        """
+        self._local = None
+        self.hits = self.misses = self.stale = self.invalidations = 0
+
+
+user_cache = UserCache()
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication que resuelve el usuario del token desde `user_cache`.
+
+    `aauthenticate` es la variante asíncrona que usan las vistas async
+    (tasks.async_views): la caché compartida y la consulta del usuario se
+    esperan sin ocupar un hilo.
+    """
+
+    async def aauthenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        validated_token = self.get_validated_token(raw_token)
+        return await self.aget_user(validated_token), validated_token
+
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if not user_cache.enabled or user_id is None:
+            return super().get_user(validated_token)
+
+        user, version = user_cache.get(user_id)
+        if user is None:
+            user = super().get_user(validated_token)
+            user_cache.set(user_id, user, version)
+        else:
+            self.check_user(user, validated_token)
+        # Cada petición recibe su propia copia: las vistas pueden modificar request.user.
+        return copy.copy(user)
+
+    async def aget_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if not user_cache.enabled or user_id is None:
+            return await sync_to_async(JWTAuthentication.get_user)(self, validated_token)
+
+        user, version = await user_cache.aget(user_id)
+        if user is None:
+            try:
+                user = await self.user_model.objects.aget(**{api_settings.USER_ID_FIELD: user_id})
+            except self.user_model.DoesNotExist:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found")
+            self.check_user(user, validated_token)
+            user_cache.set(user_id, user, version)
+        else:
+            self.check_user(user, validated_token)
+        return copy.copy(user)
+
+    def check_user(self, user, validated_token):
+        """
+        Las mismas verificaciones que JWTAuthentication.get_user hace tras la consulta.
+        """
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+
+
+class StatelessJWTAuthentication(CachedJWTAuthentication):
+    """
+    Autenticación sin estado (JWT_STATELESS): el usuario se construye con los
+    claims del token (ClaimsUser), sin consultar auth_user.
+
+    La revocación se comprueba con la generación de tokens del usuario, que se
+    lee de la caché compartida. Los tokens emitidos sin claims (anteriores a
+    este modo) se resuelven como en CachedJWTAuthentication.
+    """
+
+    def get_user(self, validated_token):
+        if not self.has_claims(validated_token):
+            return super().get_user(validated_token)
+
+        user = self.claims_user(validated_token)
+        self.check_generation(validated_token, TokenGeneration.objects.current(user.pk))
+        return user
+
+    async def aget_user(self, validated_token):
+        if not self.has_claims(validated_token):
+            return await super().aget_user(validated_token)
+
+        user = self.claims_user(validated_token)
+        self.check_generation(validated_token, await TokenGeneration.objects.acurrent(user.pk))
+        return user
+
+    def has_claims(self, validated_token):
+        return GENERATION_CLAIM in validated_token and api_settings.USER_ID_CLAIM in validated_token
+
+    def claims_user(self, validated_token):
+        user = ClaimsUser.from_token(validated_token, api_settings.USER_ID_CLAIM)
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        return user
+
+    def check_generation(self, validated_token, generation):
+        if validated_token[GENERATION_CLAIM] != generation:
+            raise AuthenticationFailed("El token fue revocado.", code="token_revoked")
+
+
+def invalidate_cached_user(sender, instance, **kwargs):
+    """
+    Receptor de post_save/post_delete de User.
+    """
+    user_cache.invalidate(getattr(instance, api_settings.USER_ID_FIELD))
+
+
+def revoke_tokens_on_credentials_change(sender, instance, created, **kwargs):
+    """
+    Receptor de post_save de User: cambiar la contraseña (set_password) o
+    desactivar la cuenta incrementa la generación de tokens.
+    """
+    if created:
+        return
+    if getattr(instance, "_password", None) is not None or not instance.is_active:
+        TokenGeneration.objects.bump(instance.pk)
@@ -0,0 +1,47 @@
+import logging
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+from rest_framework.request import Request
+
+from . import hashing
+
+logger = logging.getLogger(__name__)
+
+UserModel = get_user_model()
+
+
+class HashingPoolModelBackend(ModelBackend):
+    """
+    ModelBackend que verifica la contraseña en el pool de `users.hashing`.
+    Lo usan POST /api/token/ y el login del admin.
+
+    Con el pool lleno, en las vistas de DRF se propaga PasswordHashingBusy (503
+    con Retry-After); fuera de DRF (el admin) nadie lo manejaría y sería un 500,
+    así que el intento se rechaza como credenciales inválidas.
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        try:
+            return self._authenticate(username, password, **kwargs)
+        except hashing.PasswordHashingBusy:
+            if isinstance(request, Request):
+                raise
+            logger.warning("Pool de hash de contraseñas lleno; se rechaza el login de %s.", username)
+            return None
+
+    def _authenticate(self, username, password, **kwargs):
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        try:
+            user = UserModel._default_manager.get_by_natural_key(username)
+        except UserModel.DoesNotExist:
+            # Se calcula un hash igualmente para no revelar qué usuarios existen por el tiempo de respuesta.
+            hashing.make_password(password)
+            return None
+        if hashing.check_password(user, password) and self.user_can_authenticate(user):
+            return user
+        return None
@@ -0,0 +1,43 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.checks import Error, Warning
+
+
+def _is_process_local(alias):
+    return not alias or isinstance(caches[alias], LocMemCache)
+
+
+def check_user_cache(app_configs, **kwargs):
+    """
+    Avisa si las versiones de la caché de usuarios no se comparten entre procesos.
+    """
+    config = settings.USER_CACHE
+    if settings.DEBUG or not config["ENABLED"] or not _is_process_local(config["SHARED_CACHE"]):
+        return []
+    return [
+        Warning(
+            "La caché de usuarios autenticados invalida sus entradas solo en el proceso que guarda el usuario.",
+            hint="Con varios workers configure USER_CACHE_ALIAS con una caché Redis o Memcached, "
+            "o desactive USER_CACHE_ENABLED.",
+            id="users.W001",
+        )
+    ]
+
+
+def check_token_generation_cache(app_configs, **kwargs):
+    """
+    Falla si JWT_STATELESS guarda la generación de tokens en la memoria del proceso:
+    los demás workers seguirían aceptando los tokens revocados.
+    """
+    alias = settings.USER_CACHE["SHARED_CACHE"]
+    if not settings.JWT_STATELESS or not alias or not isinstance(caches[alias], LocMemCache):
+        return []
+    return [
+        Error(
+            "JWT_STATELESS guarda la generación de tokens en LocMemCache: solo el proceso que "
+            "revoca los tokens deja de aceptarlos.",
+            hint="Configure USER_CACHE_ALIAS con una caché Redis o Memcached, o desactive JWT_STATELESS.",
+            id="users.E001",
+        )
+    ]
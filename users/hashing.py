@@ -0,0 +1,131 @@
+"""
+Hash y verificación de contraseñas fuera del hilo de la petición.
+
+PBKDF2 ocupa la CPU durante decenas de milisegundos por llamada. Con una ráfaga
+de logins, cada worker queda hashing y las demás rutas (p. ej. CRUD de tareas)
+esperan. Aquí el cálculo se envía a un pool de hilos acotado
+(PASSWORD_HASHING["MAX_WORKERS"]), y hashlib libera el GIL mientras calcula.
+Cuando ya hay MAX_WORKERS + QUEUE_SIZE operaciones en curso, la petición falla
+de inmediato con 503 y Retry-After en lugar de encolarse.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth import hashers
+
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class PasswordHashingBusy(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "El servicio de autenticación está saturado; intente de nuevo en unos segundos."
+    default_code = "password_hashing_busy"
+
+    def __init__(self, wait, detail=None, code=None):
+        super().__init__(detail, code)
+        # El exception_handler de DRF lo envía como cabecera Retry-After.
+        self.wait = wait
+
+
+class PasswordHashingExecutor:
+    """
+    Pool acotado para las operaciones de hash, con métricas de la cola.
+    """
+
+    def __init__(self):
+        self._executor = None
+        self._lock = threading.Lock()
+        self.pending = self.peak_pending = self.completed = self.rejected = 0
+
+    @property
+    def config(self):
+        return settings.PASSWORD_HASHING
+
+    @property
+    def capacity(self):
+        return self.config["MAX_WORKERS"] + self.config["QUEUE_SIZE"]
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(self.config["MAX_WORKERS"], thread_name_prefix="password-hashing")
+        return self._executor
+
+    def run(self, function, *args):
+        """
+        Ejecuta `function(*args)` en el pool y espera su resultado. Lanza
+        PasswordHashingBusy si la cola está llena.
+        """
+        if not self.config["ENABLED"]:
+            return function(*args)
+
+        with self._lock:
+            if self.pending >= self.capacity:
+                self.rejected += 1
+                raise PasswordHashingBusy(wait=self.config["RETRY_AFTER"])
+            self.pending += 1
+            self.peak_pending = max(self.peak_pending, self.pending)
+        try:
+            return self.executor.submit(function, *args).result()
+        finally:
+            with self._lock:
+                self.pending -= 1
+                self.completed += 1
+
+    def stats(self):
+        """
+        Métricas del proceso actual.
+        """
+        max_workers = self.config["MAX_WORKERS"]
+        return {
+            "max_workers": max_workers,
+            "queue_size": self.config["QUEUE_SIZE"],
+            "active": min(self.pending, max_workers),
+            "queued": max(self.pending - max_workers, 0),
+            "peak_pending": self.peak_pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+
+    def clear(self):
+        """
+        Descarta el pool (se recrea con la configuración actual) y reinicia las métricas.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        self._executor = None
+        self.pending = self.peak_pending = self.completed = self.rejected = 0
+
+
+password_hasher = PasswordHashingExecutor()
+
+
+def make_password(raw_password):
+    return password_hasher.run(hashers.make_password, raw_password)
+
+
+def set_password(user, raw_password):
+    """
+    Equivalente a `user.set_password()` con el hash calculado en el pool.
+    """
+    user.password = make_password(raw_password)
+    # Igual que set_password: save() ejecuta password_changed y la revocación de tokens.
+    user._password = raw_password
+
+
+def check_password(user, raw_password):
+    """
+    Equivalente a `user.check_password()` con la verificación en el pool. Si el
+    hash usa parámetros obsoletos se actualiza, como hace Django.
+    """
+    outdated = []
+    valid = password_hasher.run(hashers.check_password, raw_password, user.password, outdated.append)
+    if valid and outdated:
+        user.password = make_password(raw_password)
+        user.save(update_fields=["password"])
+    return valid
@@ -0,0 +1,134 @@
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.db import models, router, transaction
+from django.db.models import F
+
+
+class TokenGenerationManager(models.Manager):
+    """
+    Lectura y avance de la generación de tokens de cada usuario.
+
+    La generación se cachea en USER_CACHE["SHARED_CACHE"] durante
+    USER_CACHE["TIMEOUT"] segundos para que la autenticación sin estado no
+    consulte la base de datos en cada petición. El plazo acota cuánto tarda un
+    proceso que no vio el bump() en rechazar los tokens revocados.
+    """
+
+    def cache_key(self, user_id):
+        return f"users:token-generation:{user_id}"
+
+    @property
+    def cache(self):
+        alias = settings.USER_CACHE["SHARED_CACHE"]
+        return caches[alias] if alias else None
+
+    @property
+    def timeout(self):
+        return settings.USER_CACHE["TIMEOUT"]
+
+    def current(self, user_id):
+        """
+        Retorna la generación vigente del usuario (0 si nunca se incrementó).
+        """
+        key = self.cache_key(user_id)
+        generation = self.cache.get(key) if self.cache is not None else None
+        if generation is None:
+            generation = self.filter(user_id=user_id).values_list("generation", flat=True).first() or 0
+            if self.cache is not None:
+                # add() no pisa el valor que haya escrito un bump() concurrente.
+                self.cache.add(key, generation, timeout=self.timeout)
+        return generation
+
+    async def acurrent(self, user_id):
+        """
+        Versión asíncrona de `current`.
+        """
+        key = self.cache_key(user_id)
+        generation = await self.cache.aget(key) if self.cache is not None else None
+        if generation is None:
+            generation = await self.filter(user_id=user_id).values_list("generation", flat=True).afirst() or 0
+            if self.cache is not None:
+                await self.cache.aadd(key, generation, timeout=self.timeout)
+        return generation
+
+    def bump(self, user_id):
+        """
+        Incrementa la generación, lo que revoca todos los tokens emitidos antes.
+        """
+        using = router.db_for_write(TokenGeneration)
+        manager = self.db_manager(using)
+        with transaction.atomic(using=using):
+            if not manager.filter(user_id=user_id).update(generation=F("generation") + 1):
+                # Primer incremento. Si otro bump concurrente crea la fila antes, el
+                # INSERT se ignora y ambos dejan la generación en 1: igual revoca los
+                # tokens emitidos con la 0.
+                manager.bulk_create([TokenGeneration(user_id=user_id, generation=1)], ignore_conflicts=True)
+            generation = manager.filter(user_id=user_id).values_list("generation", flat=True).get()
+
+        if self.cache is not None:
+            key = self.cache_key(user_id)
+            self.cache.delete(key)
+            transaction.on_commit(lambda: self.cache.set(key, generation, timeout=self.timeout), using=using)
+        return generation
+
+
+class TokenGeneration(models.Model):
+    """
+    Contador por usuario que se incrementa al cambiar la contraseña o desactivar
+    la cuenta. Los tokens llevan la generación con la que se emitieron.
+    """
+
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="token_generation",
+        verbose_name="Usuario",
+    )
+    generation = models.PositiveIntegerField(default=0, verbose_name="Generación")
+
+    objects = TokenGenerationManager()
+
+    class Meta:
+        verbose_name = "Generación de tokens"
+        verbose_name_plural = "Generaciones de tokens"
+
+    def __str__(self):
+        return f"{self.user} - {self.generation}"
+
+
+class ReadOnlyUserError(TypeError):
+    """
+    Se intentó guardar o borrar un ClaimsUser; hay que usar el User de la base de datos.
+    """
+
+
+class ClaimsUser(User):
+    """
+    Usuario construido solo con los claims del token de acceso, sin consultar
+    auth_user. Sirve para filtrar y asignar tareas; no se puede guardar.
+    """
+
+    class Meta:
+        proxy = True
+
+    @classmethod
+    def from_token(cls, token, user_id_claim):
+        user = cls(
+            id=token[user_id_claim],
+            username=token.get("username", ""),
+            email=token.get("email", ""),
+            first_name=token.get("first_name", ""),
+            last_name=token.get("last_name", ""),
+            is_active=token.get("is_active", True),
+        )
+        user._state.adding = False
+        user._state.db = router.db_for_read(User)
+        return user
+
+    def save(self, *args, **kwargs):
+        raise ReadOnlyUserError("ClaimsUser es de solo lectura; obtenga el User de la base de datos para guardarlo.")
+
+    def delete(self, *args, **kwargs):
+        raise ReadOnlyUserError("ClaimsUser es de solo lectura; obtenga el User de la base de datos para borrarlo.")
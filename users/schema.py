@@ -0,0 +1,18 @@
+"""
+Extensiones de drf-spectacular para la autenticación del proyecto.
+
+La extensión de simplejwt que trae drf-spectacular solo reconoce
+JWTAuthentication exactamente; sin esta, el esquema no declara `jwtAuth` y el
+botón Authorize de Swagger UI no envía el token.
+"""
+
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+
+
+class CachedJWTScheme(SimpleJWTScheme):
+    """
+    Esquema bearer `jwtAuth` para CachedJWTAuthentication y sus subclases (StatelessJWTAuthentication).
+    """
+
+    target_class = "users.authentication.CachedJWTAuthentication"
+    match_subclasses = True
@@ -3,8 +3,13 @@ from django.contrib.auth.password_validation import validate_password
 
 from rest_framework import serializers
 
+from config.timing import TimedSerializerMixin
+from tasks.models import TaskCounters
 
-class UserRegistrationSerializer(serializers.ModelSerializer):
+from . import hashing
+
+
+class UserRegistrationSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """
     Serializer para registro de nuevos usuarios.
     """
@@ -55,18 +60,20 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         """
         validated_data.pop("password2")
 
-        user = User.objects.create_user(
-            username=validated_data["username"],
-            email=validated_data["email"],
+        # Lo mismo que create_user, con el hash calculado en el pool de users.hashing.
+        user = User(
+            username=User.normalize_username(validated_data["username"]),
+            email=User.objects.normalize_email(validated_data["email"]),
             first_name=validated_data["first_name"],
             last_name=validated_data["last_name"],
-            password=validated_data["password"],
+            password=hashing.make_password(validated_data["password"]),
         )
+        user.save()
 
         return user
 
 
-class UserProfileSerializer(serializers.ModelSerializer):
+class UserProfileSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """
     Serializer para ver y actualizar el perfil del usuario.
     """
@@ -88,14 +95,16 @@ class UserProfileSerializer(serializers.ModelSerializer):
 
     def get_tasks_count(self, obj):
         """
-        Retorna el número de tareas del usuario.
+        Retorna el número de tareas del usuario desde TaskCounters (una fila por
+        usuario, mantenida al crear y eliminar tareas) en lugar de contarlas.
+        Una lectura no crea la fila: sin ella se cuentan las tareas.
         """
-        return obj.tasks.count()
+        return TaskCounters.objects.total_for(obj.pk)
 
 
 class ChangePasswordSerializer(serializers.Serializer):
     """
-    Serializer para cambiar la contraseña.
+    Serializer para cambiar la contraseña de `instance`, el usuario leído de la base de datos.
     """
 
     old_password = serializers.CharField(required=True, write_only=True)
@@ -114,8 +123,7 @@ class ChangePasswordSerializer(serializers.Serializer):
         """
         Valida que la contraseña actual sea correcta.
         """
-        user = self.context["request"].user
-        if not user.check_password(value):
+        if not hashing.check_password(self.instance, value):
             raise serializers.ValidationError("La contraseña actual es incorrecta.")
         return value
 
@@ -123,7 +131,7 @@ class ChangePasswordSerializer(serializers.Serializer):
         """
         Guarda la nueva contraseña.
         """
-        user = self.context["request"].user
-        user.set_password(self.validated_data["new_password"])
-        user.save()
+        user = self.instance
+        hashing.set_password(user, self.validated_data["new_password"])
+        user.save(update_fields=["password"])
         return user
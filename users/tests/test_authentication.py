@@ -0,0 +1,153 @@
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+import pytest
+from rest_framework import status
+
+from config.cache import bump_generation
+from users.authentication import user_cache
+from users.checks import check_user_cache
+
+ME = "/api/users/me/"
+
+
+def _user_queries(client, url=ME, method="get", **kwargs):
+    with CaptureQueriesContext(connection) as context:
+        response = getattr(client, method)(url, **kwargs)
+    return response, [q for q in context.captured_queries if 'FROM "auth_user" WHERE' in q["sql"]]
+
+
+@pytest.mark.django_db
+class TestCachedJWTAuthentication:
+    """Tests para la caché de usuarios de CachedJWTAuthentication."""
+
+    def test_second_request_skips_user_query(self, authenticated_client, user):
+        """Test que la segunda petición no consulta auth_user."""
+        first, first_queries = _user_queries(authenticated_client)
+        second, second_queries = _user_queries(authenticated_client)
+
+        assert first.status_code == second.status_code == status.HTTP_200_OK
+        assert len(first_queries) == 1
+        assert second_queries == []
+        assert second.data["username"] == user.username
+        assert user_cache.stats()["hits"] == 1
+
+    def test_profile_update_invalidates(self, authenticated_client, user):
+        """Test que editar el perfil invalida el usuario en caché."""
+        authenticated_client.get(ME)
+
+        authenticated_client.patch("/api/users/profile/", {"first_name": "Nuevo"}, format="json")
+
+        assert authenticated_client.get(ME).data["first_name"] == "Nuevo"
+        assert user_cache.stats()["invalidations"] >= 1
+
+    def test_change_password_invalidates(self, authenticated_client, user):
+        """Test que cambiar la contraseña invalida el usuario en caché."""
+        authenticated_client.get(ME)
+        data = {"old_password": "testpass123", "new_password": "NuevaClave123!", "new_password2": "NuevaClave123!"}
+
+        response = authenticated_client.put("/api/users/change-password/", data, format="json")
+        _, queries = _user_queries(authenticated_client)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(queries) == 1
+
+    def test_deactivation_rejects_cached_user(self, authenticated_client, user):
+        """Test que desactivar al usuario lo rechaza aunque estuviera en caché."""
+        authenticated_client.get(ME)
+
+        user.is_active = False
+        user.save()
+
+        assert authenticated_client.get(ME).status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_deleted_user_rejected(self, authenticated_client, user):
+        """Test que un usuario eliminado deja de autenticarse."""
+        authenticated_client.get(ME)
+
+        user.delete()
+
+        assert authenticated_client.get(ME).status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_other_process_invalidation(self, authenticated_client, user):
+        """Test que una versión incrementada por otro proceso invalida la copia local."""
+        authenticated_client.get(ME)
+        User.objects.filter(pk=user.pk).update(first_name="Remoto")
+
+        # Otro worker solo alcanza a incrementar la versión en la caché compartida.
+        bump_generation(user_cache.shared, user_cache.version_key(user.pk))
+
+        assert authenticated_client.get(ME).data["first_name"] == "Remoto"
+        assert user_cache.stats()["stale"] == 1
+
+    def test_request_user_is_a_copy(self, authenticated_client, user):
+        """Test que cada petición recibe una copia del usuario en caché."""
+        authenticated_client.get(ME)
+        cached, _ = user_cache.get(user.pk)
+
+        cached.first_name = "Mutado"
+
+        assert authenticated_client.get(ME).data["first_name"] == "Mutado"
+        user_cache.clear()
+        assert authenticated_client.get(ME).data["first_name"] == "Test"
+
+    def test_profile_update_ignores_stale_copy(self, authenticated_client, user):
+        """Test que editar el perfil no reescribe columnas de la copia en caché."""
+        authenticated_client.get(ME)
+        # Otro worker cambió la contraseña; esta caché todavía guarda la fila anterior.
+        User.objects.filter(pk=user.pk).update(password=make_password("OtraClave123!"))
+
+        response = authenticated_client.patch("/api/users/profile/", {"first_name": "Nuevo"}, format="json")
+
+        user.refresh_from_db()
+        assert response.status_code == status.HTTP_200_OK
+        assert user.first_name == "Nuevo"
+        assert user.check_password("OtraClave123!")
+
+    def test_change_password_checks_database_hash(self, authenticated_client, user):
+        """Test que la contraseña actual se verifica contra la base de datos y no contra la caché."""
+        authenticated_client.get(ME)
+        User.objects.filter(pk=user.pk).update(password=make_password("OtraClave123!"))
+        data = {"old_password": "testpass123", "new_password": "NuevaClave123!", "new_password2": "NuevaClave123!"}
+
+        response = authenticated_client.put("/api/users/change-password/", data, format="json")
+
+        user.refresh_from_db()
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert user.check_password("OtraClave123!")
+
+    def test_per_process_cache_check(self, settings, tmp_path):
+        """Test que el check avisa si la caché compartida es por proceso."""
+        settings.DEBUG = False
+        assert isinstance(user_cache.shared, LocMemCache)
+        assert [warning.id for warning in check_user_cache(None)] == ["users.W001"]
+
+        settings.CACHES = {
+            **settings.CACHES,
+            "shared": {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": str(tmp_path)},
+        }
+        settings.USER_CACHE = {**settings.USER_CACHE, "SHARED_CACHE": "shared"}
+        assert check_user_cache(None) == []
+
+    def test_disabled(self, authenticated_client, user, settings):
+        """Test que con ENABLED=False se consulta auth_user en cada petición."""
+        settings.USER_CACHE = {**settings.USER_CACHE, "ENABLED": False}
+        authenticated_client.get(ME)
+
+        _, queries = _user_queries(authenticated_client)
+
+        assert len(queries) == 1
+
+    def test_stats_endpoint_admin_only(self, authenticated_client, api_client, user):
+        """Test que las métricas solo las ve un administrador."""
+        assert authenticated_client.get("/api/users/auth-cache/").status_code == status.HTTP_403_FORBIDDEN
+
+        admin = User.objects.create_superuser("admin", "admin@example.com", "adminpass123")
+        api_client.force_authenticate(user=admin)
+        response = api_client.get("/api/users/auth-cache/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert {"hits", "misses", "stale", "invalidations", "hit_ratio"} <= set(response.data)
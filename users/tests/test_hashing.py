@@ -0,0 +1,123 @@
+import threading
+
+from django.contrib.auth.models import User
+from django.http import HttpRequest
+
+import pytest
+from rest_framework import status
+
+from users.backends import HashingPoolModelBackend
+from users.hashing import password_hasher
+
+
+@pytest.fixture(autouse=True)
+def hashing_pool(settings):
+    settings.PASSWORD_HASHING = {**settings.PASSWORD_HASHING, "MAX_WORKERS": 1, "QUEUE_SIZE": 0, "RETRY_AFTER": 3}
+    password_hasher.clear()
+    yield password_hasher
+    password_hasher.clear()
+
+
+@pytest.fixture
+def saturated(hashing_pool):
+    """Ocupa el único hilo del pool hasta el final del test."""
+    started, release = threading.Event(), threading.Event()
+
+    def block():
+        started.set()
+        release.wait(5)
+
+    thread = threading.Thread(target=hashing_pool.run, args=(block,))
+    thread.start()
+    started.wait(5)
+    yield
+    release.set()
+    thread.join()
+
+
+@pytest.mark.django_db
+class TestPasswordHashingPool:
+    """Tests para el pool acotado de hash de contraseñas."""
+
+    def test_login_uses_pool(self, api_client, user, hashing_pool):
+        """Test que el login verifica la contraseña en el pool."""
+        response = api_client.post("/api/token/", {"username": "testuser", "password": "testpass123"}, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert hashing_pool.stats()["completed"] == 1
+
+    def test_wrong_password_rejected(self, api_client, user):
+        """Test que una contraseña incorrecta se sigue rechazando."""
+        response = api_client.post("/api/token/", {"username": "testuser", "password": "incorrecta"}, format="json")
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_unknown_user_still_hashes(self, api_client, hashing_pool):
+        """Test que un usuario inexistente también calcula un hash."""
+        response = api_client.post("/api/token/", {"username": "nadie", "password": "testpass123"}, format="json")
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert hashing_pool.stats()["completed"] == 1
+
+    def test_register_and_change_password(self, api_client):
+        """Test que el registro y el cambio de contraseña guardan hashes válidos."""
+        data = {
+            "username": "nuevo",
+            "email": "Nuevo@EXAMPLE.com",
+            "password": "ClaveSegura123!",
+            "password2": "ClaveSegura123!",
+            "first_name": "Nuevo",
+            "last_name": "Usuario",
+        }
+        assert api_client.post("/api/users/register/", data, format="json").status_code == status.HTTP_201_CREATED
+        user = User.objects.get(username="nuevo")
+        assert user.email == "Nuevo@example.com"
+        assert user.check_password("ClaveSegura123!")
+
+        api_client.force_authenticate(user)
+        change = {"old_password": "ClaveSegura123!", "new_password": "OtraClave456!", "new_password2": "OtraClave456!"}
+        response = api_client.put("/api/users/change-password/", change, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        user.refresh_from_db()
+        assert user.check_password("OtraClave456!")
+
+    @pytest.mark.usefixtures("saturated")
+    def test_saturated_pool_fails_fast(self, api_client, user, hashing_pool):
+        """Test que con el pool lleno el login responde 503 con Retry-After."""
+        response = api_client.post("/api/token/", {"username": "testuser", "password": "testpass123"}, format="json")
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response["Retry-After"] == "3"
+        assert hashing_pool.stats()["rejected"] == 1
+        assert hashing_pool.stats()["active"] == 1
+
+    @pytest.mark.usefixtures("saturated")
+    def test_saturated_pool_rejects_non_drf_login(self, user, hashing_pool):
+        """Test que con el pool lleno un login fuera de DRF (el admin) se rechaza sin error 500."""
+        backend = HashingPoolModelBackend()
+
+        assert backend.authenticate(HttpRequest(), username="testuser", password="testpass123") is None
+        assert hashing_pool.stats()["rejected"] == 1
+
+    @pytest.mark.usefixtures("saturated")
+    def test_saturated_pool_keeps_tasks_available(self, authenticated_client):
+        """Test que el resto de endpoints responde con el pool lleno."""
+        assert authenticated_client.get("/api/tasks/").status_code == status.HTTP_200_OK
+
+    def test_disabled_runs_inline(self, settings, hashing_pool):
+        """Test que con el pool desactivado se ejecuta en el hilo actual."""
+        settings.PASSWORD_HASHING = {**settings.PASSWORD_HASHING, "ENABLED": False}
+
+        assert hashing_pool.run(threading.current_thread) is threading.current_thread()
+
+    def test_stats_admin_only(self, authenticated_client, user):
+        """Test que las métricas solo las ven los administradores."""
+        assert authenticated_client.get("/api/users/password-hashing/").status_code == status.HTTP_403_FORBIDDEN
+
+        user.is_staff = True
+        user.save()
+
+        response = authenticated_client.get("/api/users/password-hashing/")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["max_workers"] == 1
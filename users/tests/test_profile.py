@@ -0,0 +1,103 @@
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+import pytest
+
+from tasks.models import Task, TaskCounters
+from users.authentication import user_cache
+
+ME = "/api/users/me/"
+PROFILE = "/api/users/profile/"
+
+
+def cold_cache():
+    """Obliga a leer el usuario del token de la base de datos en la siguiente petición."""
+    cache.clear()
+    user_cache.clear()
+
+
+@pytest.mark.django_db
+class TestProfileTasksCount:
+    """Tests para el tasks_count desnormalizado del perfil."""
+
+    def test_reads_counter_row(self, authenticated_client, user, task):
+        """Test que tasks_count se lee de TaskCounters sin contar las tareas."""
+        authenticated_client.get(ME)
+
+        with CaptureQueriesContext(connection) as context:
+            response = authenticated_client.get(ME)
+
+        assert response.data["tasks_count"] == 1
+        assert [q["sql"] for q in context.captured_queries if 'FROM "tasks_task"' in q["sql"]] == []
+        assert len(context.captured_queries) == 1
+
+    def test_read_does_not_create_row(self, authenticated_client, user):
+        """Test que sin fila de contadores tasks_count cuenta las tareas sin escribir."""
+        Task.objects.bulk_create([Task(title="A", user=user), Task(title="B", user=user)])
+
+        assert authenticated_client.get(ME).data["tasks_count"] == 2
+        assert not TaskCounters.objects.filter(user=user).exists()
+
+    def test_follows_create_and_delete(self, authenticated_client, user, task):
+        """Test que crear y eliminar tareas actualiza tasks_count."""
+        authenticated_client.post("/api/tasks/", {"title": "Otra"}, format="json")
+        assert authenticated_client.get(ME).data["tasks_count"] == 2
+
+        authenticated_client.delete(f"/api/tasks/{task.pk}/")
+        assert authenticated_client.get("/api/users/profile/").data["tasks_count"] == 1
+
+    def test_user_deletion_removes_row(self, user, task):
+        """Test que eliminar el usuario elimina su fila de contadores."""
+        user.delete()
+
+        assert not TaskCounters.objects.exists()
+
+    def test_repair_command(self, authenticated_client, user, task):
+        """Test que rebuild_task_counters corrige un tasks_count desfasado."""
+        Task.objects.filter(pk=task.pk).delete()
+        assert authenticated_client.get(ME).data["tasks_count"] == 1
+
+        call_command("rebuild_task_counters", "--user", str(user.pk), stdout=StringIO())
+
+        assert authenticated_client.get(ME).data["tasks_count"] == 0
+
+
+@pytest.mark.django_db
+class TestUserQueryBudgets:
+    """Tests para los presupuestos de consultas de los endpoints de usuarios en el peor caso."""
+
+    def test_cold_requests_within_budget(self, authenticated_client, user):
+        """Test que sin caché de usuarios ni filas de contadores o de TokenGeneration se respetan los presupuestos."""
+        for method, path, data in [
+            ("get", ME, None),
+            ("get", PROFILE, None),
+            ("patch", PROFILE, {"first_name": "Nuevo"}),
+            ("put", PROFILE, {"first_name": "Otro", "last_name": "Apellido", "email": "otro@example.com"}),
+        ]:
+            cold_cache()
+            assert getattr(authenticated_client, method)(path, data, format="json").status_code == 200
+
+        cold_cache()
+        password = {"old_password": "testpass123", "new_password": "NuevaClave123!", "new_password2": "NuevaClave123!"}
+        assert authenticated_client.put("/api/users/change-password/", password, format="json").status_code == 200
+
+    def test_register_ignores_token(self, authenticated_client):
+        """Test que el registro no autentica el token que envíe el cliente."""
+        data = {
+            "username": "nuevo",
+            "email": "nuevo@example.com",
+            "password": "NuevaClave123!",
+            "password2": "NuevaClave123!",
+            "first_name": "Nuevo",
+            "last_name": "Usuario",
+        }
+
+        with CaptureQueriesContext(connection) as context:
+            response = authenticated_client.post("/api/users/register/", data, format="json")
+
+        assert response.status_code == 201
+        assert len(context.captured_queries) == 3
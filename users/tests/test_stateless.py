@@ -0,0 +1,163 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+import pytest
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from tasks.models import Task
+from users.checks import check_token_generation_cache
+from users.models import ClaimsUser, ReadOnlyUserError, TokenGeneration
+
+TASKS = "/api/tasks/"
+
+
+@pytest.fixture
+def stateless(settings):
+    settings.JWT_STATELESS = True
+
+
+def _login(api_client, username="testuser", password="testpass123"):
+    response = api_client.post("/api/token/", {"username": username, "password": password}, format="json")
+    assert response.status_code == status.HTTP_200_OK
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+    return response.data
+
+
+def _user_queries(client, url, method="get", **kwargs):
+    with CaptureQueriesContext(connection) as context:
+        response = getattr(client, method)(url, **kwargs)
+    return response, [q for q in context.captured_queries if 'FROM "auth_user"' in q["sql"]]
+
+
+@pytest.mark.django_db
+class TestClaimsTokens:
+    """Tests para los claims de los tokens emitidos."""
+
+    def test_token_includes_user_claims(self, api_client, user):
+        """Test que el token de acceso lleva los datos del usuario y su generación."""
+        token = AccessToken(_login(api_client)["access"])
+
+        assert token["user_id"] == user.pk
+        assert token["username"] == user.username
+        assert token["is_active"] is True
+        assert token["gen"] == 0
+
+    def test_refresh_rejected_after_password_change(self, api_client, user):
+        """Test que cambiar la contraseña revoca los refresh tokens emitidos antes."""
+        tokens = _login(api_client)
+
+        user.set_password("NuevaClave123!")
+        user.save()
+        response = api_client.post("/api/token/refresh/", {"refresh": tokens["refresh"]}, format="json")
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_refresh_issues_current_claims(self, api_client, user):
+        """Test que el token refrescado lleva los claims actuales del usuario."""
+        tokens = _login(api_client)
+        user.first_name = "Nuevo"
+        user.save()
+
+        response = api_client.post("/api/token/refresh/", {"refresh": tokens["refresh"]}, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert AccessToken(response.data["access"])["first_name"] == "Nuevo"
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("stateless")
+class TestStatelessJWTAuthentication:
+    """Tests para StatelessJWTAuthentication en /api/tasks/."""
+
+    def test_requests_skip_user_query(self, api_client, user, task):
+        """Test que las peticiones no consultan auth_user."""
+        _login(api_client)
+
+        listed, list_queries = _user_queries(api_client, TASKS)
+        created, create_queries = _user_queries(
+            api_client, TASKS, method="post", data={"title": "Nueva", "priority": "high"}, format="json"
+        )
+
+        assert listed.status_code == status.HTTP_200_OK
+        assert created.status_code == status.HTTP_201_CREATED
+        assert list_queries == create_queries == []
+        assert Task.objects.get(pk=created.data["id"]).user == user
+
+    def test_only_own_tasks(self, api_client, user, other_user, task):
+        """Test que el usuario de los claims solo ve sus tareas."""
+        Task.objects.create(title="Ajena", user=other_user)
+        _login(api_client)
+
+        response = api_client.get(TASKS)
+
+        assert [item["id"] for item in response.data["results"]] == [task.pk]
+
+    def test_password_change_revokes_token(self, api_client, user):
+        """Test que cambiar la contraseña revoca el token de acceso."""
+        _login(api_client)
+
+        user.set_password("NuevaClave123!")
+        user.save()
+
+        response = api_client.get(TASKS)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert TokenGeneration.objects.current(user.pk) == 1
+
+    def test_deactivation_revokes_token(self, api_client, user):
+        """Test que desactivar la cuenta revoca el token de acceso."""
+        _login(api_client)
+
+        user.is_active = False
+        user.save()
+
+        assert api_client.get(TASKS).status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_profile_update_keeps_token(self, api_client, user):
+        """Test que editar el perfil no revoca el token."""
+        _login(api_client)
+
+        user.first_name = "Nuevo"
+        user.save()
+
+        assert api_client.get(TASKS).status_code == status.HTTP_200_OK
+
+    def test_token_without_claims_falls_back(self, authenticated_client):
+        """Test que los tokens sin claims se resuelven consultando el usuario."""
+        response, queries = _user_queries(authenticated_client, TASKS)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(queries) == 1
+
+    def test_claims_user_is_read_only(self, user):
+        """Test que el usuario de los claims no se puede guardar ni borrar."""
+        token = RefreshToken.for_user(user).access_token
+        token["gen"] = 0
+        claims_user = ClaimsUser.from_token(token, "user_id")
+
+        assert claims_user.pk == user.pk
+        with pytest.raises(ReadOnlyUserError):
+            claims_user.save()
+        with pytest.raises(ReadOnlyUserError):
+            claims_user.delete()
+
+    def test_generation_cache_expires(self, user, settings):
+        """Test que la generación cacheada caduca con USER_CACHE["TIMEOUT"]."""
+        settings.USER_CACHE = {**settings.USER_CACHE, "TIMEOUT": 60}
+        TokenGeneration.objects.current(user.pk)
+        key = TokenGeneration.objects.cache_key(user.pk)
+
+        assert TokenGeneration.objects.cache.get(key) == 0
+        assert TokenGeneration.objects.cache._expire_info[TokenGeneration.objects.cache.make_key(key)] is not None
+
+    def test_per_process_generation_cache_check(self, stateless, settings, tmp_path):
+        """Test que el check falla si la generación se guarda en la memoria del proceso."""
+        settings.DEBUG = True
+        assert [error.id for error in check_token_generation_cache(None)] == ["users.E001"]
+
+        settings.CACHES = {
+            **settings.CACHES,
+            "shared": {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": str(tmp_path)},
+        }
+        settings.USER_CACHE = {**settings.USER_CACHE, "SHARED_CACHE": "shared"}
+        assert check_token_generation_cache(None) == []
@@ -0,0 +1,54 @@
+"""
+Tokens con los claims que necesita la API para autorizar sin consultar auth_user
+(ver StatelessJWTAuthentication).
+"""
+
+from django.contrib.auth.models import User
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .models import TokenGeneration
+
+GENERATION_CLAIM = "gen"
+USER_CLAIMS = ("username", "email", "first_name", "last_name", "is_active")
+
+
+def add_user_claims(token, user):
+    for name in USER_CLAIMS:
+        token[name] = getattr(user, name)
+    token[GENERATION_CLAIM] = TokenGeneration.objects.current(user.pk)
+    return token
+
+
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """
+    POST /api/token/ con los datos del usuario y su generación en los claims.
+    """
+
+    @classmethod
+    def get_token(cls, user):
+        return add_user_claims(super().get_token(user), user)
+
+
+class ClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    POST /api/token/refresh/ que rechaza refresh tokens revocados y emite el
+    token de acceso con los claims actuales del usuario.
+    """
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs["refresh"])
+        user = User.objects.filter(**{api_settings.USER_ID_FIELD: refresh[api_settings.USER_ID_CLAIM]}).first()
+        if user is None or not user.is_active:
+            raise InvalidToken(_("User not found"))
+        generation = refresh.get(GENERATION_CLAIM)
+        if generation is not None and generation != TokenGeneration.objects.current(user.pk):
+            raise InvalidToken("El token fue revocado.")
+
+        data = super().validate(attrs)
+        data["access"] = str(add_user_claims(AccessToken(data["access"]), user))
+        return data
@@ -1,10 +1,19 @@
 from django.urls import path
 
-from .views import ChangePasswordView, UserProfileView, UserRegistrationView, current_user
+from .views import (
+    ChangePasswordView,
+    UserProfileView,
+    UserRegistrationView,
+    auth_cache_stats,
+    current_user,
+    password_hashing_stats,
+)
 
 urlpatterns = [
     path("register/", UserRegistrationView.as_view(), name="user-register"),
     path("profile/", UserProfileView.as_view(), name="user-profile"),
     path("change-password/", ChangePasswordView.as_view(), name="change-password"),
     path("me/", current_user, name="current-user"),
+    path("auth-cache/", auth_cache_stats, name="auth-cache-stats"),
+    path("password-hashing/", password_hashing_stats, name="password-hashing-stats"),
 ]
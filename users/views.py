@@ -1,10 +1,16 @@
 from django.contrib.auth.models import User
 
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema
 from rest_framework import generics, status
 from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 
+from config.timing import query_budget
+
+from .authentication import user_cache
+from .hashing import password_hasher
 from .serializers import ChangePasswordSerializer, UserProfileSerializer, UserRegistrationSerializer
 
 
@@ -15,8 +21,12 @@ class UserRegistrationView(generics.CreateAPIView):
     """
 
     queryset = User.objects.all()
+    # Sin autenticación: un token enviado por el cliente no debe costar una consulta.
+    authentication_classes = []
     permission_classes = [AllowAny]
     serializer_class = UserRegistrationSerializer
+    # Unicidad de username y email, e INSERT.
+    query_budget = 3
 
 
 class UserProfileView(generics.RetrieveUpdateAPIView):
@@ -27,12 +37,17 @@ class UserProfileView(generics.RetrieveUpdateAPIView):
 
     permission_classes = [IsAuthenticated]
     serializer_class = UserProfileSerializer
+    # Usuario del token (si no está en caché), get_object, UPDATE al escribir y
+    # tasks_count (la fila de TaskCounters o, si aún no existe, un COUNT).
+    query_budget = {"get": 4, "put": 5, "patch": 5}
 
     def get_object(self):
         """
-        Retorna el usuario autenticado.
+        Retorna el usuario autenticado, leído de la base de datos: request.user
+        puede ser la copia de la caché de usuarios (o de los claims del token)
+        y guardarla escribiría valores obsoletos.
         """
-        return self.request.user
+        return User.objects.get(pk=self.request.user.pk)
 
 
 class ChangePasswordView(generics.UpdateAPIView):
@@ -43,18 +58,21 @@ class ChangePasswordView(generics.UpdateAPIView):
 
     permission_classes = [IsAuthenticated]
     serializer_class = ChangePasswordSerializer
+    # Usuario del token, get_object, UPDATE de la contraseña y TokenGeneration.bump
+    # (UPDATE, INSERT la primera vez y SELECT, dentro de un SAVEPOINT).
+    query_budget = 8
 
     def get_object(self):
         """
-        Retorna el usuario autenticado.
+        Retorna el usuario autenticado, leído de la base de datos (ver UserProfileView).
         """
-        return self.request.user
+        return User.objects.get(pk=self.request.user.pk)
 
     def update(self, request, *args, **kwargs):
         """
         Actualiza la contraseña.
         """
-        serializer = self.get_serializer(data=request.data)
+        serializer = self.get_serializer(self.get_object(), data=request.data)
         serializer.is_valid(raise_exception=True)
         serializer.save()
 
@@ -64,6 +82,9 @@ class ChangePasswordView(generics.UpdateAPIView):
         )
 
 
+# Usuario del token y tasks_count (ver UserProfileView).
+@query_budget(3)
+@extend_schema(responses=UserProfileSerializer)
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def current_user(request):
@@ -73,3 +94,27 @@ def current_user(request):
     """
     serializer = UserProfileSerializer(request.user)
     return Response(serializer.data)
+
+
+@query_budget(1)
+@extend_schema(responses=OpenApiTypes.OBJECT)
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def auth_cache_stats(request):
+    """
+    GET /api/users/auth-cache/
+    Métricas de la caché de usuarios autenticados del proceso que atiende la petición.
+    """
+    return Response(user_cache.stats())
+
+
+@query_budget(1)
+@extend_schema(responses=OpenApiTypes.OBJECT)
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def password_hashing_stats(request):
+    """
+    GET /api/users/password-hashing/
+    Métricas del pool de hash de contraseñas del proceso que atiende la petición.
+    """
+    return Response(password_hasher.stats())